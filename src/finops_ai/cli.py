@@ -64,7 +64,8 @@ def cli(ctx: click.Context, config: Optional[str], dry_run: bool, log_level: str
 
     # Setup logging
     from finops_ai.utils.logger import setup_logging
-    setup_logging(level=log_level, log_file=log_file)
+    setup_logging(level=log_level, log_file=log_file,
+                  verbose_tracebacks=log_level == "DEBUG")
 
     # Load config
     from finops_ai.config import FinOpsConfig
@@ -94,9 +95,12 @@ def cli(ctx: click.Context, config: Optional[str], dry_run: bool, log_level: str
 @click.option("--output", "-o", type=click.Choice(["table", "json", "csv"]), default="table",
               help="Output format")
 @click.option("--report", type=click.Path(), help="Save report to file")
+@click.option("--workers", type=click.IntRange(min=1),
+              help="Max concurrent GCP Storage bucket probes (default: 32)")
 @click.pass_context
 def scan(ctx: click.Context, provider: str, resource_type: tuple, subscription: Optional[str],
-         region: tuple, project: Optional[str], output: str, report: Optional[str]) -> None:
+         region: tuple, project: Optional[str], output: str, report: Optional[str],
+         workers: Optional[int]) -> None:
     """Scan cloud resources for waste and optimization opportunities."""
     show_banner()
     config = ctx.obj["config"]
@@ -210,16 +214,17 @@ def scan(ctx: click.Context, provider: str, resource_type: tuple, subscription:
                 from finops_ai.providers.gcp.network_manager import GCPNetworkManager
                 from finops_ai.providers.gcp.storage_manager import GCPStorageManager
 
+                storage_kwargs = {"worker_count": workers} if workers else {}
                 managers = [
-                    ("Compute", GCPComputeManager),
-                    ("Network", GCPNetworkManager),
-                    ("Storage", GCPStorageManager),
+                    ("Compute", GCPComputeManager, {}),
+                    ("Network", GCPNetworkManager, {}),
+                    ("Storage", GCPStorageManager, storage_kwargs),
                 ]
 
-                for name, mgr_class in managers:
+                for name, mgr_class, mgr_kwargs in managers:
                     try:
                         with console.status(f"  Scanning {name}..."):
-                            manager = mgr_class(project_id, credentials)
+                            manager = mgr_class(project_id, credentials, **mgr_kwargs)
                             result = manager.scan()
                             scan_results.append(result)
                             console.print(f"  ✅ {name}: [bold]{len(result.resources)}[/bold] found "
@@ -7,8 +7,10 @@ BaseResourceManager and implements the scan/delete/estimate_cost contract.
 
 from __future__ import annotations
 
+import asyncio
 import datetime
 from abc import ABC, abstractmethod
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, List, Optional
@@ -35,6 +37,13 @@ class Severity(str, Enum):
     INFO = "info"             # No direct cost
 
 
+# Monthly cost band edges; a cost at an edge falls in the band above it
+_SEVERITY_THRESHOLDS = (10.0, 50.0, 100.0)
+
+# Severity for each band between the thresholds above, lowest first
+_SEVERITY_BANDS = (Severity.LOW, Severity.MEDIUM, Severity.HIGH, Severity.CRITICAL)
+
+
 class CloudProvider(str, Enum):
     """Supported cloud providers."""
 
@@ -68,7 +77,7 @@ class OrphanedResource:
     last_used_time: str = ""
 
     # Metadata
-    tags: Dict[str, str] = field(default_factory=dict)
+    tags: Dict[str, str] = field(default_factory=dict)  # Read-only; may alias SDK data
     metadata: Dict[str, Any] = field(default_factory=dict)
     severity: Severity = Severity.LOW
 
@@ -78,16 +87,11 @@ class OrphanedResource:
 
     def __post_init__(self) -> None:
         """Auto-compute severity from estimated monthly cost."""
-        if self.estimated_monthly_cost >= 100:
-            self.severity = Severity.CRITICAL
-        elif self.estimated_monthly_cost >= 50:
-            self.severity = Severity.HIGH
-        elif self.estimated_monthly_cost >= 10:
-            self.severity = Severity.MEDIUM
-        elif self.estimated_monthly_cost > 0:
-            self.severity = Severity.LOW
-        else:
+        cost = self.estimated_monthly_cost
+        if not cost > 0:  # Also catches NaN
             self.severity = Severity.INFO
+        else:
+            self.severity = _SEVERITY_BANDS[bisect_right(_SEVERITY_THRESHOLDS, cost)]
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -210,6 +214,18 @@ class BaseResourceManager(ABC):
         """
         ...
 
+    async def scan_async(self) -> ScanResult:
+        """
+        Run scan() without blocking the event loop.
+
+        Lets async callers overlap several managers with asyncio.gather();
+        each scan still uses the provider's synchronous SDK clients.
+
+        Returns:
+            ScanResult containing all found resources and any errors.
+        """
+        return await asyncio.to_thread(self.scan)
+
     @abstractmethod
     def delete(self, resource_id: str, dry_run: bool = True) -> DeleteResult:
         """
@@ -248,11 +264,24 @@ class BaseResourceManager(ABC):
         Returns:
             List of DeleteResult objects.
         """
-        results = []
-        for resource in resources:
-            result = self.delete(resource.resource_id, dry_run=dry_run)
-            results.append(result)
-        return results
+        return self.delete_many([r.resource_id for r in resources], dry_run=dry_run)
+
+    def delete_many(self, resource_ids: List[str], dry_run: bool = True) -> List[DeleteResult]:
+        """
+        Delete several resources by ID.
+
+        Deletes one at a time by default; managers whose deletes are
+        long-running operations override this to start them all before
+        waiting on any.
+
+        Args:
+            resource_ids: Full cloud resource IDs.
+            dry_run: If True, simulate deletions.
+
+        Returns:
+            One DeleteResult per ID, in the same order.
+        """
+        return [self.delete(resource_id, dry_run=dry_run) for resource_id in resource_ids]
 
     def get_scan_result(self, resources: List[OrphanedResource], errors: Optional[List[str]] = None) -> ScanResult:
         """Helper to create a ScanResult from discovered resources."""
@@ -8,6 +8,7 @@ enabling safe deletion checks — ensuring removing Resource A won't break Resou
 from __future__ import annotations
 
 import logging
+import sys
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Set
 
@@ -26,6 +27,14 @@ class ResourceNode:
     provider: str
     metadata: Dict[str, Any]
 
+    def __post_init__(self) -> None:
+        """Intern the low-cardinality fields so every node shares one string per value."""
+        # sys.intern only accepts exact str; enum members are already singletons
+        if type(self.resource_type) is str:
+            self.resource_type = sys.intern(self.resource_type)
+        if type(self.provider) is str:
+            self.provider = sys.intern(self.provider)
+
 
 class ResourceGraph:
     """
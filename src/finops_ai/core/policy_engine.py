@@ -11,8 +11,9 @@ import fnmatch
 import logging
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import IO, Any, Callable, Dict, List, Optional, Tuple, Union
 
 import yaml
 
@@ -20,6 +21,15 @@ from finops_ai.core.base_manager import OrphanedResource
 
 logger = logging.getLogger("finops-ai.policy")
 
+# Distinct condition strings kept compiled; policies rarely number in the hundreds
+_COMPILED_CONDITIONS = 1024
+
+# Comparison operators, longest first so ">=" is not read as ">"
+_OPERATORS = (">=", "<=", "!=", "==", ">", "<")
+
+# libyaml's C loader when PyYAML was built with it; same documents, parsed natively
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass
 class Policy:
@@ -71,6 +81,11 @@ class PolicyEvalResult:
         return [m for m in self.matches if not m.approval_required]
 
 
+def _never_matches(resource: OrphanedResource) -> bool:
+    """Predicate for conditions with a clause that has no operator."""
+    return False
+
+
 class ConditionEvaluator:
     """
     Evaluates policy condition strings against resource attributes.
@@ -94,30 +109,51 @@ class ConditionEvaluator:
         Returns:
             True if the condition matches.
         """
-        # Split on AND/OR
-        parts = re.split(r'\s+AND\s+', condition, flags=re.IGNORECASE)
+        return ConditionEvaluator.compile(condition)(resource)
 
-        for part in parts:
-            part = part.strip()
-            if not ConditionEvaluator._evaluate_single(part, resource):
-                return False
+    @staticmethod
+    @lru_cache(maxsize=_COMPILED_CONDITIONS)
+    def compile(condition: str) -> Callable[[OrphanedResource], bool]:
+        """
+        Parse a condition string once into a reusable predicate.
+
+        Each policy condition is checked against every scanned resource, so
+        splitting, operator lookup and literal parsing are done here once
+        per distinct string rather than once per resource.
+
+        Args:
+            condition: The condition expression.
+
+        Returns:
+            A callable taking a resource and returning True if it matches.
+        """
+        comparisons: List[Tuple[str, str, Any]] = []
+        # Split on AND/OR
+        for part in re.split(r'\s+AND\s+', condition, flags=re.IGNORECASE):
+            comparison = ConditionEvaluator._parse_single(part.strip())
+            if comparison is None:
+                return _never_matches
+            comparisons.append(comparison)
+
+        resolve = ConditionEvaluator._resolve_value
+        compare = ConditionEvaluator._compare
+
+        def _matches(resource: OrphanedResource) -> bool:
+            for left, op, right in comparisons:
+                if not compare(resolve(left, resource), op, right):
+                    return False
+            return True
 
-        return True
+        return _matches
 
     @staticmethod
-    def _evaluate_single(expr: str, resource: OrphanedResource) -> bool:
-        """Evaluate a single comparison expression."""
-        # Parse operator
-        for op in [">=", "<=", "!=", "==", ">", "<"]:
+    def _parse_single(expr: str) -> Optional[Tuple[str, str, Any]]:
+        """Split a single comparison into (field path, operator, literal), or None."""
+        for op in _OPERATORS:
             if op in expr:
                 left, right = expr.split(op, 1)
-                left = left.strip()
-                right = right.strip()
-                left_val = ConditionEvaluator._resolve_value(left, resource)
-                right_val = ConditionEvaluator._parse_literal(right)
-                return ConditionEvaluator._compare(left_val, op, right_val)
-
-        return False
+                return left.strip(), op, ConditionEvaluator._parse_literal(right.strip())
+        return None
 
     @staticmethod
     def _resolve_value(field_path: str, resource: OrphanedResource) -> Any:
@@ -201,28 +237,33 @@ class PolicyEngine:
         self.policies: List[Policy] = []
         self._evaluator = ConditionEvaluator()
 
-    def load(self, path: str) -> int:
+    def load(self, path: Union[str, Path, IO[str]]) -> int:
         """
-        Load policies from a YAML file or directory.
+        Load policies from a YAML file, directory, or open text stream.
 
         Args:
-            path: Path to YAML file or directory containing YAML files.
+            path: Path to YAML file or directory containing YAML files, or a
+                file-like object (e.g. io.StringIO) holding one YAML document.
 
         Returns:
             Number of policies loaded.
         """
-        p = Path(path)
         count = 0
 
-        if p.is_file():
-            count += self._load_file(p)
-        elif p.is_dir():
-            for yaml_file in sorted(p.glob("**/*.yaml")):
-                count += self._load_file(yaml_file)
-            for yml_file in sorted(p.glob("**/*.yml")):
-                count += self._load_file(yml_file)
+        if hasattr(path, "read"):
+            stream, path = path, getattr(path, "name", "<stream>")
+            count += self._load_stream(stream, path)
         else:
-            logger.warning(f"Policy path not found: {path}")
+            p = Path(path)
+            if p.is_file():
+                count += self._load_file(p)
+            elif p.is_dir():
+                for yaml_file in sorted(p.glob("**/*.yaml")):
+                    count += self._load_file(yaml_file)
+                for yml_file in sorted(p.glob("**/*.yml")):
+                    count += self._load_file(yml_file)
+            else:
+                logger.warning(f"Policy path not found: {path}")
 
         logger.info(f"Loaded {count} policies from {path}")
         return count
@@ -231,7 +272,15 @@ class PolicyEngine:
         """Load policies from a single YAML file."""
         try:
             with open(path) as f:
-                data = yaml.safe_load(f)
+                return self._load_stream(f, path)
+        except Exception as e:
+            logger.error(f"Failed to load policy file {path}: {e}")
+            return 0
+
+    def _load_stream(self, stream: IO[str], path: Any) -> int:
+        """Load policies from an open YAML stream; path is only used in log messages."""
+        try:
+            data = yaml.load(stream, Loader=_YAML_LOADER)
 
             if not data or "policies" not in data:
                 logger.warning(f"No 'policies' key in {path}")
@@ -277,13 +326,26 @@ class PolicyEngine:
         )
 
         for policy in self.policies:
+            if not policy.condition:
+                continue
+            # Parsed once per policy, then applied to every resource
+            condition_matches = self._evaluator.compile(policy.condition)
+            # Type filters depend only on provider and type, which few resources vary in
+            type_matches: Dict[Tuple[Any, str], bool] = {}
+
             for resource in resources:
                 # Check resource type match
-                if not self._resource_type_matches(policy.resource_type, resource):
+                type_key = (resource.provider, resource.resource_type)
+                type_ok = type_matches.get(type_key)
+                if type_ok is None:
+                    type_ok = type_matches[type_key] = self._resource_type_matches(
+                        policy.resource_type, resource
+                    )
+                if not type_ok:
                     continue
 
                 # Evaluate condition
-                if policy.condition and self._evaluator.evaluate(policy.condition, resource):
+                if condition_matches(resource):
                     match = PolicyMatch(
                         policy=policy,
                         resource=resource,
@@ -95,7 +95,7 @@ class AzureAppServiceManager(BaseResourceManager):
                         estimated_cost = cost_map.get(sku_name, 50.0)
 
                         rg = plan.id.split("/")[4]
-                        tags = dict(plan.tags) if getattr(plan, "tags", None) else {}
+                        tags = getattr(plan, "tags", None) or {}
 
                         resources.append(OrphanedResource(
                             provider=CloudProvider.AZURE,
@@ -0,0 +1,149 @@
+"""
+Shared Azure management clients.
+
+Constructing a management client sets up a transport pipeline and fetches a
+token, and listing subscriptions is a paged round trip. When several managers
+scan with the same credential they share one AzureClientRegistry, so each
+client is built once per subscription. A registry lives only as long as
+something holds it (every manager does); once the last holder is gone, the
+registry, its clients and the credential are released. Subscriptions are
+listed afresh on every call, and disk inventories are persisted for a few
+minutes so back-to-back runs skip relisting disks, then expire.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from typing import Any, Dict, Iterator, Optional, Set, Tuple
+
+from finops_ai.providers.azure.retry import iter_paged
+from finops_ai.utils.ttl_cache import DEFAULT_CACHE_DIR, PersistentTTLCache
+
+# How long a listed disk inventory is reused by later runs
+_DISK_INVENTORY_TTL_SECONDS = 300
+
+
+class AzureClientRegistry:
+    """Shared cache of Azure SDK clients for a single credential."""
+
+    # Registries still held by a manager; entries vanish when the last holder goes
+    _registries: "weakref.WeakValueDictionary[Any, AzureClientRegistry]" = (
+        weakref.WeakValueDictionary()
+    )
+    _registries_lock = threading.Lock()
+
+    def __init__(self, credential: Any) -> None:
+        self.credential = credential
+        self._lock = threading.Lock()
+        self._subscription_client: Optional[Any] = None
+        self._compute_clients: Dict[str, Any] = {}
+        self._storage_clients: Dict[str, Any] = {}
+        self._monitor_clients: Dict[str, Any] = {}
+        self._graph_client: Optional[Any] = None
+        self._graph_checked = False
+        self.disk_inventory_cache = PersistentTTLCache(
+            DEFAULT_CACHE_DIR / "azure_disks.json", ttl_seconds=_DISK_INVENTORY_TTL_SECONDS
+        )
+
+    @classmethod
+    def for_credential(cls, credential: Any) -> "AzureClientRegistry":
+        """Return the shared registry for this credential, creating it on first use."""
+        with cls._registries_lock:
+            registry = cls._registries.get(credential)
+            if registry is None:
+                registry = cls._registries[credential] = cls(credential)
+            return registry
+
+    # ── Clients ────────────────────────────────────────────────────────────
+
+    def get_subscription_client(self) -> Any:
+        with self._lock:
+            if self._subscription_client is None:
+                from azure.mgmt.resource import SubscriptionClient
+                self._subscription_client = SubscriptionClient(self.credential)
+            return self._subscription_client
+
+    def get_compute_client(self, subscription_id: str) -> Any:
+        with self._lock:
+            if subscription_id not in self._compute_clients:
+                from azure.mgmt.compute import ComputeManagementClient
+                self._compute_clients[subscription_id] = ComputeManagementClient(
+                    self.credential, subscription_id
+                )
+            return self._compute_clients[subscription_id]
+
+    def get_storage_client(self, subscription_id: str) -> Any:
+        with self._lock:
+            if subscription_id not in self._storage_clients:
+                from azure.mgmt.storage import StorageManagementClient
+                self._storage_clients[subscription_id] = StorageManagementClient(
+                    self.credential, subscription_id
+                )
+            return self._storage_clients[subscription_id]
+
+    def get_monitor_client(self, subscription_id: str) -> Any:
+        with self._lock:
+            if subscription_id not in self._monitor_clients:
+                from azure.mgmt.monitor import MonitorManagementClient
+                self._monitor_clients[subscription_id] = MonitorManagementClient(
+                    self.credential, subscription_id
+                )
+            return self._monitor_clients[subscription_id]
+
+    def get_graph_client(self) -> Optional[Any]:
+        """Resource Graph client, or None if azure-mgmt-resourcegraph isn't installed."""
+        with self._lock:
+            if not self._graph_checked:
+                self._graph_checked = True
+                try:
+                    from azure.mgmt.resourcegraph import ResourceGraphClient
+                    self._graph_client = ResourceGraphClient(self.credential)
+                except ImportError:
+                    self._graph_client = None
+            return self._graph_client
+
+    # ── Subscriptions ──────────────────────────────────────────────────────
+
+    def iter_subscriptions(self, subscription_id: Optional[str] = None) -> Iterator[Dict[str, str]]:
+        """
+        Yield subscriptions to scan, page by page as the API returns them.
+
+        Args:
+            subscription_id: Restrict to one subscription instead of all.
+        """
+        client = self.get_subscription_client()
+        if subscription_id:
+            sub = client.subscriptions.get(subscription_id)
+            yield {"id": sub.subscription_id, "name": sub.display_name}
+            return
+
+        for s in client.subscriptions.list():
+            yield {"id": s.subscription_id, "name": s.display_name}
+
+    # ── Disk inventory ─────────────────────────────────────────────────────
+
+    def get_disk_inventory(self, subscription_id: str) -> Tuple[Set[str], bool]:
+        """
+        Lower-cased IDs of every managed disk in a subscription.
+
+        Served from the persistent cache while it is fresh, otherwise listed
+        from Azure. Callers keep the result for one scan at most.
+
+        Returns:
+            (disk_ids, from_cache) — from_cache is True when the set was read
+            from a previous run and may be up to a few minutes stale.
+        """
+        cache_key = f"disks:{subscription_id}"
+        cached = self.disk_inventory_cache.get(cache_key)
+        if cached is not None:
+            return set(cached), True
+
+        client = self.get_compute_client(subscription_id)
+        disk_ids = {disk.id.lower() for disk in iter_paged(client.disks.list)}
+        self.disk_inventory_cache.set(cache_key, sorted(disk_ids))
+        return disk_ids, False
+
+    def evict_disk_inventory(self, subscription_id: str) -> None:
+        """Forget a subscription's persisted disk inventory, e.g. after a delete."""
+        self.disk_inventory_cache.evict(f"disks:{subscription_id}")
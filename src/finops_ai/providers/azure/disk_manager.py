@@ -17,6 +17,7 @@ from finops_ai.core.base_manager import (
     ResourceStatus,
     ScanResult,
 )
+from finops_ai.providers.azure.client_registry import AzureClientRegistry
 from finops_ai.utils.cost_calculator import CostCalculator
 
 logger = logging.getLogger("finops-ai.azure.disk")
@@ -103,7 +104,7 @@ class AzureDiskManager(BaseResourceManager):
                             from datetime import datetime, timezone
                             age_days = (datetime.now(timezone.utc) - disk.time_created).days
 
-                        tags = dict(disk.tags) if getattr(disk, "tags", None) else {}
+                        tags = getattr(disk, "tags", None) or {}
 
                         resource = OrphanedResource(
                             provider=CloudProvider.AZURE,
@@ -151,6 +152,8 @@ class AzureDiskManager(BaseResourceManager):
             op = client.disks.begin_delete(rg, disk_name)
             op.wait()
             logger.info(f"Deleted disk {disk_name}")
+            # Cached disk inventories for this subscription are now stale
+            AzureClientRegistry.for_credential(self.credential).evict_disk_inventory(sub_id)
             return DeleteResult(resource_id=resource_id, resource_name=disk_name,
                                 success=True, dry_run=False)
         except Exception as e:
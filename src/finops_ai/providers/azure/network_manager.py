@@ -79,7 +79,7 @@ class AzureNetworkManager(BaseResourceManager):
                 # ── Unassociated Public IPs ────────────────────────────
                 for ip in client.public_ip_addresses.list_all():
                     if getattr(ip, "ip_configuration", None) is None:
-                        tags = dict(ip.tags) if getattr(ip, "tags", None) else {}
+                        tags = getattr(ip, "tags", None) or {}
                         resources.append(OrphanedResource(
                             provider=CloudProvider.AZURE,
                             resource_type="public_ip",
@@ -99,7 +99,7 @@ class AzureNetworkManager(BaseResourceManager):
                 # ── Unused NICs ────────────────────────────────────────
                 for nic in client.network_interfaces.list_all():
                     if getattr(nic, "virtual_machine", None) is None:
-                        tags = dict(nic.tags) if getattr(nic, "tags", None) else {}
+                        tags = getattr(nic, "tags", None) or {}
                         resources.append(OrphanedResource(
                             provider=CloudProvider.AZURE,
                             resource_type="nic",
@@ -125,7 +125,7 @@ class AzureNetworkManager(BaseResourceManager):
                         sku_name = getattr(lb.sku, "name", "Basic") if lb.sku else "Basic"
                         is_standard = sku_name.lower() == "standard"
                         cost = CostCalculator.azure_load_balancer(standard=is_standard)
-                        tags = dict(lb.tags) if getattr(lb, "tags", None) else {}
+                        tags = getattr(lb, "tags", None) or {}
                         resources.append(OrphanedResource(
                             provider=CloudProvider.AZURE,
                             resource_type="load_balancer",
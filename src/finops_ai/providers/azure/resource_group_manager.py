@@ -78,7 +78,7 @@ class AzureResourceGroupManager(BaseResourceManager):
                             client.resources.list_by_resource_group(rg.name, top=1)
                         )
                         if len(resource_list) == 0:
-                            tags = dict(rg.tags) if getattr(rg, "tags", None) else {}
+                            tags = getattr(rg, "tags", None) or {}
                             resources.append(OrphanedResource(
                                 provider=CloudProvider.AZURE,
                                 resource_type="resource_group",
@@ -0,0 +1,55 @@
+"""
+Parsing for Azure Resource Manager (ARM) resource IDs.
+
+ARM IDs are case-insensitive, and Azure hands them back in whatever case the
+resource was created with (e.g. "resourcegroups"), so managers parse them
+here instead of splitting on "/" and indexing.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+# ARM resource ID: /subscriptions/{sub}/resourceGroups/{rg}/providers/{ns}/{kind}/{name}
+_RID_RE = re.compile(
+    r"^/subscriptions/(?P<sub>[^/]+)/resourceGroups/(?P<rg>[^/]+)"
+    r"/providers/(?P<ns>[^/]+)/(?P<kind>[^/]+)/(?P<name>[^/]+)",
+    re.IGNORECASE,
+)
+
+
+@dataclass(frozen=True)
+class AzureResourceId:
+    """The parts of a top-level ARM resource ID."""
+
+    subscription_id: str
+    resource_group: str
+    namespace: str
+    kind: str
+    name: str
+
+    def is_type(self, namespace: str, kind: str) -> bool:
+        """Case-insensitive check of the provider namespace and resource kind."""
+        return self.namespace.lower() == namespace.lower() and self.kind.lower() == kind.lower()
+
+
+def parse_resource_id(resource_id: str) -> Optional[AzureResourceId]:
+    """Split an ARM resource ID into its parts, or return None if it isn't one."""
+    m = _RID_RE.match(resource_id)
+    if not m:
+        return None
+    return AzureResourceId(*m.group("sub", "rg", "ns", "kind", "name"))
+
+
+def resource_name(resource_id: str) -> str:
+    """The resource's name, or "unknown" for a malformed ID."""
+    rid = parse_resource_id(resource_id)
+    return rid.name if rid else "unknown"
+
+
+def resource_group(resource_id: str) -> str:
+    """The resource's group, or "" for a malformed ID."""
+    rid = parse_resource_id(resource_id)
+    return rid.resource_group if rid else ""
@@ -0,0 +1,91 @@
+"""
+Retry helper for Azure management-plane calls.
+
+ARM throttles bursts of reads with HTTP 429 (and occasionally 503) responses
+that carry a Retry-After header. Once scans fan out across threads these
+become common, so every manager routes its REST calls through azure_retry(),
+which backs off and retries instead of silently dropping the result. A shared
+semaphore caps the number of requests in flight across all managers.
+iter_paged() applies the same policy to each page of a paged listing.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+logger = logging.getLogger("finops-ai.azure.retry")
+
+T = TypeVar("T")
+
+# HTTP statuses worth retrying — throttling and transient unavailability
+_RETRYABLE_STATUS = frozenset({429, 503})
+
+# Max concurrent Azure REST calls across all managers in this process
+_MAX_IN_FLIGHT = 32
+_in_flight = threading.BoundedSemaphore(_MAX_IN_FLIGHT)
+
+
+def _retry_after_seconds(error: Exception, attempt: int) -> float:
+    """Honor the Retry-After header if present, else back off exponentially."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    retry_after: Optional[str] = headers.get("Retry-After")
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+    return float(2 ** attempt)
+
+
+def azure_retry(func: Callable[..., T], *args: Any, max_tries: int = 5, **kwargs: Any) -> T:
+    """
+    Call func(*args, **kwargs), retrying on Azure throttling responses.
+
+    Args:
+        func: The SDK operation to invoke.
+        max_tries: Total attempts before the last error is re-raised.
+
+    Returns:
+        Whatever func returns.
+    """
+    attempt = 0
+    while True:
+        try:
+            with _in_flight:
+                return func(*args, **kwargs)
+        except Exception as e:
+            attempt += 1
+            status = getattr(e, "status_code", None)
+            if status not in _RETRYABLE_STATUS or attempt >= max_tries:
+                raise
+            delay = _retry_after_seconds(e, attempt)
+            logger.warning(
+                f"Azure returned {status}; retrying in {delay:.0f}s "
+                f"(attempt {attempt}/{max_tries})"
+            )
+            time.sleep(delay)
+
+
+def iter_paged(list_call: Callable[[], Any], max_tries: int = 5) -> Iterator[Any]:
+    """
+    Stream items from an SDK pager, fetching and retrying one page at a time.
+
+    Items are yielded as each page arrives instead of materializing the whole
+    listing, and a throttled page fetch is retried without restarting paging.
+
+    Args:
+        list_call: Zero-arg callable returning an ItemPaged, e.g.
+            ``lambda: client.snapshots.list()``.
+        max_tries: Attempts per page before the last error is re-raised.
+    """
+    pages = list_call().by_page()
+    while True:
+        try:
+            page = azure_retry(next, pages, max_tries=max_tries)
+        except StopIteration:
+            return
+        yield from page
@@ -10,7 +10,11 @@ Migrated from the original TerraSnap-Govern AzureSnapshotManager with:
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from typing import Any, DefaultDict, Dict, Iterator, List, Optional, Set, Tuple
 
 from finops_ai.core.base_manager import (
     BaseResourceManager,
@@ -20,10 +24,36 @@ from finops_ai.core.base_manager import (
     ResourceStatus,
     ScanResult,
 )
+from finops_ai.providers.azure.client_registry import AzureClientRegistry
+from finops_ai.providers.azure.resource_id import parse_resource_id, resource_name
+from finops_ai.providers.azure.retry import azure_retry, iter_paged
 from finops_ai.utils.cost_calculator import CostCalculator
+from finops_ai.utils.operations import delete_all
 
 logger = logging.getLogger("finops-ai.azure.snapshot")
 
+# Upper bound on subscriptions scanned concurrently (avoids ARM throttling)
+_MAX_SUBSCRIPTION_WORKERS = 8
+
+# Resource Graph query returning snapshots whose source disk no longer exists.
+# IDs are lower-cased because ARM does not guarantee consistent casing.
+_ORPHANED_SNAPSHOTS_QUERY = """
+Resources
+| where type =~ 'microsoft.compute/snapshots'
+| extend srcId = tolower(tostring(properties.creationData.sourceResourceId))
+| where isnotempty(srcId)
+| join kind=leftouter (
+    Resources
+    | where type =~ 'microsoft.compute/disks'
+    | project srcId = tolower(id), diskExists = true
+) on srcId
+| where isnull(diskExists)
+| project id, name, location, resourceGroup, tags,
+          diskSizeGB = properties.diskSizeGB,
+          timeCreated = properties.timeCreated,
+          sourceResourceId = properties.creationData.sourceResourceId
+"""
+
 
 class AzureSnapshotManager(BaseResourceManager):
     """
@@ -49,9 +79,16 @@ class AzureSnapshotManager(BaseResourceManager):
 
         self.credential = credential
         self.specific_subscription_id = subscription_id
-        self._subscription_client = SubscriptionClient(credential)
-        self._compute_clients: Dict[str, Any] = {}
+        self._clients = AzureClientRegistry.for_credential(credential)
+
+        # Disk lookups are reused within one scan and dropped when the next starts
+        self._lock = threading.Lock()
         self._disk_cache: Dict[str, bool] = {}
+        self._disk_inventory: Dict[str, Tuple[Set[str], bool]] = {}
+
+        # Resource Graph lets the orphan check run server-side in one query;
+        # without it we fall back to listing snapshots and probing each disk.
+        self._graph_client = self._clients.get_graph_client()
 
     @property
     def provider(self) -> CloudProvider:
@@ -63,120 +100,222 @@ class AzureSnapshotManager(BaseResourceManager):
 
     def _get_compute_client(self, subscription_id: str) -> Any:
         """Get or create a ComputeManagementClient for the given subscription."""
-        if subscription_id not in self._compute_clients:
-            from azure.mgmt.compute import ComputeManagementClient
-            self._compute_clients[subscription_id] = ComputeManagementClient(
-                self.credential, subscription_id
-            )
-        return self._compute_clients[subscription_id]
+        return self._clients.get_compute_client(subscription_id)
 
-    def _get_subscriptions(self) -> List[Dict[str, str]]:
-        """Get list of subscriptions to scan."""
-        if self.specific_subscription_id:
-            sub = self._subscription_client.subscriptions.get(self.specific_subscription_id)
-            return [{"id": sub.subscription_id, "name": sub.display_name}]
-
-        subs = list(self._subscription_client.subscriptions.list())
-        return [{"id": s.subscription_id, "name": s.display_name} for s in subs]
+    def _iter_subscriptions(self) -> Iterator[Dict[str, str]]:
+        """Yield subscriptions to scan, page by page as the API returns them."""
+        return self._clients.iter_subscriptions(self.specific_subscription_id)
 
     def _disk_exists(self, subscription_id: str, source_resource_id: str) -> bool:
         """Check if a source disk exists (with caching)."""
         cache_key = f"{subscription_id}:{source_resource_id}"
-        if cache_key in self._disk_cache:
-            return self._disk_cache[cache_key]
-
-        parts = source_resource_id.split("/")
-        if len(parts) < 9 or parts[6] != "Microsoft.Compute" or parts[7] != "disks":
-            self._disk_cache[cache_key] = False
-            return False
+        with self._lock:
+            cached = self._disk_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # ARM IDs are case-insensitive, so compare namespace/type lower-cased
+        rid = parse_resource_id(source_resource_id)
+        if rid is None or not rid.is_type("Microsoft.Compute", "disks"):
+            exists = False
+        else:
+            disk_ids, from_cache = self._get_disk_inventory(subscription_id)
+            if source_resource_id.lower() in disk_ids:
+                exists = True
+            elif not from_cache:
+                exists = False
+            else:
+                # A cached inventory may predate the disk; confirm before calling it orphaned
+                try:
+                    compute_client = self._get_compute_client(subscription_id)
+                    azure_retry(compute_client.disks.get, rid.resource_group, rid.name)
+                    exists = True
+                except Exception:
+                    exists = False
+
+        with self._lock:
+            return self._disk_cache.setdefault(cache_key, exists)
+
+    def _get_disk_inventory(self, subscription_id: str) -> Tuple[Set[str], bool]:
+        """A subscription's disk inventory, fetched at most once per scan."""
+        with self._lock:
+            inventory = self._disk_inventory.get(subscription_id)
+        if inventory is None:
+            inventory = self._clients.get_disk_inventory(subscription_id)
+            with self._lock:
+                inventory = self._disk_inventory.setdefault(subscription_id, inventory)
+        return inventory
+
+    def _build_orphans(
+        self, sub_id: str, sub_name: str, rows: List[Dict[str, Any]]
+    ) -> List[OrphanedResource]:
+        """Price a subscription's orphaned snapshots and wrap them."""
+        azure_snapshot = CostCalculator.azure_snapshot
+        return [
+            OrphanedResource(
+                provider=CloudProvider.AZURE,
+                resource_type="snapshot",
+                subscription_or_account=sub_id,
+                subscription_name=sub_name,
+                status=ResourceStatus.ORPHANED,
+                estimated_monthly_cost=azure_snapshot(row["size_gb"]),
+                **row,
+            )
+            for row in rows
+        ]
+
+    def _query_orphans_graph(self, sub_id: str, sub_name: str) -> List[OrphanedResource]:
+        """Find orphaned snapshots with a single server-side Resource Graph join."""
+        from azure.mgmt.resourcegraph.models import QueryRequest, QueryRequestOptions
+
+        rows: List[Dict[str, Any]] = []
+        now = datetime.now(timezone.utc)
+        skip_token: Optional[str] = None
+
+        while True:
+            request = QueryRequest(
+                subscriptions=[sub_id],
+                query=_ORPHANED_SNAPSHOTS_QUERY,
+                options=QueryRequestOptions(skip_token=skip_token, result_format="objectArray"),
+            )
+            response = azure_retry(self._graph_client.resources, request)
+
+            for row in response.data or []:
+                created_time = ""
+                age_days = 0
+                time_created = row.get("timeCreated")
+                if time_created:
+                    # Resource Graph returns ISO-8601 UTC with 7-digit fractions
+                    created = datetime.strptime(time_created[:19], "%Y-%m-%dT%H:%M:%S")
+                    created = created.replace(tzinfo=timezone.utc)
+                    created_time = created.strftime("%Y-%m-%d %H:%M:%S UTC")
+                    age_days = (now - created).days
+
+                rows.append({
+                    "resource_id": row["id"],
+                    "name": row["name"],
+                    "region": row.get("location") or "unknown",
+                    "resource_group": row.get("resourceGroup", ""),
+                    "size_gb": row.get("diskSizeGB") or 0,
+                    "age_days": age_days,
+                    "created_time": created_time,
+                    "tags": row.get("tags") or {},
+                    "source_resource_id": row.get("sourceResourceId", ""),
+                })
+
+            skip_token = response.skip_token
+            if not skip_token:
+                return self._build_orphans(sub_id, sub_name, rows)
+
+    def _scan_subscription(self, sub: Dict[str, str]) -> Tuple[List[OrphanedResource], List[str]]:
+        """Scan a single subscription for orphaned snapshots."""
+        errors: List[str] = []
+        sub_id = sub["id"]
+        sub_name = sub["name"]
+        logger.info(f"Scanning subscription: {sub_name} ({sub_id})")
 
-        resource_group = parts[4]
-        disk_name = parts[8]
+        if self._graph_client is not None:
+            try:
+                resources = self._query_orphans_graph(sub_id, sub_name)
+                logger.info(f"Resource Graph found {len(resources)} orphans in {sub_name}")
+                return resources, errors
+            except Exception as e:
+                logger.warning(
+                    f"Resource Graph query failed for {sub_id}, checking disks directly: {e}"
+                )
 
+        # Orphans are collected as plain rows and priced together once listing ends
+        rows: List[Dict[str, Any]] = []
         try:
-            from azure.core.exceptions import AzureError
-            compute_client = self._get_compute_client(subscription_id)
-            compute_client.disks.get(resource_group, disk_name)
-            self._disk_cache[cache_key] = True
-            return True
-        except Exception:
-            self._disk_cache[cache_key] = False
-            return False
+            compute_client = self._get_compute_client(sub_id)
+            now = datetime.now(timezone.utc)
+            snapshot_count = 0
+
+            # Scheduled snapshots often share one source disk, so check each source once
+            by_source: DefaultDict[str, List[Any]] = defaultdict(list)
+            for snapshot in iter_paged(compute_client.snapshots.list):
+                snapshot_count += 1
+                creation_data = getattr(snapshot, "creation_data", None)
+                source_disk_id = getattr(creation_data, "source_resource_id", None)
+                if source_disk_id:
+                    by_source[source_disk_id].append(snapshot)
+
+            logger.info(f"Found {snapshot_count} snapshots in {sub_name}")
+            if by_source:
+                logger.debug(
+                    f"dedup ratio: {sum(map(len, by_source.values())) / len(by_source):.1f} "
+                    f"snapshots per source disk in {sub_name}"
+                )
+
+            for source_disk_id, snapshots in by_source.items():
+                if self._disk_exists(sub_id, source_disk_id):
+                    continue
+
+                for snapshot in snapshots:
+                    created_time = ""
+                    age_days = 0
+
+                    time_created = getattr(snapshot, "time_created", None)
+                    if time_created:
+                        created_time = time_created.strftime("%Y-%m-%d %H:%M:%S UTC")
+                        age_days = (now - time_created).days
+
+                    snapshot_id = snapshot.id
+                    rid = parse_resource_id(snapshot_id)
+                    rows.append({
+                        "resource_id": snapshot_id,
+                        "name": snapshot.name,
+                        "region": getattr(snapshot, "location", "unknown"),
+                        "resource_group": rid.resource_group if rid else "",
+                        "size_gb": getattr(snapshot, "disk_size_gb", 0) or 0,
+                        "age_days": age_days,
+                        "created_time": created_time,
+                        # Tags are only read downstream, so share the SDK's dict
+                        "tags": getattr(snapshot, "tags", None) or {},
+                        "source_resource_id": source_disk_id,
+                    })
+
+        except Exception as e:
+            error_msg = f"Error scanning subscription {sub_id}: {e}"
+            logger.error(error_msg)
+            errors.append(error_msg)
+
+        return self._build_orphans(sub_id, sub_name, rows), errors
 
     def scan(self) -> ScanResult:
         """Scan all subscriptions for orphaned snapshots."""
         resources: List[OrphanedResource] = []
         errors: List[str] = []
-        subscriptions = self._get_subscriptions()
-
-        logger.info(f"Scanning {len(subscriptions)} subscription(s) for orphaned snapshots")
-
-        for sub in subscriptions:
-            sub_id = sub["id"]
-            sub_name = sub["name"]
-            logger.info(f"Scanning subscription: {sub_name} ({sub_id})")
-
-            try:
-                compute_client = self._get_compute_client(sub_id)
-                snapshots = list(compute_client.snapshots.list())
-                logger.info(f"Found {len(snapshots)} snapshots in {sub_name}")
-
-                for snapshot in snapshots:
-                    if (
-                        hasattr(snapshot, "creation_data")
-                        and hasattr(snapshot.creation_data, "source_resource_id")
-                        and snapshot.creation_data.source_resource_id
-                    ):
-                        source_disk_id = snapshot.creation_data.source_resource_id
-
-                        if not self._disk_exists(sub_id, source_disk_id):
-                            size_gb = getattr(snapshot, "disk_size_gb", 0) or 0
-                            created_time = ""
-                            age_days = 0
-
-                            if hasattr(snapshot, "time_created") and snapshot.time_created:
-                                created_time = snapshot.time_created.strftime("%Y-%m-%d %H:%M:%S UTC")
-                                from datetime import datetime, timezone
-                                now = datetime.now(timezone.utc)
-                                age_days = (now - snapshot.time_created).days
-
-                            tags = {}
-                            if hasattr(snapshot, "tags") and snapshot.tags:
-                                tags = dict(snapshot.tags)
-
-                            cost = self.estimate_cost_static(size_gb)
-
-                            resource = OrphanedResource(
-                                provider=CloudProvider.AZURE,
-                                resource_type="snapshot",
-                                resource_id=snapshot.id,
-                                name=snapshot.name,
-                                region=getattr(snapshot, "location", "unknown"),
-                                subscription_or_account=sub_id,
-                                subscription_name=sub_name,
-                                resource_group=snapshot.id.split("/")[4],
-                                status=ResourceStatus.ORPHANED,
-                                size_gb=size_gb,
-                                estimated_monthly_cost=cost,
-                                age_days=age_days,
-                                created_time=created_time,
-                                tags=tags,
-                                source_resource_id=source_disk_id,
-                            )
-                            resources.append(resource)
-
-            except Exception as e:
-                error_msg = f"Error scanning subscription {sub_id}: {e}"
-                logger.error(error_msg)
-                errors.append(error_msg)
-
-        logger.info(f"Found {len(resources)} orphaned snapshots across all subscriptions")
+        with self._lock:
+            self._disk_cache.clear()
+            self._disk_inventory.clear()
+
+        with ThreadPoolExecutor(max_workers=_MAX_SUBSCRIPTION_WORKERS) as executor:
+            # Submit as subscriptions stream in so scanning starts after page one
+            futures = [executor.submit(self._scan_subscription, sub)
+                       for sub in self._iter_subscriptions()]
+            for future in as_completed(futures):
+                sub_resources, sub_errors = future.result()
+                resources.extend(sub_resources)
+                errors.extend(sub_errors)
+
+        logger.info(
+            f"Found {len(resources)} orphaned snapshots across {len(futures)} subscription(s)"
+        )
         return self.get_scan_result(resources, errors)
 
+    def _begin_delete(self, resource_id: str) -> Any:
+        """Start deleting a snapshot and return its poller."""
+        rid = parse_resource_id(resource_id)
+        if rid is None:
+            raise ValueError(f"Invalid resource ID format: {resource_id}")
+        compute_client = self._get_compute_client(rid.subscription_id)
+        return compute_client.snapshots.begin_delete(rid.resource_group, rid.name)
+
     def delete(self, resource_id: str, dry_run: bool = True) -> DeleteResult:
         """Delete a specific snapshot."""
-        parts = resource_id.split("/")
-        if len(parts) < 9:
+        rid = parse_resource_id(resource_id)
+        if rid is None:
             return DeleteResult(
                 resource_id=resource_id,
                 resource_name="unknown",
@@ -185,12 +324,10 @@ class AzureSnapshotManager(BaseResourceManager):
                 error_message=f"Invalid resource ID format: {resource_id}",
             )
 
-        sub_id = parts[2]
-        resource_group = parts[4]
-        snapshot_name = parts[8]
+        snapshot_name = rid.name
 
         if dry_run:
-            logger.info(f"DRY RUN: Would delete snapshot {snapshot_name} in {resource_group}")
+            logger.info(f"DRY RUN: Would delete snapshot {snapshot_name} in {rid.resource_group}")
             return DeleteResult(
                 resource_id=resource_id,
                 resource_name=snapshot_name,
@@ -199,9 +336,7 @@ class AzureSnapshotManager(BaseResourceManager):
             )
 
         try:
-            compute_client = self._get_compute_client(sub_id)
-            operation = compute_client.snapshots.begin_delete(resource_group, snapshot_name)
-            operation.wait()
+            self._begin_delete(resource_id).result()
             logger.info(f"Deleted snapshot {snapshot_name}")
             return DeleteResult(
                 resource_id=resource_id,
@@ -219,6 +354,12 @@ class AzureSnapshotManager(BaseResourceManager):
                 error_message=str(e),
             )
 
+    def delete_many(self, resource_ids: List[str], dry_run: bool = True) -> List[DeleteResult]:
+        """Delete several snapshots, starting every delete before waiting on any."""
+        if dry_run:
+            return super().delete_many(resource_ids, dry_run=True)
+        return delete_all(resource_ids, self._begin_delete, resource_name)
+
     def estimate_cost(self, resource: OrphanedResource) -> float:
         """Estimate monthly cost of a snapshot."""
         return CostCalculator.azure_snapshot(resource.size_gb)
@@ -7,7 +7,9 @@ Detects storage containers that are empty or haven't been accessed recently.
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
 from finops_ai.core.base_manager import (
     BaseResourceManager,
@@ -17,9 +19,26 @@ from finops_ai.core.base_manager import (
     ResourceStatus,
     ScanResult,
 )
+from finops_ai.providers.azure.client_registry import AzureClientRegistry
+from finops_ai.providers.azure.retry import azure_retry, iter_paged
 
 logger = logging.getLogger("finops-ai.azure.storage")
 
+# Platform-managed containers that are never reported
+_SYSTEM_CONTAINERS = frozenset({
+    "$logs", "$metrics", "azure-webjobs-hosts", "azure-webjobs-secrets", "insights-logs",
+})
+
+# Upper bound on subscriptions scanned concurrently (avoids ARM throttling)
+_MAX_SUBSCRIPTION_WORKERS = 8
+
+# Azure Monitor metric used to spot accounts with no blob containers at all
+_BLOB_METRIC_NAMESPACE = "Microsoft.Storage/storageAccounts/blobServices"
+_CONTAINER_COUNT_METRIC = "ContainerCount"
+
+# Max accounts returned by one subscription+region metrics query
+_METRICS_TOP = 1000
+
 
 class AzureStorageManager(BaseResourceManager):
     """Finds orphaned/empty Azure blob storage containers."""
@@ -33,8 +52,7 @@ class AzureStorageManager(BaseResourceManager):
 
         self.credential = credential
         self.specific_subscription_id = subscription_id
-        self._subscription_client = SubscriptionClient(credential)
-        self._storage_clients: Dict[str, Any] = {}
+        self._clients = AzureClientRegistry.for_credential(credential)
 
     @property
     def provider(self) -> CloudProvider:
@@ -45,87 +63,150 @@ class AzureStorageManager(BaseResourceManager):
         return "storage_container"
 
     def _get_storage_client(self, subscription_id: str) -> Any:
-        if subscription_id not in self._storage_clients:
-            from azure.mgmt.storage import StorageManagementClient
-            self._storage_clients[subscription_id] = StorageManagementClient(
-                self.credential, subscription_id
+        return self._clients.get_storage_client(subscription_id)
+
+    def _iter_subscriptions(self) -> Iterator[Dict[str, str]]:
+        """Yield subscriptions to scan, page by page as the API returns them."""
+        return self._clients.iter_subscriptions(self.specific_subscription_id)
+
+    def _accounts_without_containers(self, sub_id: str, region: str) -> Set[str]:
+        """
+        Lower-cased IDs of storage accounts in a region that report zero containers.
+
+        A single subscription-scope Azure Monitor query covers every account in
+        the region, letting those accounts skip their container listing. Accounts
+        missing from the metrics, or any query failure, are scanned as before.
+        """
+        end = datetime.now(timezone.utc)
+        start = end - timedelta(hours=6)
+        try:
+            monitor_client = self._clients.get_monitor_client(sub_id)
+            response = azure_retry(
+                monitor_client.metrics.list_at_subscription_scope,
+                region,
+                timespan=f"{start:%Y-%m-%dT%H:%M:%SZ}/{end:%Y-%m-%dT%H:%M:%SZ}",
+                interval="PT1H",
+                metricnames=_CONTAINER_COUNT_METRIC,
+                aggregation="Average",
+                metricnamespace=_BLOB_METRIC_NAMESPACE,
+                filter="Microsoft.ResourceId eq '*'",
+                top=_METRICS_TOP,
             )
-        return self._storage_clients[subscription_id]
+        except Exception as e:
+            logger.debug(f"Container-count metrics unavailable for {sub_id}/{region}: {e}")
+            return set()
+
+        empty: Set[str] = set()
+        for metric in getattr(response, "value", None) or []:
+            for series in metric.timeseries or []:
+                resource_id = next(
+                    (md.value for md in series.metadatavalues or []
+                     if md.name.value.lower() == "microsoft.resourceid"),
+                    None,
+                )
+                averages = [p.average for p in series.data or [] if p.average is not None]
+                # Trust only the latest reading; the metric is emitted hourly
+                if resource_id and averages and averages[-1] == 0:
+                    empty.add(resource_id.lower().split("/blobservices/")[0])
+        return empty
+
+    def _scan_subscription(self, sub: Dict[str, str]) -> Tuple[List[OrphanedResource], List[str]]:
+        """Scan a single subscription for idle storage containers."""
+        resources: List[OrphanedResource] = []
+        errors: List[str] = []
+        sub_id, sub_name = sub["id"], sub["name"]
+        logger.info(f"Scanning storage containers in {sub_name}")
+
+        try:
+            storage_client = self._get_storage_client(sub_id)
+            now = datetime.now(timezone.utc)
+            empty_by_region: Dict[str, Set[str]] = {}
+            skipped = 0
+
+            for account in iter_paged(storage_client.storage_accounts.list):
+                # Per-account fields shared by every container in it
+                account_id = account.id
+                account_name = account.name
+                rg = account_id.split("/")[4]
+                account_tags = getattr(account, "tags", None) or {}
+                account_location = getattr(account, "location", "unknown")
+
+                # Accounts with no containers have nothing to list
+                if account_location not in empty_by_region:
+                    empty_by_region[account_location] = self._accounts_without_containers(
+                        sub_id, account_location
+                    )
+                if account_id.lower() in empty_by_region[account_location]:
+                    skipped += 1
+                    continue
+
+                try:
+                    for container in iter_paged(
+                        lambda: storage_client.blob_containers.list(rg, account_name)
+                    ):
+                        # Skip system containers
+                        if container.name in _SYSTEM_CONTAINERS:
+                            continue
+
+                        # Check if container is empty or has no recent activity
+                        has_immutability = getattr(container, "has_immutability_policy", False)
+                        has_legal_hold = getattr(container, "has_legal_hold", False)
+
+                        if not has_immutability and not has_legal_hold:
+                            # Mark containers with no recent modification
+                            last_modified = getattr(container, "last_modified_time", None)
+                            age_days = 0
+                            last_modified_str = ""
+                            if last_modified:
+                                age_days = (now - last_modified).days
+                                last_modified_str = last_modified.strftime("%Y-%m-%d %H:%M:%S UTC")
+
+                                # Only report containers not modified in 90+ days
+                                if age_days < 90:
+                                    continue
+
+                            resources.append(OrphanedResource(
+                                provider=CloudProvider.AZURE,
+                                resource_type="storage_container",
+                                resource_id=f"{account_id}/blobServices/default/containers/{container.name}",
+                                name=f"{account_name}/{container.name}",
+                                region=account_location,
+                                subscription_or_account=sub_id,
+                                subscription_name=sub_name,
+                                resource_group=rg,
+                                status=ResourceStatus.IDLE,
+                                age_days=age_days,
+                                last_used_time=last_modified_str,
+                                tags=account_tags,
+                                metadata={"storage_account": account_name},
+                            ))
+
+                except Exception as e:
+                    logger.warning(f"Error scanning containers in {account_name}: {e}")
+
+            if skipped:
+                logger.debug(f"Skipped {skipped} storage accounts with no containers in {sub_name}")
+
+        except Exception as e:
+            error_msg = f"Error scanning storage in {sub_id}: {e}"
+            logger.error(error_msg)
+            errors.append(error_msg)
 
-    def _get_subscriptions(self) -> List[Dict[str, str]]:
-        if self.specific_subscription_id:
-            sub = self._subscription_client.subscriptions.get(self.specific_subscription_id)
-            return [{"id": sub.subscription_id, "name": sub.display_name}]
-        subs = list(self._subscription_client.subscriptions.list())
-        return [{"id": s.subscription_id, "name": s.display_name} for s in subs]
+        return resources, errors
 
     def scan(self) -> ScanResult:
         """Scan for empty storage containers across all storage accounts."""
         resources: List[OrphanedResource] = []
         errors: List[str] = []
 
-        for sub in self._get_subscriptions():
-            sub_id, sub_name = sub["id"], sub["name"]
-            logger.info(f"Scanning storage containers in {sub_name}")
-
-            try:
-                storage_client = self._get_storage_client(sub_id)
-                accounts = list(storage_client.storage_accounts.list())
-
-                for account in accounts:
-                    rg = account.id.split("/")[4]
-                    try:
-                        containers = list(
-                            storage_client.blob_containers.list(rg, account.name)
-                        )
-                        for container in containers:
-                            # Skip system containers
-                            if container.name in ("$logs", "$metrics", "azure-webjobs-hosts",
-                                                   "azure-webjobs-secrets", "insights-logs"):
-                                continue
-
-                            # Check if container is empty or has no recent activity
-                            has_immutability = getattr(container, "has_immutability_policy", False)
-                            has_legal_hold = getattr(container, "has_legal_hold", False)
-
-                            if not has_immutability and not has_legal_hold:
-                                # Mark containers with no recent modification
-                                last_modified = getattr(container, "last_modified_time", None)
-                                age_days = 0
-                                last_modified_str = ""
-                                if last_modified:
-                                    from datetime import datetime, timezone
-                                    age_days = (datetime.now(timezone.utc) - last_modified).days
-                                    last_modified_str = last_modified.strftime("%Y-%m-%d %H:%M:%S UTC")
-
-                                    # Only report containers not modified in 90+ days
-                                    if age_days < 90:
-                                        continue
-
-                                tags = dict(account.tags) if getattr(account, "tags", None) else {}
-                                resources.append(OrphanedResource(
-                                    provider=CloudProvider.AZURE,
-                                    resource_type="storage_container",
-                                    resource_id=f"{account.id}/blobServices/default/containers/{container.name}",
-                                    name=f"{account.name}/{container.name}",
-                                    region=getattr(account, "location", "unknown"),
-                                    subscription_or_account=sub_id,
-                                    subscription_name=sub_name,
-                                    resource_group=rg,
-                                    status=ResourceStatus.IDLE,
-                                    age_days=age_days,
-                                    last_used_time=last_modified_str,
-                                    tags=tags,
-                                    metadata={"storage_account": account.name},
-                                ))
-
-                    except Exception as e:
-                        logger.warning(f"Error scanning containers in {account.name}: {e}")
-
-            except Exception as e:
-                error_msg = f"Error scanning storage in {sub_id}: {e}"
-                logger.error(error_msg)
-                errors.append(error_msg)
+        with ThreadPoolExecutor(max_workers=_MAX_SUBSCRIPTION_WORKERS) as executor:
+            # Submit as subscriptions stream in so scanning starts after page one
+            futures = [executor.submit(self._scan_subscription, sub)
+                       for sub in self._iter_subscriptions()]
+            for future in as_completed(futures):
+                sub_resources, sub_errors = future.result()
+                resources.extend(sub_resources)
+                errors.extend(sub_errors)
 
         logger.info(f"Found {len(resources)} idle storage containers")
         return self.get_scan_result(resources, errors)
@@ -8,8 +8,9 @@ a configurable threshold (default: 30 days). Even stopped VMs incur disk costs.
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from finops_ai.core.base_manager import (
     BaseResourceManager,
@@ -19,9 +20,23 @@ from finops_ai.core.base_manager import (
     ResourceStatus,
     ScanResult,
 )
+from finops_ai.providers.azure.client_registry import AzureClientRegistry
+from finops_ai.providers.azure.resource_id import (
+    parse_resource_id,
+    resource_group,
+    resource_name,
+)
+from finops_ai.providers.azure.retry import azure_retry, iter_paged
+from finops_ai.utils.operations import delete_all
 
 logger = logging.getLogger("finops-ai.azure.vm")
 
+# Upper bound on subscriptions scanned concurrently (avoids ARM throttling)
+_MAX_SUBSCRIPTION_WORKERS = 8
+
+# Upper bound on concurrent instanceView calls within one subscription
+_MAX_INSTANCE_VIEW_WORKERS = 16
+
 
 class AzureVMManager(BaseResourceManager):
     """Detects zombie Azure VMs — deallocated for more than N days."""
@@ -41,8 +56,7 @@ class AzureVMManager(BaseResourceManager):
         self.credential = credential
         self.specific_subscription_id = subscription_id
         self.zombie_days = zombie_days
-        self._subscription_client = SubscriptionClient(credential)
-        self._compute_clients: Dict[str, Any] = {}
+        self._clients = AzureClientRegistry.for_credential(credential)
 
     @property
     def provider(self) -> CloudProvider:
@@ -53,111 +67,180 @@ class AzureVMManager(BaseResourceManager):
         return "vm"
 
     def _get_compute_client(self, subscription_id: str) -> Any:
-        if subscription_id not in self._compute_clients:
-            from azure.mgmt.compute import ComputeManagementClient
-            self._compute_clients[subscription_id] = ComputeManagementClient(
-                self.credential, subscription_id
-            )
-        return self._compute_clients[subscription_id]
-
-    def _get_subscriptions(self) -> List[Dict[str, str]]:
-        if self.specific_subscription_id:
-            sub = self._subscription_client.subscriptions.get(self.specific_subscription_id)
-            return [{"id": sub.subscription_id, "name": sub.display_name}]
-        subs = list(self._subscription_client.subscriptions.list())
-        return [{"id": s.subscription_id, "name": s.display_name} for s in subs]
+        return self._clients.get_compute_client(subscription_id)
+
+    def _iter_subscriptions(self) -> Iterator[Dict[str, str]]:
+        """Yield subscriptions to scan, page by page as the API returns them."""
+        return self._clients.iter_subscriptions(self.specific_subscription_id)
+
+    @staticmethod
+    def _power_state_from_statuses(statuses: Any) -> Optional[str]:
+        """Extract the power state (e.g. 'deallocated') from instance view statuses."""
+        for status in statuses or []:
+            code = getattr(status, "code", None) or ""
+            if code.startswith("PowerState/"):
+                return code.split("/")[1]
+        return None
 
     def _get_power_state(self, compute_client: Any, rg: str, vm_name: str) -> Optional[str]:
-        """Get the power state of a VM."""
+        """Get the power state of a VM with a dedicated instanceView call."""
         try:
-            instance_view = compute_client.virtual_machines.instance_view(rg, vm_name)
-            for status in getattr(instance_view, "statuses", []):
-                if hasattr(status, "code") and status.code.startswith("PowerState/"):
-                    return status.code.split("/")[1]
+            instance_view = azure_retry(compute_client.virtual_machines.instance_view, rg, vm_name)
+            return self._power_state_from_statuses(getattr(instance_view, "statuses", None))
         except Exception:
-            pass
-        return None
+            return None
+
+    def _old_enough(self, vm: Any, now: datetime) -> bool:
+        """Whether the VM is at least zombie_days old, judged from list data alone."""
+        if self.zombie_days == 0:
+            return True
+        time_created = getattr(vm, "time_created", None)
+        return bool(time_created) and (now - time_created).days >= self.zombie_days
+
+    def _build_zombie(
+        self,
+        vm: Any,
+        power_state: Optional[str],
+        sub_id: str,
+        sub_name: str,
+        now: datetime,
+    ) -> Optional[OrphanedResource]:
+        """Return an OrphanedResource if the VM is a zombie, else None."""
+        if power_state not in ("deallocated", "stopped"):
+            return None
+
+        # Estimate age — use time_created if available
+        age_days = 0
+        created_time = ""
+        if hasattr(vm, "time_created") and vm.time_created:
+            created_time = vm.time_created.strftime("%Y-%m-%d %H:%M:%S UTC")
+            age_days = (now - vm.time_created).days
+
+        # Only report if stopped longer than threshold
+        if age_days < self.zombie_days and self.zombie_days != 0:
+            return None
+
+        # Estimate disk costs (VMs still pay for OS disk when stopped)
+        os_disk_size = 0
+        if hasattr(vm, "storage_profile") and vm.storage_profile:
+            os_disk = getattr(vm.storage_profile, "os_disk", None)
+            if os_disk:
+                os_disk_size = getattr(os_disk, "disk_size_gb", 30) or 30
+
+        # Rough cost: OS disk + data disks
+        estimated_cost = os_disk_size * 0.04  # Assume standard HDD
+
+        tags = getattr(vm, "tags", None) or {}
+        vm_size = ""
+        if hasattr(vm, "hardware_profile") and vm.hardware_profile:
+            vm_size = getattr(vm.hardware_profile, "vm_size", "")
+
+        return OrphanedResource(
+            provider=CloudProvider.AZURE,
+            resource_type="vm",
+            resource_id=vm.id,
+            name=vm.name,
+            region=getattr(vm, "location", "unknown"),
+            subscription_or_account=sub_id,
+            subscription_name=sub_name,
+            resource_group=resource_group(vm.id),
+            status=ResourceStatus.ZOMBIE,
+            size_gb=os_disk_size,
+            estimated_monthly_cost=estimated_cost,
+            age_days=age_days,
+            created_time=created_time,
+            tags=tags,
+            metadata={
+                "power_state": power_state,
+                "vm_size": vm_size,
+                "os_disk_size_gb": os_disk_size,
+            },
+        )
+
+    def _scan_subscription(self, sub: Dict[str, str]) -> Tuple[List[OrphanedResource], List[str]]:
+        """Scan a single subscription for zombie VMs."""
+        resources: List[OrphanedResource] = []
+        errors: List[str] = []
+        sub_id, sub_name = sub["id"], sub["name"]
+        logger.info(f"Scanning VMs in {sub_name}")
+
+        try:
+            compute_client = self._get_compute_client(sub_id)
+            now = datetime.now(timezone.utc)
+            pending: List[Any] = []
+
+            # statusOnly=true returns each VM's instance view inline, folding
+            # the list + per-VM instanceView round trips into one paged call
+            for vm in iter_paged(
+                lambda: compute_client.virtual_machines.list_all(status_only="true")
+            ):
+                power_state = self._power_state_from_statuses(
+                    getattr(getattr(vm, "instance_view", None), "statuses", None)
+                )
+                if power_state is None:
+                    # Young VMs can't be zombies; don't spend an instanceView on them
+                    if self._old_enough(vm, now):
+                        pending.append(vm)
+                    continue
+                zombie = self._build_zombie(vm, power_state, sub_id, sub_name, now)
+                if zombie:
+                    resources.append(zombie)
+
+            # Fall back to one instanceView call per VM the listing didn't cover
+            if pending:
+                workers = min(_MAX_INSTANCE_VIEW_WORKERS, len(pending))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    fetched = executor.map(
+                        lambda vm: self._get_power_state(
+                            compute_client, resource_group(vm.id), vm.name
+                        ),
+                        pending,
+                    )
+                    for vm, power_state in zip(pending, fetched):
+                        zombie = self._build_zombie(vm, power_state, sub_id, sub_name, now)
+                        if zombie:
+                            resources.append(zombie)
+
+        except Exception as e:
+            error_msg = f"Error scanning VMs in {sub_id}: {e}"
+            logger.error(error_msg)
+            errors.append(error_msg)
+
+        return resources, errors
 
     def scan(self) -> ScanResult:
         """Scan for zombie VMs (deallocated > zombie_days)."""
         resources: List[OrphanedResource] = []
         errors: List[str] = []
 
-        for sub in self._get_subscriptions():
-            sub_id, sub_name = sub["id"], sub["name"]
-            logger.info(f"Scanning VMs in {sub_name}")
-
-            try:
-                compute_client = self._get_compute_client(sub_id)
-                vms = list(compute_client.virtual_machines.list_all())
-
-                for vm in vms:
-                    rg = vm.id.split("/")[4]
-                    power_state = self._get_power_state(compute_client, rg, vm.name)
-
-                    if power_state in ("deallocated", "stopped"):
-                        # Estimate age — use time_created if available
-                        age_days = 0
-                        created_time = ""
-                        if hasattr(vm, "time_created") and vm.time_created:
-                            created_time = vm.time_created.strftime("%Y-%m-%d %H:%M:%S UTC")
-                            age_days = (datetime.now(timezone.utc) - vm.time_created).days
-
-                        # Only report if stopped longer than threshold
-                        if age_days >= self.zombie_days or self.zombie_days == 0:
-                            # Estimate disk costs (VMs still pay for OS disk when stopped)
-                            os_disk_size = 0
-                            if hasattr(vm, "storage_profile") and vm.storage_profile:
-                                os_disk = getattr(vm.storage_profile, "os_disk", None)
-                                if os_disk:
-                                    os_disk_size = getattr(os_disk, "disk_size_gb", 30) or 30
-
-                            # Rough cost: OS disk + data disks
-                            estimated_cost = os_disk_size * 0.04  # Assume standard HDD
-
-                            tags = dict(vm.tags) if getattr(vm, "tags", None) else {}
-                            vm_size = ""
-                            if hasattr(vm, "hardware_profile") and vm.hardware_profile:
-                                vm_size = getattr(vm.hardware_profile, "vm_size", "")
-
-                            resources.append(OrphanedResource(
-                                provider=CloudProvider.AZURE,
-                                resource_type="vm",
-                                resource_id=vm.id,
-                                name=vm.name,
-                                region=getattr(vm, "location", "unknown"),
-                                subscription_or_account=sub_id,
-                                subscription_name=sub_name,
-                                resource_group=rg,
-                                status=ResourceStatus.ZOMBIE,
-                                size_gb=os_disk_size,
-                                estimated_monthly_cost=estimated_cost,
-                                age_days=age_days,
-                                created_time=created_time,
-                                tags=tags,
-                                metadata={
-                                    "power_state": power_state,
-                                    "vm_size": vm_size,
-                                    "os_disk_size_gb": os_disk_size,
-                                },
-                            ))
-
-            except Exception as e:
-                error_msg = f"Error scanning VMs in {sub_id}: {e}"
-                logger.error(error_msg)
-                errors.append(error_msg)
+        with ThreadPoolExecutor(max_workers=_MAX_SUBSCRIPTION_WORKERS) as executor:
+            # Submit as subscriptions stream in so scanning starts after page one
+            futures = [executor.submit(self._scan_subscription, sub)
+                       for sub in self._iter_subscriptions()]
+            for future in as_completed(futures):
+                sub_resources, sub_errors = future.result()
+                resources.extend(sub_resources)
+                errors.extend(sub_errors)
 
         logger.info(f"Found {len(resources)} zombie VMs")
         return self.get_scan_result(resources, errors)
 
+    def _begin_delete(self, resource_id: str) -> Any:
+        """Start deleting a VM and return its poller."""
+        rid = parse_resource_id(resource_id)
+        if rid is None:
+            raise ValueError("Invalid ID")
+        client = self._get_compute_client(rid.subscription_id)
+        return client.virtual_machines.begin_delete(rid.resource_group, rid.name)
+
     def delete(self, resource_id: str, dry_run: bool = True) -> DeleteResult:
         """Delete (deallocate and remove) a VM."""
-        parts = resource_id.split("/")
-        if len(parts) < 9:
+        rid = parse_resource_id(resource_id)
+        if rid is None:
             return DeleteResult(resource_id=resource_id, resource_name="unknown",
                                 success=False, dry_run=dry_run, error_message="Invalid ID")
 
-        sub_id, rg, vm_name = parts[2], parts[4], parts[8]
+        vm_name = rid.name
 
         if dry_run:
             logger.info(f"DRY RUN: Would delete VM {vm_name}")
@@ -165,15 +248,19 @@ class AzureVMManager(BaseResourceManager):
                                 success=True, dry_run=True)
 
         try:
-            client = self._get_compute_client(sub_id)
-            op = client.virtual_machines.begin_delete(rg, vm_name)
-            op.wait()
+            self._begin_delete(resource_id).result()
             return DeleteResult(resource_id=resource_id, resource_name=vm_name,
                                 success=True, dry_run=False)
         except Exception as e:
             return DeleteResult(resource_id=resource_id, resource_name=vm_name,
                                 success=False, dry_run=False, error_message=str(e))
 
+    def delete_many(self, resource_ids: List[str], dry_run: bool = True) -> List[DeleteResult]:
+        """Delete several VMs, starting every delete before waiting on any."""
+        if dry_run:
+            return super().delete_many(resource_ids, dry_run=True)
+        return delete_all(resource_ids, self._begin_delete, resource_name)
+
     def estimate_cost(self, resource: OrphanedResource) -> float:
         """Estimate cost — stopped VMs still pay for disks."""
         os_disk_gb = resource.metadata.get("os_disk_size_gb", 30)
@@ -9,22 +9,14 @@ Available managers:
 
 from finops_ai.providers import register_manager
 
-_MANAGERS_REGISTERED = False
-
-
-def _register_all() -> None:
-    global _MANAGERS_REGISTERED
-    if _MANAGERS_REGISTERED:
-        return
-
-    try:
-        from finops_ai.providers.gcp.compute_manager import GCPComputeManager
-        from finops_ai.providers.gcp.network_manager import GCPNetworkManager
-        from finops_ai.providers.gcp.storage_manager import GCPStorageManager
-
-        for mgr in [GCPComputeManager, GCPNetworkManager, GCPStorageManager]:
-            register_manager("gcp", mgr)
-
-        _MANAGERS_REGISTERED = True
-    except ImportError:
-        pass
+# Register at import time; the import system already makes this run once
+try:
+    from finops_ai.providers.gcp.compute_manager import GCPComputeManager
+    from finops_ai.providers.gcp.network_manager import GCPNetworkManager
+    from finops_ai.providers.gcp.storage_manager import GCPStorageManager
+
+    for mgr in [GCPComputeManager, GCPNetworkManager, GCPStorageManager]:
+        register_manager("gcp", mgr)
+    del mgr
+except ImportError:
+    pass  # GCP SDK not installed
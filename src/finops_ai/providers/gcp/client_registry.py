@@ -0,0 +1,54 @@
+"""
+Shared GCP Compute Engine clients.
+
+Each compute_v1 client builds its own transport and authorized session, and
+the clients are not tied to a project. Managers scanning with the same
+credentials share one GCPClientRegistry, so each client type is built once
+per credentials instead of once per manager and project. A registry lives
+only as long as something holds it (every manager does); once the last
+holder is gone, the registry, its clients and the credentials are released.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from typing import Any, Dict
+
+
+class GCPClientRegistry:
+    """Shared cache of compute_v1 clients for a single set of credentials."""
+
+    # Registries still held by a manager; entries vanish when the last holder goes
+    _registries: "weakref.WeakValueDictionary[Any, GCPClientRegistry]" = (
+        weakref.WeakValueDictionary()
+    )
+    _registries_lock = threading.Lock()
+
+    def __init__(self, credentials: Any) -> None:
+        self.credentials = credentials
+        self._lock = threading.Lock()
+        self._compute_clients: Dict[str, Any] = {}
+
+    @classmethod
+    def for_credentials(cls, credentials: Any) -> "GCPClientRegistry":
+        """Return the shared registry for these credentials, creating it on first use."""
+        with cls._registries_lock:
+            registry = cls._registries.get(credentials)
+            if registry is None:
+                registry = cls._registries[credentials] = cls(credentials)
+            return registry
+
+    def get_compute_client(self, client_name: str) -> Any:
+        """
+        Return the shared compute_v1 client of the given class.
+
+        Args:
+            client_name: compute_v1 client class name, e.g. "DisksClient".
+        """
+        with self._lock:
+            if client_name not in self._compute_clients:
+                from google.cloud import compute_v1
+                client_cls = getattr(compute_v1, client_name)
+                self._compute_clients[client_name] = client_cls(credentials=self.credentials)
+            return self._compute_clients[client_name]
@@ -5,7 +5,10 @@ GCP Compute Manager — find orphaned disks, snapshots, and stopped VMs.
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
 
 from finops_ai.core.base_manager import (
     BaseResourceManager,
@@ -15,10 +18,25 @@ from finops_ai.core.base_manager import (
     ResourceStatus,
     ScanResult,
 )
+from finops_ai.providers.gcp.client_registry import GCPClientRegistry
+from finops_ai.providers.gcp.labels import labels_of
+from finops_ai.providers.gcp.paging import prefetch
 from finops_ai.utils.cost_calculator import CostCalculator
+from finops_ai.utils.operations import delete_all
 
 logger = logging.getLogger("finops-ai.gcp.compute")
 
+# Zone segment of a zonal resource path, e.g. ".../zones/us-central1-a/disks/d1"
+_ZONE_RE = re.compile(r"/zones/([^/]+)/")
+
+
+def _zone_of(resource_id: str) -> str:
+    """Extract the zone from a zonal resource ID."""
+    match = _ZONE_RE.search(resource_id)
+    if not match:
+        raise ValueError(f"No zone in resource ID: {resource_id}")
+    return match.group(1)
+
 
 class GCPComputeManager(BaseResourceManager):
     """Finds orphaned disks, snapshots, and stopped VMs in Google Cloud."""
@@ -31,18 +49,20 @@ class GCPComputeManager(BaseResourceManager):
         resource_labels: Optional[Dict[str, str]] = None,
     ) -> None:
         try:
-            from google.cloud import compute_v1
+            from google.cloud import compute_v1  # noqa
         except ImportError:
             raise ImportError("GCP SDK not installed. Install with: pip install finops-ai[gcp]")
 
         self.project_id = project_id
+        self.project_name = f"GCP Project {project_id}"
         self.credentials = credentials
         self.zones = zones or []
         self.resource_labels = resource_labels or {}
-        self._disks_client = compute_v1.DisksClient(credentials=credentials)
-        self._snapshots_client = compute_v1.SnapshotsClient(credentials=credentials)
-        self._instances_client = compute_v1.InstancesClient(credentials=credentials)
-        self._zones_client = compute_v1.ZonesClient(credentials=credentials)
+        # Holding the registry keeps its clients shared with later managers
+        self._clients = clients = GCPClientRegistry.for_credentials(credentials)
+        self._disks_client = clients.get_compute_client("DisksClient")
+        self._snapshots_client = clients.get_compute_client("SnapshotsClient")
+        self._instances_client = clients.get_compute_client("InstancesClient")
 
     @property
     def provider(self) -> CloudProvider:
@@ -52,173 +72,215 @@ class GCPComputeManager(BaseResourceManager):
     def resource_type(self) -> str:
         return "compute"
 
-    def _get_zones(self) -> List[str]:
-        if self.zones:
-            return self.zones
-        zones = self._zones_client.list(project=self.project_id)
-        return [z.name for z in zones]
+    @cached_property
+    def _zone_filter(self) -> FrozenSet[str]:
+        """The configured zones as a set, built once per manager."""
+        return frozenset(self.zones)
+
+    def _in_scope(self, zone: str) -> bool:
+        """Whether a zone falls within the configured zone filter (all zones if unset)."""
+        return not self._zone_filter or zone in self._zone_filter
+
+    def _list_disks(self) -> List[Tuple[str, str, Any]]:
+        """
+        Every disk in the project from one aggregated list.
+
+        Returns:
+            (scope kind, zone or region, disk) tuples, where scope kind is
+            "zones" or "regions".
+        """
+        disks: List[Tuple[str, str, Any]] = []
+        scoped = prefetch(self._disks_client.aggregated_list(project=self.project_id))
+        for scope, scoped_list in scoped:
+            kind, _, location = scope.partition("/")  # "zones/us-central1-a"
+            for disk in scoped_list.disks or []:
+                disks.append((kind, location, disk))
+        return disks
+
+    def _scan_snapshots(
+        self, snapshots: List[Any], existing: Set[Tuple[str, str]]
+    ) -> List[OrphanedResource]:
+        """Find snapshots whose source disk is not in the project's disk inventory."""
+        resources: List[OrphanedResource] = []
+        for snap in snapshots:
+            source_disk = getattr(snap, "source_disk", "")
+            if not source_disk:
+                continue
+
+            # .../zones/{zone}/disks/{name} or .../regions/{region}/disks/{name}
+            parts = source_disk.rsplit("/", 3)
+            location = parts[1] if len(parts) == 4 else ""
+            if (location, parts[-1]) in existing:
+                continue
+
+            # Source disk doesn't exist — snapshot is orphaned
+            size_gb = int(getattr(snap, "disk_size_gb", 0) or 0)
+            cost = CostCalculator.gcp_snapshot(size_gb)
+
+            labels = labels_of(snap)
+
+            # Apply resource label filter
+            if self.resource_labels and not all(
+                labels.get(k) == v
+                for k, v in self.resource_labels.items()
+            ):
+                continue
+
+            resources.append(OrphanedResource(
+                provider=CloudProvider.GCP,
+                resource_type="snapshot",
+                resource_id=f"projects/{self.project_id}/global/snapshots/{snap.name}",
+                name=snap.name,
+                region="global",
+                subscription_or_account=self.project_id,
+                subscription_name=self.project_name,
+                status=ResourceStatus.ORPHANED,
+                size_gb=size_gb,
+                estimated_monthly_cost=cost,
+                tags=labels,
+                source_resource_id=source_disk,
+            ))
+        return resources
+
+    def _scan_disks(self, disks: List[Tuple[str, str, Any]]) -> List[OrphanedResource]:
+        """Find unattached zonal disks."""
+        resources: List[OrphanedResource] = []
+        for kind, zone, disk in disks:
+            if kind != "zones" or not self._in_scope(zone):
+                continue
+            users = list(getattr(disk, "users", []) or [])
+            if not users:
+                size_gb = int(getattr(disk, "size_gb", 0) or 0)
+                disk_type = getattr(disk, "type", "pd-standard").split("/")[-1]
+                cost = CostCalculator.gcp_disk(size_gb, disk_type)
+
+                labels = labels_of(disk)
+
+                # Apply resource label filter
+                if self.resource_labels and not all(
+                    labels.get(k) == v
+                    for k, v in self.resource_labels.items()
+                ):
+                    continue
+
+                resources.append(OrphanedResource(
+                    provider=CloudProvider.GCP,
+                    resource_type="disk",
+                    resource_id=f"projects/{self.project_id}/zones/{zone}/disks/{disk.name}",
+                    name=disk.name,
+                    region=zone,
+                    subscription_or_account=self.project_id,
+                    subscription_name=self.project_name,
+                    status=ResourceStatus.UNATTACHED,
+                    size_gb=size_gb,
+                    estimated_monthly_cost=cost,
+                    tags=labels,
+                    metadata={"disk_type": disk_type},
+                ))
+        return resources
+
+    def _scan_instances(self) -> List[OrphanedResource]:
+        """Find stopped (TERMINATED) VMs across all zones from one aggregated list."""
+        resources: List[OrphanedResource] = []
+        instances = prefetch(self._instances_client.aggregated_list(project=self.project_id))
+        for scope, scoped_list in instances:
+            zone = scope.partition("/")[2]  # "zones/us-central1-a"
+            if not self._in_scope(zone):
+                continue
+            for vm in scoped_list.instances or []:
+                status = getattr(vm, "status", "")
+                if status == "TERMINATED":
+                    labels = labels_of(vm)
+
+                    # Apply resource label filter
+                    if self.resource_labels and not all(
+                        labels.get(k) == v
+                        for k, v in self.resource_labels.items()
+                    ):
+                        continue
+
+                    resources.append(OrphanedResource(
+                        provider=CloudProvider.GCP,
+                        resource_type="vm",
+                        resource_id=f"projects/{self.project_id}/zones/{zone}/instances/{vm.name}",
+                        name=vm.name,
+                        region=zone,
+                        subscription_or_account=self.project_id,
+                        subscription_name=self.project_name,
+                        status=ResourceStatus.ZOMBIE,
+                        tags=labels,
+                        metadata={"machine_type": getattr(vm, "machine_type", "").split("/")[-1]},
+                    ))
+        return resources
 
     def scan(self) -> ScanResult:
         """Scan for orphaned compute resources."""
         resources: List[OrphanedResource] = []
         errors: List[str] = []
 
-        # ── Orphaned Snapshots ─────────────────────────────────────────
-        try:
-            logger.info(f"Scanning snapshots in project {self.project_id}")
-            snapshots = self._snapshots_client.list(project=self.project_id)
-
-            for snap in snapshots:
-                source_disk = getattr(snap, "source_disk", "")
-                # Check if source disk still exists
-                if source_disk:
-                    try:
-                        # Parse source disk path to verify existence
-                        parts = source_disk.split("/")
-                        zone = parts[-3] if len(parts) > 3 else ""
-                        disk_name = parts[-1] if parts else ""
-                        self._disks_client.get(project=self.project_id, zone=zone, disk=disk_name)
-                    except Exception:
-                        # Source disk doesn't exist — snapshot is orphaned
-                        size_gb = int(getattr(snap, "disk_size_gb", 0) or 0)
-                        cost = CostCalculator.gcp_snapshot(size_gb)
-
-                        labels = dict(getattr(snap, "labels", {}) or {})
-
-                        # Apply resource label filter
-                        if self.resource_labels and not all(
-                            labels.get(k) == v
-                            for k, v in self.resource_labels.items()
-                        ):
-                            continue
-
-                        resources.append(OrphanedResource(
-                            provider=CloudProvider.GCP,
-                            resource_type="snapshot",
-                            resource_id=f"projects/{self.project_id}/global/snapshots/{snap.name}",
-                            name=snap.name,
-                            region="global",
-                            subscription_or_account=self.project_id,
-                            subscription_name=f"GCP Project {self.project_id}",
-                            status=ResourceStatus.ORPHANED,
-                            size_gb=size_gb,
-                            estimated_monthly_cost=cost,
-                            tags=labels,
-                            source_resource_id=source_disk,
-                        ))
-
-        except Exception as e:
-            errors.append(f"Error scanning GCP snapshots: {e}")
-            logger.error(f"Error scanning GCP snapshots: {e}")
-
-        # ── Unattached Disks ───────────────────────────────────────────
-        try:
-            logger.info("Scanning for unattached disks")
-            for zone in self._get_zones():
-                try:
-                    disks = self._disks_client.list(project=self.project_id, zone=zone)
-                    for disk in disks:
-                        users = list(getattr(disk, "users", []) or [])
-                        if not users:
-                            size_gb = int(getattr(disk, "size_gb", 0) or 0)
-                            disk_type = getattr(disk, "type", "pd-standard").split("/")[-1]
-                            cost = CostCalculator.gcp_disk(size_gb, disk_type)
-
-                            labels = dict(getattr(disk, "labels", {}) or {})
-
-                            # Apply resource label filter
-                            if self.resource_labels and not all(
-                                labels.get(k) == v
-                                for k, v in self.resource_labels.items()
-                            ):
-                                continue
-
-                            resources.append(OrphanedResource(
-                                provider=CloudProvider.GCP,
-                                resource_type="disk",
-                                resource_id=f"projects/{self.project_id}/zones/{zone}/disks/{disk.name}",
-                                name=disk.name,
-                                region=zone,
-                                subscription_or_account=self.project_id,
-                                subscription_name=f"GCP Project {self.project_id}",
-                                status=ResourceStatus.UNATTACHED,
-                                size_gb=size_gb,
-                                estimated_monthly_cost=cost,
-                                tags=labels,
-                                metadata={"disk_type": disk_type},
-                            ))
-                except Exception as e:
-                    errors.append(f"Error scanning disks in {zone}: {e}")
-
-        except Exception as e:
-            errors.append(f"Error scanning GCP disks: {e}")
-
-        # ── Stopped VMs ────────────────────────────────────────────────
-        try:
-            logger.info("Scanning for stopped VMs")
-            for zone in self._get_zones():
-                try:
-                    instances = self._instances_client.list(project=self.project_id, zone=zone)
-                    for vm in instances:
-                        status = getattr(vm, "status", "")
-                        if status == "TERMINATED":
-                            labels = dict(getattr(vm, "labels", {}) or {})
-
-                            # Apply resource label filter
-                            if self.resource_labels and not all(
-                                labels.get(k) == v
-                                for k, v in self.resource_labels.items()
-                            ):
-                                continue
-
-                            resources.append(OrphanedResource(
-                                provider=CloudProvider.GCP,
-                                resource_type="vm",
-                                resource_id=f"projects/{self.project_id}/zones/{zone}/instances/{vm.name}",
-                                name=vm.name,
-                                region=zone,
-                                subscription_or_account=self.project_id,
-                                subscription_name=f"GCP Project {self.project_id}",
-                                status=ResourceStatus.ZOMBIE,
-                                tags=labels,
-                                metadata={"machine_type": getattr(vm, "machine_type", "").split("/")[-1]},
-                            ))
-                except Exception as e:
-                    errors.append(f"Error scanning VMs in {zone}: {e}")
-
-        except Exception as e:
-            errors.append(f"Error scanning GCP VMs: {e}")
+        # Each listing is one aggregated, project-wide stream; run them side by side
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            logger.info(f"Scanning snapshots, disks and VMs in project {self.project_id}")
+            disks_future = executor.submit(self._list_disks)
+            snapshots_future = executor.submit(
+                lambda: list(self._snapshots_client.list(project=self.project_id))
+            )
+            instances_future = executor.submit(self._scan_instances)
+
+            try:
+                disks = disks_future.result()
+                resources.extend(self._scan_disks(disks))
+            except Exception as e:
+                disks = None
+                errors.append(f"Error scanning GCP disks: {e}")
+
+            try:
+                snapshots = snapshots_future.result()
+                if disks is None:
+                    raise RuntimeError("disk inventory unavailable")
+                # Existence is checked project-wide, regardless of the zone filter
+                existing = {(location, disk.name) for _, location, disk in disks}
+                resources.extend(self._scan_snapshots(snapshots, existing))
+            except Exception as e:
+                errors.append(f"Error scanning GCP snapshots: {e}")
+                logger.error(f"Error scanning GCP snapshots: {e}")
+
+            try:
+                resources.extend(instances_future.result())
+            except Exception as e:
+                errors.append(f"Error scanning GCP VMs: {e}")
 
         logger.info(f"Found {len(resources)} GCP compute resources to review")
         return self.get_scan_result(resources, errors)
 
+    def _begin_delete(self, resource_id: str) -> Any:
+        """Start deleting a snapshot, disk or instance and return its operation."""
+        resource_name = resource_id.rpartition("/")[2]
+        if "/snapshots/" in resource_id:
+            return self._snapshots_client.delete(project=self.project_id, snapshot=resource_name)
+        elif "/disks/" in resource_id:
+            zone = _zone_of(resource_id)
+            return self._disks_client.delete(project=self.project_id, zone=zone, disk=resource_name)
+        elif "/instances/" in resource_id:
+            zone = _zone_of(resource_id)
+            return self._instances_client.delete(project=self.project_id, zone=zone, instance=resource_name)
+        raise ValueError("Unknown resource type")
+
     def delete(self, resource_id: str, dry_run: bool = True) -> DeleteResult:
-        resource_name = resource_id.split("/")[-1]
+        resource_name = resource_id.rpartition("/")[2]
 
         if dry_run:
             logger.info(f"DRY RUN: Would delete {resource_id}")
             return DeleteResult(resource_id=resource_id, resource_name=resource_name,
                                 success=True, dry_run=True)
 
-        try:
-            if "/snapshots/" in resource_id:
-                op = self._snapshots_client.delete(project=self.project_id, snapshot=resource_name)
-            elif "/disks/" in resource_id:
-                zone = resource_id.split("/zones/")[1].split("/")[0]
-                op = self._disks_client.delete(project=self.project_id, zone=zone, disk=resource_name)
-            elif "/instances/" in resource_id:
-                zone = resource_id.split("/zones/")[1].split("/")[0]
-                op = self._instances_client.delete(project=self.project_id, zone=zone, instance=resource_name)
-            else:
-                return DeleteResult(resource_id=resource_id, resource_name=resource_name,
-                                    success=False, dry_run=False, error_message="Unknown resource type")
-
-            op.result()
-            return DeleteResult(resource_id=resource_id, resource_name=resource_name,
-                                success=True, dry_run=False)
-        except Exception as e:
-            return DeleteResult(resource_id=resource_id, resource_name=resource_name,
-                                success=False, dry_run=False, error_message=str(e))
+        return self.delete_many([resource_id], dry_run=False)[0]
+
+    def delete_many(self, resource_ids: List[str], dry_run: bool = True) -> List[DeleteResult]:
+        """Delete several resources, starting every delete before waiting on any."""
+        if dry_run:
+            return super().delete_many(resource_ids, dry_run=True)
+        return delete_all(resource_ids, self._begin_delete)
 
     def estimate_cost(self, resource: OrphanedResource) -> float:
         if resource.resource_type == "snapshot":
@@ -0,0 +1,23 @@
+"""
+Label helpers shared by the GCP resource managers.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+
+def labels_of(obj: Any) -> Dict[str, str]:
+    """
+    Return a GCP resource's labels as a plain dict.
+
+    Proto label maps are copied once; plain dicts are returned as-is since
+    OrphanedResource.tags is treated as read-only. Missing or empty labels
+    give a fresh empty dict without copying anything.
+    """
+    labels = getattr(obj, "labels", None)
+    if not labels:
+        return {}
+    if isinstance(labels, dict):
+        return labels
+    return dict(labels)
@@ -5,7 +5,10 @@ GCP Network Manager — find unused static IPs and idle forwarding rules.
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import Any, Dict, FrozenSet, List, Optional
 
 from finops_ai.core.base_manager import (
     BaseResourceManager,
@@ -15,10 +18,25 @@ from finops_ai.core.base_manager import (
     ResourceStatus,
     ScanResult,
 )
+from finops_ai.providers.gcp.client_registry import GCPClientRegistry
+from finops_ai.providers.gcp.labels import labels_of
+from finops_ai.providers.gcp.paging import prefetch
 from finops_ai.utils.cost_calculator import CostCalculator
+from finops_ai.utils.operations import delete_all
 
 logger = logging.getLogger("finops-ai.gcp.network")
 
+# Region segment of a regional resource path, e.g. ".../regions/us-central1/addresses/ip1"
+_REGION_RE = re.compile(r"/regions/([^/]+)/")
+
+
+def _region_of(resource_id: str) -> str:
+    """Extract the region from a regional resource ID."""
+    match = _REGION_RE.search(resource_id)
+    if not match:
+        raise ValueError(f"No region in resource ID: {resource_id}")
+    return match.group(1)
+
 
 class GCPNetworkManager(BaseResourceManager):
     """Finds unused GCP network resources: static IPs, idle forwarding rules."""
@@ -31,17 +49,19 @@ class GCPNetworkManager(BaseResourceManager):
         resource_labels: Optional[Dict[str, str]] = None,
     ) -> None:
         try:
-            from google.cloud import compute_v1
+            from google.cloud import compute_v1  # noqa
         except ImportError:
             raise ImportError("GCP SDK not installed. Install with: pip install finops-ai[gcp]")
 
         self.project_id = project_id
+        self.project_name = f"GCP Project {project_id}"
         self.credentials = credentials
         self.regions = regions or []
         self.resource_labels = resource_labels or {}
-        self._addresses_client = compute_v1.AddressesClient(credentials=credentials)
-        self._global_addresses_client = compute_v1.GlobalAddressesClient(credentials=credentials)
-        self._regions_client = compute_v1.RegionsClient(credentials=credentials)
+        # Holding the registry keeps its clients shared with later managers
+        self._clients = clients = GCPClientRegistry.for_credentials(credentials)
+        self._addresses_client = clients.get_compute_client("AddressesClient")
+        self._global_addresses_client = clients.get_compute_client("GlobalAddressesClient")
 
     @property
     def provider(self) -> CloudProvider:
@@ -51,60 +71,24 @@ class GCPNetworkManager(BaseResourceManager):
     def resource_type(self) -> str:
         return "network"
 
-    def _get_regions(self) -> List[str]:
-        if self.regions:
-            return self.regions
-        regions = self._regions_client.list(project=self.project_id)
-        return [r.name for r in regions]
+    @cached_property
+    def _region_filter(self) -> FrozenSet[str]:
+        """The configured regions as a set, built once per manager."""
+        return frozenset(self.regions)
 
-    def scan(self) -> ScanResult:
-        """Scan for unused static IPs."""
+    def _scan_regional_ips(self) -> List[OrphanedResource]:
+        """Find reserved regional IPs from one aggregated list across all regions."""
         resources: List[OrphanedResource] = []
-        errors: List[str] = []
-
-        # ── Regional static IPs ───────────────────────────────────────
-        try:
-            for region in self._get_regions():
-                try:
-                    addresses = self._addresses_client.list(project=self.project_id, region=region)
-                    for addr in addresses:
-                        status = getattr(addr, "status", "")
-                        if status == "RESERVED":  # Not IN_USE
-                            labels = dict(getattr(addr, "labels", {}) or {})
-
-                            # Apply resource label filter
-                            if self.resource_labels and not all(
-                                labels.get(k) == v
-                                for k, v in self.resource_labels.items()
-                            ):
-                                continue
-
-                            resources.append(OrphanedResource(
-                                provider=CloudProvider.GCP,
-                                resource_type="static_ip",
-                                resource_id=f"projects/{self.project_id}/regions/{region}/addresses/{addr.name}",
-                                name=addr.name,
-                                region=region,
-                                subscription_or_account=self.project_id,
-                                subscription_name=f"GCP Project {self.project_id}",
-                                status=ResourceStatus.UNATTACHED,
-                                estimated_monthly_cost=CostCalculator.gcp_static_ip(),
-                                tags=labels,
-                                metadata={"address": getattr(addr, "address", "")},
-                            ))
-                except Exception as e:
-                    errors.append(f"Error scanning IPs in {region}: {e}")
-
-        except Exception as e:
-            errors.append(f"Error listing GCP regions: {e}")
-
-        # ── Global static IPs ─────────────────────────────────────────
-        try:
-            global_addrs = self._global_addresses_client.list(project=self.project_id)
-            for addr in global_addrs:
+        scoped = prefetch(self._addresses_client.aggregated_list(project=self.project_id))
+        for scope, scoped_list in scoped:
+            kind, _, region = scope.partition("/")  # "regions/us-central1"
+            # Global addresses are listed by _scan_global_ips with their own client
+            if kind != "regions" or (self._region_filter and region not in self._region_filter):
+                continue
+            for addr in scoped_list.addresses or []:
                 status = getattr(addr, "status", "")
-                if status == "RESERVED":
-                    labels = dict(getattr(addr, "labels", {}) or {})
+                if status == "RESERVED":  # Not IN_USE
+                    labels = labels_of(addr)
 
                     # Apply resource label filter
                     if self.resource_labels and not all(
@@ -116,43 +100,95 @@ class GCPNetworkManager(BaseResourceManager):
                     resources.append(OrphanedResource(
                         provider=CloudProvider.GCP,
                         resource_type="static_ip",
-                        resource_id=f"projects/{self.project_id}/global/addresses/{addr.name}",
+                        resource_id=f"projects/{self.project_id}/regions/{region}/addresses/{addr.name}",
                         name=addr.name,
-                        region="global",
+                        region=region,
                         subscription_or_account=self.project_id,
-                        subscription_name=f"GCP Project {self.project_id}",
+                        subscription_name=self.project_name,
                         status=ResourceStatus.UNATTACHED,
                         estimated_monthly_cost=CostCalculator.gcp_static_ip(),
                         tags=labels,
                         metadata={"address": getattr(addr, "address", "")},
                     ))
-        except Exception as e:
-            errors.append(f"Error scanning global IPs: {e}")
+        return resources
+
+    def _scan_global_ips(self) -> List[OrphanedResource]:
+        """Find reserved global IPs."""
+        resources: List[OrphanedResource] = []
+        global_addrs = prefetch(self._global_addresses_client.list(project=self.project_id))
+        for addr in global_addrs:
+            status = getattr(addr, "status", "")
+            if status == "RESERVED":
+                labels = labels_of(addr)
+
+                # Apply resource label filter
+                if self.resource_labels and not all(
+                    labels.get(k) == v
+                    for k, v in self.resource_labels.items()
+                ):
+                    continue
+
+                resources.append(OrphanedResource(
+                    provider=CloudProvider.GCP,
+                    resource_type="static_ip",
+                    resource_id=f"projects/{self.project_id}/global/addresses/{addr.name}",
+                    name=addr.name,
+                    region="global",
+                    subscription_or_account=self.project_id,
+                    subscription_name=self.project_name,
+                    status=ResourceStatus.UNATTACHED,
+                    estimated_monthly_cost=CostCalculator.gcp_static_ip(),
+                    tags=labels,
+                    metadata={"address": getattr(addr, "address", "")},
+                ))
+        return resources
+
+    def scan(self) -> ScanResult:
+        """Scan for unused static IPs."""
+        resources: List[OrphanedResource] = []
+        errors: List[str] = []
+
+        # Regional and global addresses come from independent listings; run them side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            regional_future = executor.submit(self._scan_regional_ips)
+            global_future = executor.submit(self._scan_global_ips)
+
+            try:
+                resources.extend(regional_future.result())
+            except Exception as e:
+                errors.append(f"Error scanning regional IPs: {e}")
+
+            try:
+                resources.extend(global_future.result())
+            except Exception as e:
+                errors.append(f"Error scanning global IPs: {e}")
 
         logger.info(f"Found {len(resources)} unused GCP network resources")
         return self.get_scan_result(resources, errors)
 
+    def _begin_delete(self, resource_id: str) -> Any:
+        """Start deleting a global or regional address and return its operation."""
+        resource_name = resource_id.rpartition("/")[2]
+        if "/global/" in resource_id:
+            return self._global_addresses_client.delete(project=self.project_id, address=resource_name)
+        region = _region_of(resource_id)
+        return self._addresses_client.delete(project=self.project_id, region=region, address=resource_name)
+
     def delete(self, resource_id: str, dry_run: bool = True) -> DeleteResult:
-        resource_name = resource_id.split("/")[-1]
+        resource_name = resource_id.rpartition("/")[2]
 
         if dry_run:
             logger.info(f"DRY RUN: Would delete {resource_id}")
             return DeleteResult(resource_id=resource_id, resource_name=resource_name,
                                 success=True, dry_run=True)
 
-        try:
-            if "/global/" in resource_id:
-                op = self._global_addresses_client.delete(project=self.project_id, address=resource_name)
-            else:
-                region = resource_id.split("/regions/")[1].split("/")[0]
-                op = self._addresses_client.delete(project=self.project_id, region=region, address=resource_name)
+        return self.delete_many([resource_id], dry_run=False)[0]
 
-            op.result()
-            return DeleteResult(resource_id=resource_id, resource_name=resource_name,
-                                success=True, dry_run=False)
-        except Exception as e:
-            return DeleteResult(resource_id=resource_id, resource_name=resource_name,
-                                success=False, dry_run=False, error_message=str(e))
+    def delete_many(self, resource_ids: List[str], dry_run: bool = True) -> List[DeleteResult]:
+        """Delete several addresses, starting every delete before waiting on any."""
+        if dry_run:
+            return super().delete_many(resource_ids, dry_run=True)
+        return delete_all(resource_ids, self._begin_delete)
 
     def estimate_cost(self, resource: OrphanedResource) -> float:
         return CostCalculator.gcp_static_ip()
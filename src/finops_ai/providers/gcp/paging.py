@@ -0,0 +1,77 @@
+"""
+Paging helpers shared by the GCP resource managers.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from typing import Any, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+# Items buffered ahead of the consumer; one full Compute API page
+_PREFETCH_ITEMS = 500
+
+# How often a blocked producer re-checks whether the consumer went away
+_PUT_POLL_SECONDS = 0.1
+
+_DONE = object()
+
+
+class _Failure:
+    """Carries a producer-side exception across the queue."""
+
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+def prefetch(pager: Iterable[T], buffer_size: int = _PREFETCH_ITEMS) -> Iterator[T]:
+    """
+    Iterate a GCP pager while a background thread fetches the next page.
+
+    GCP pagers fetch each page with a blocking request only when the
+    previous one is exhausted. Draining the pager on a helper thread lets
+    the next request overlap with processing of the current page.
+
+    Args:
+        pager: Any iterable, typically a google-cloud list/aggregated_list pager.
+        buffer_size: Maximum number of items held ahead of the consumer.
+
+    Raises:
+        Whatever the pager raised, at the point the consumer reaches it.
+    """
+    buffer: "queue.Queue[Any]" = queue.Queue(maxsize=buffer_size)
+    stop = threading.Event()
+
+    def _put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=_PUT_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _fill() -> None:
+        try:
+            for item in pager:
+                if not _put(item):
+                    return
+        except Exception as e:
+            _put(_Failure(e))
+            return
+        _put(_DONE)
+
+    threading.Thread(target=_fill, name="gcp-prefetch", daemon=True).start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        # Unblocks the producer if the consumer stops early
+        stop.set()
@@ -7,8 +7,9 @@ Detects buckets with no objects or very old last-modified times.
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from finops_ai.core.base_manager import (
     BaseResourceManager,
@@ -18,9 +19,19 @@ from finops_ai.core.base_manager import (
     ResourceStatus,
     ScanResult,
 )
+from finops_ai.providers.gcp.labels import labels_of
+from finops_ai.providers.gcp.paging import prefetch
 
 logger = logging.getLogger("finops-ai.gcp.storage")
 
+# Default upper bound on concurrent bucket probes
+_DEFAULT_WORKER_COUNT = 32
+
+# Partial-response mask covering only the bucket fields the scan reads
+_BUCKET_LIST_FIELDS = (
+    "items(name,timeCreated,location,labels,storageClass,locationType),nextPageToken"
+)
+
 
 class GCPStorageManager(BaseResourceManager):
     """Finds idle/empty GCP Cloud Storage buckets."""
@@ -30,6 +41,7 @@ class GCPStorageManager(BaseResourceManager):
         project_id: str,
         credentials: Any = None,
         resource_labels: Optional[Dict[str, str]] = None,
+        worker_count: int = _DEFAULT_WORKER_COUNT,
     ) -> None:
         try:
             from google.cloud import storage
@@ -37,7 +49,9 @@ class GCPStorageManager(BaseResourceManager):
             raise ImportError("GCP SDK not installed. Install with: pip install finops-ai[gcp]")
 
         self.project_id = project_id
+        self.project_name = f"GCP Project {project_id}"
         self.resource_labels = resource_labels or {}
+        self.worker_count = worker_count
         self._client = storage.Client(project=project_id, credentials=credentials)
 
     @property
@@ -48,6 +62,55 @@ class GCPStorageManager(BaseResourceManager):
     def resource_type(self) -> str:
         return "storage_bucket"
 
+    def _probe_bucket(
+        self, bucket: Any, now: datetime
+    ) -> Tuple[Optional[OrphanedResource], Optional[str]]:
+        """Return (resource, None) if the bucket is empty, (None, error) on failure."""
+        labels = labels_of(bucket)
+
+        # Apply resource label filter before spending a request on the bucket
+        if self.resource_labels and not all(
+            labels.get(k) == v
+            for k, v in self.resource_labels.items()
+        ):
+            return None, None
+
+        try:
+            # Check if bucket is empty
+            blobs = list(bucket.list_blobs(max_results=1))
+        except Exception as e:
+            return None, f"Error checking bucket {bucket.name}: {e}"
+
+        if blobs:
+            return None, None
+
+        created = getattr(bucket, "time_created", None)
+        age_days = 0
+        created_str = ""
+        if created:
+            if created.tzinfo is None:
+                created = created.replace(tzinfo=timezone.utc)
+            age_days = (now - created).days
+            created_str = created.strftime("%Y-%m-%d %H:%M:%S UTC")
+
+        return OrphanedResource(
+            provider=CloudProvider.GCP,
+            resource_type="storage_bucket",
+            resource_id=f"gs://{bucket.name}",
+            name=bucket.name,
+            region=getattr(bucket, "location", "unknown"),
+            subscription_or_account=self.project_id,
+            subscription_name=self.project_name,
+            status=ResourceStatus.EMPTY,
+            age_days=age_days,
+            created_time=created_str,
+            tags=labels,
+            metadata={
+                "storage_class": getattr(bucket, "storage_class", "STANDARD"),
+                "location_type": getattr(bucket, "location_type", ""),
+            },
+        ), None
+
     def scan(self) -> ScanResult:
         """Scan for empty or idle Cloud Storage buckets."""
         resources: List[OrphanedResource] = []
@@ -55,52 +118,21 @@ class GCPStorageManager(BaseResourceManager):
 
         try:
             logger.info(f"Scanning Cloud Storage buckets in project {self.project_id}")
-            buckets = list(self._client.list_buckets(project=self.project_id))
-
-            for bucket in buckets:
-                try:
-                    # Check if bucket is empty
-                    blobs = list(bucket.list_blobs(max_results=1))
-
-                    if not blobs:
-                        labels = dict(getattr(bucket, "labels", {}) or {})
-
-                        # Apply resource label filter
-                        if self.resource_labels and not all(
-                            labels.get(k) == v
-                            for k, v in self.resource_labels.items()
-                        ):
-                            continue
-
-                        created = getattr(bucket, "time_created", None)
-                        age_days = 0
-                        created_str = ""
-                        if created:
-                            if created.tzinfo is None:
-                                created = created.replace(tzinfo=timezone.utc)
-                            age_days = (datetime.now(timezone.utc) - created).days
-                            created_str = created.strftime("%Y-%m-%d %H:%M:%S UTC")
-
-                        resources.append(OrphanedResource(
-                            provider=CloudProvider.GCP,
-                            resource_type="storage_bucket",
-                            resource_id=f"gs://{bucket.name}",
-                            name=bucket.name,
-                            region=getattr(bucket, "location", "unknown"),
-                            subscription_or_account=self.project_id,
-                            subscription_name=f"GCP Project {self.project_id}",
-                            status=ResourceStatus.EMPTY,
-                            age_days=age_days,
-                            created_time=created_str,
-                            tags=labels,
-                            metadata={
-                                "storage_class": getattr(bucket, "storage_class", "STANDARD"),
-                                "location_type": getattr(bucket, "location_type", ""),
-                            },
-                        ))
-
-                except Exception as e:
-                    errors.append(f"Error checking bucket {bucket.name}: {e}")
+            buckets = self._client.list_buckets(
+                project=self.project_id, fields=_BUCKET_LIST_FIELDS
+            )
+            now = datetime.now(timezone.utc)
+
+            # Each emptiness probe is its own HTTP round trip, so run them concurrently.
+            # Probes for one page of buckets start while the next page is fetched.
+            with ThreadPoolExecutor(max_workers=self.worker_count) as executor:
+                for resource, error in executor.map(
+                    lambda bucket: self._probe_bucket(bucket, now), prefetch(buckets)
+                ):
+                    if resource:
+                        resources.append(resource)
+                    if error:
+                        errors.append(error)
 
         except Exception as e:
             errors.append(f"Error listing GCP buckets: {e}")
@@ -6,12 +6,16 @@ from __future__ import annotations
 
 import csv
 import logging
-from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Iterator, Optional, Tuple
+
+from finops_ai.reporters.formatting import EnumTextCache, compact_utc_timestamp
 
 logger = logging.getLogger("finops-ai.reporters.csv")
 
+# Write buffer for report files (1 MiB)
+_WRITE_BUFFER_BYTES = 1 << 20
+
 
 class CSVReporter:
     """Generates CSV reports from scan results."""
@@ -26,33 +30,40 @@ class CSVReporter:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+    @staticmethod
+    def _rows(resources: Iterable[Any]) -> Iterator[Tuple[Any, ...]]:
+        """Yield one CSV row per resource."""
+        provider_of = EnumTextCache().__getitem__
+        status_of = EnumTextCache().__getitem__
+        severity_of = EnumTextCache().__getitem__
+        join_tags = "; ".join
+
+        for r in resources:
+            yield (
+                provider_of(r.provider), r.resource_type, r.resource_id, r.name, r.region,
+                r.subscription_or_account, r.resource_group, status_of(r.status), r.size_gb,
+                r.estimated_monthly_cost, r.age_days, r.created_time, severity_of(r.severity),
+                join_tags([f"{k}={v}" for k, v in r.tags.items()]),
+            )
+
     def generate(
         self,
         scan_results: list,
         filename: Optional[str] = None,
     ) -> str:
         """Generate a CSV report file."""
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        timestamp = compact_utc_timestamp()
         filename = filename or f"finops_report_{timestamp}.csv"
         filepath = self.output_dir / filename
 
-        with open(filepath, "w", newline="") as f:
+        # Large buffer: a report is written in one pass, so batch the syscalls.
+        # Pin UTF-8 so the fast codec is used regardless of the locale.
+        with open(filepath, "w", encoding="utf-8", newline="",
+                  buffering=_WRITE_BUFFER_BYTES) as f:
             writer = csv.writer(f)
             writer.writerow(self.HEADERS)
-
-            for result in scan_results:
-                for r in result.resources:
-                    provider = r.provider.value if hasattr(r.provider, "value") else str(r.provider)
-                    status = r.status.value if hasattr(r.status, "value") else str(r.status)
-                    severity = r.severity.value if hasattr(r.severity, "value") else str(r.severity)
-                    tags_str = "; ".join(f"{k}={v}" for k, v in r.tags.items())
-
-                    writer.writerow([
-                        provider, r.resource_type, r.resource_id, r.name, r.region,
-                        r.subscription_or_account, r.resource_group, status, r.size_gb,
-                        r.estimated_monthly_cost, r.age_days, r.created_time, severity,
-                        tags_str,
-                    ])
+            writer.writerows(self._rows(r for result in scan_results for r in result.resources))
 
         logger.info(f"CSV report saved to {filepath}")
         return str(filepath)
+
@@ -0,0 +1,33 @@
+"""
+Value formatting helpers shared by the reporters.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+
+def compact_utc_timestamp() -> str:
+    """Current UTC time as YYYYmmdd_HHMMSS, for default report filenames."""
+    n = datetime.utcnow()
+    return f"{n.year:04d}{n.month:02d}{n.day:02d}_{n.hour:02d}{n.minute:02d}{n.second:02d}"
+
+
+def enum_text(value: Any) -> str:
+    """Return an enum member's value, or str() of anything else."""
+    text = getattr(value, "value", None)
+    return text if text is not None else str(value)
+
+
+class EnumTextCache(dict):
+    """
+    Maps enum members (or plain values) to their report text, computing each once.
+
+    Only a handful of distinct providers, statuses and severities appear in a
+    report, so a dict hit replaces the Enum.value descriptor on every row.
+    """
+
+    def __missing__(self, key: Any) -> str:
+        text = self[key] = enum_text(key)
+        return text
@@ -6,12 +6,58 @@ from __future__ import annotations
 
 import json
 import logging
+from collections import defaultdict
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, DefaultDict, Dict, List, Optional
+
+from finops_ai.reporters.formatting import EnumTextCache, compact_utc_timestamp, enum_text
+
+try:
+    import orjson
+except ImportError:  # Optional: pip install finops-ai[fast]
+    orjson = None
 
 logger = logging.getLogger("finops-ai.reporters.json")
 
+# Write buffer for report files (1 MiB)
+_WRITE_BUFFER_BYTES = 1 << 20
+
+# Output key -> OrphanedResource attribute, in report order
+_RESOURCE_FIELDS = (
+    ("provider", "provider"),
+    ("resource_type", "resource_type"),
+    ("resource_id", "resource_id"),
+    ("name", "name"),
+    ("region", "region"),
+    ("account", "subscription_or_account"),
+    ("account_name", "subscription_name"),
+    ("resource_group", "resource_group"),
+    ("status", "status"),
+    ("size_gb", "size_gb"),
+    ("estimated_monthly_cost", "estimated_monthly_cost"),
+    ("age_days", "age_days"),
+    ("created_time", "created_time"),
+    ("last_used_time", "last_used_time"),
+    ("tags", "tags"),
+    ("severity", "severity"),
+)
+_RESOURCE_KEYS = tuple(key for key, _ in _RESOURCE_FIELDS)
+# One C-level call fetches every attribute
+_RESOURCE_VALUES = attrgetter(*(attr for _, attr in _RESOURCE_FIELDS))
+# Fields holding enums that serialize as their value
+_ENUM_POSITIONS = tuple(_RESOURCE_KEYS.index(k) for k in ("provider", "status", "severity"))
+
+
+def _dumps(report: Dict[str, Any]) -> bytes:
+    """Serialize a report to indented UTF-8 JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(
+            report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str
+        )
+    return json.dumps(report, indent=2, default=str).encode("utf-8")
+
 
 class JSONReporter:
     """Generates structured JSON reports from scan results."""
@@ -22,24 +68,10 @@ class JSONReporter:
 
     def _resource_to_dict(self, resource: Any) -> Dict[str, Any]:
         """Convert an OrphanedResource to a serializable dict."""
-        return {
-            "provider": resource.provider.value if hasattr(resource.provider, "value") else str(resource.provider),
-            "resource_type": resource.resource_type,
-            "resource_id": resource.resource_id,
-            "name": resource.name,
-            "region": resource.region,
-            "account": resource.subscription_or_account,
-            "account_name": resource.subscription_name,
-            "resource_group": resource.resource_group,
-            "status": resource.status.value if hasattr(resource.status, "value") else str(resource.status),
-            "size_gb": resource.size_gb,
-            "estimated_monthly_cost": resource.estimated_monthly_cost,
-            "age_days": resource.age_days,
-            "created_time": resource.created_time,
-            "last_used_time": resource.last_used_time,
-            "tags": resource.tags,
-            "severity": resource.severity.value if hasattr(resource.severity, "value") else str(resource.severity),
-        }
+        values = list(_RESOURCE_VALUES(resource))
+        for i in _ENUM_POSITIONS:
+            values[i] = enum_text(values[i])
+        return dict(zip(_RESOURCE_KEYS, values))
 
     def generate(
         self,
@@ -56,38 +88,48 @@ class JSONReporter:
         Returns:
             Path to the generated report file.
         """
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        timestamp = compact_utc_timestamp()
         filename = filename or f"finops_report_{timestamp}.json"
         filepath = self.output_dir / filename
 
-        all_resources = []
+        # Summary pass: only totals are kept, not the resource dicts
+        provider_of = EnumTextCache().__getitem__
+        resource_count = 0
         total_cost = 0.0
-        by_provider: Dict[str, float] = {}
+        by_provider: DefaultDict[str, float] = defaultdict(float)
 
         for result in scan_results:
             for resource in result.resources:
-                all_resources.append(self._resource_to_dict(resource))
+                resource_count += 1
                 total_cost += resource.estimated_monthly_cost
-                prov = resource.provider.value if hasattr(resource.provider, "value") else str(resource.provider)
-                by_provider[prov] = by_provider.get(prov, 0) + resource.estimated_monthly_cost
+                by_provider[provider_of(resource.provider)] += resource.estimated_monthly_cost
 
-        report = {
+        header = _dumps({
             "metadata": {
                 "generated_at": datetime.utcnow().isoformat(),
                 "tool": "finops-ai",
                 "version": "1.0.0",
             },
             "summary": {
-                "total_resources": len(all_resources),
+                "total_resources": resource_count,
                 "total_monthly_cost": round(total_cost, 2),
                 "total_annual_cost": round(total_cost * 12, 2),
                 "by_provider": {k: round(v, 2) for k, v in by_provider.items()},
             },
-            "resources": all_resources,
-        }
+        })
 
-        with open(filepath, "w") as f:
-            json.dump(report, f, indent=2, default=str)
+        # Stream the resources array one object at a time so peak memory stays flat.
+        # Output matches serializing the whole report with indent=2.
+        with open(filepath, "wb", buffering=_WRITE_BUFFER_BYTES) as f:
+            f.write(header[:-2])  # reopen the object: drop the closing "\n}"
+            f.write(b',\n  "resources": [')
+            separator = b"\n    "
+            for result in scan_results:
+                for resource in result.resources:
+                    f.write(separator)
+                    f.write(_dumps(self._resource_to_dict(resource)).replace(b"\n", b"\n    "))
+                    separator = b",\n    "
+            f.write(b"\n  ]\n}" if resource_count else b"]\n}")
 
         logger.info(f"JSON report saved to {filepath}")
         return str(filepath)
@@ -4,18 +4,39 @@ Slack Reporter — send scan results to Slack via webhook.
 
 from __future__ import annotations
 
+import heapq
 import json
 import logging
-from typing import Any, Dict, List, Optional
+from collections import defaultdict
+from typing import Any, DefaultDict, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from finops_ai.reporters.formatting import EnumTextCache
 
 logger = logging.getLogger("finops-ai.reporters.slack")
 
+# Connection-level retries for the webhook; posts themselves are not replayed
+_CONNECT_RETRIES = 2
+
+# Number of most expensive resources listed in the message
+_TOP_N = 5
+
 
 class SlackReporter:
     """Sends FinOps scan summaries to Slack via Incoming Webhook."""
 
     def __init__(self, webhook_url: str) -> None:
         self.webhook_url = webhook_url
+        # One keep-alive session so repeated sends reuse the TLS connection
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=4,
+            max_retries=Retry(total=_CONNECT_RETRIES, backoff_factor=0.2),
+        ))
 
     def send(
         self,
@@ -34,25 +55,26 @@ class SlackReporter:
         Returns:
             True if message was sent successfully.
         """
-        import requests
-
-        total_resources = sum(len(r.resources) for r in scan_results)
-        total_cost = sum(r.estimated_monthly_cost for r in scan_results if hasattr(r, 'estimated_monthly_cost'))
-
-        # Fallback cost calculation
-        if total_cost == 0:
-            for result in scan_results:
-                total_cost += sum(r.estimated_monthly_cost for r in result.resources)
-
-        # Build provider breakdown
-        by_provider: Dict[str, Dict[str, Any]] = {}
+        # One pass over every resource: totals, provider breakdown and top-N heap
+        provider_text = EnumTextCache()
+        # [count, cost] per provider; list slots are cheaper to bump than dict keys
+        by_provider: DefaultDict[str, List[Any]] = defaultdict(lambda: [0, 0.0])
+        total_resources = 0
+        total_cost = 0.0
+        # Min-heap of (cost, -position, resource); ties keep the earlier resource
+        top_heap: List[Tuple[float, int, Any]] = []
         for result in scan_results:
             for r in result.resources:
-                prov = r.provider.value if hasattr(r.provider, "value") else str(r.provider)
-                if prov not in by_provider:
-                    by_provider[prov] = {"count": 0, "cost": 0.0}
-                by_provider[prov]["count"] += 1
-                by_provider[prov]["cost"] += r.estimated_monthly_cost
+                cost = r.estimated_monthly_cost
+                total_cost += cost
+                data = by_provider[provider_text[r.provider]]
+                data[0] += 1
+                data[1] += cost
+                if len(top_heap) < _TOP_N:
+                    heapq.heappush(top_heap, (cost, -total_resources, r))
+                elif cost > top_heap[0][0]:
+                    heapq.heapreplace(top_heap, (cost, -total_resources, r))
+                total_resources += 1
 
         # Build Slack blocks
         blocks = [
@@ -73,7 +95,7 @@ class SlackReporter:
         ]
 
         # Provider breakdowns
-        for prov, data in by_provider.items():
+        for prov, (count, cost) in by_provider.items():
             emoji = {"azure": "🔵", "aws": "🟠", "gcp": "🔴"}.get(prov, "☁️")
             blocks.append({
                 "type": "section",
@@ -81,20 +103,16 @@ class SlackReporter:
                     "type": "mrkdwn",
                     "text": (
                         f"{emoji} *{prov.upper()}*: "
-                        f"{data['count']} resources | ${data['cost']:,.2f}/mo"
+                        f"{count} resources | ${cost:,.2f}/mo"
                     ),
                 },
             })
 
-        # Top 5 most expensive
-        all_resources = []
-        for result in scan_results:
-            all_resources.extend(result.resources)
-        all_resources.sort(key=lambda r: r.estimated_monthly_cost, reverse=True)
+        top = [r for _, _, r in sorted(top_heap, reverse=True)]
 
-        if all_resources:
+        if top:
             top_text = "*Top 5 Most Expensive:*\n"
-            for r in all_resources[:5]:
+            for r in top:
                 top_text += f"• `{r.name}` — ${r.estimated_monthly_cost:.2f}/mo ({r.resource_type})\n"
             blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": top_text}})
 
@@ -103,7 +121,7 @@ class SlackReporter:
             payload["channel"] = channel
 
         try:
-            resp = requests.post(
+            resp = self._session.post(
                 self.webhook_url,
                 json=payload,
                 headers={"Content-Type": "application/json"},
@@ -8,8 +8,9 @@ may differ based on region, discounts, and reserved capacity.
 
 from __future__ import annotations
 
+from collections import defaultdict
 from enum import Enum
-from typing import Dict, Optional
+from typing import Any, DefaultDict, Dict, Optional, Sequence
 
 
 class DiskTier(str, Enum):
@@ -74,7 +75,9 @@ class CostCalculator:
     @staticmethod
     def azure_disk(size_gb: float, tier: str = "standard_hdd") -> float:
         """Estimate monthly cost of an Azure managed disk."""
-        cost_per_gb = AZURE_DISK_COST.get(tier.lower(), AZURE_DISK_COST["standard_hdd"])
+        cost_per_gb = AZURE_DISK_COST.get(tier)
+        if cost_per_gb is None:  # Keys are lowercase; only normalize on a miss
+            cost_per_gb = AZURE_DISK_COST.get(tier.lower(), AZURE_DISK_COST["standard_hdd"])
         return round(size_gb * cost_per_gb, 2)
 
     @staticmethod
@@ -92,7 +95,9 @@ class CostCalculator:
     @staticmethod
     def aws_ebs_volume(size_gb: float, volume_type: str = "gp3") -> float:
         """Estimate monthly cost of an AWS EBS volume."""
-        cost_per_gb = AWS_EBS_COST.get(volume_type.lower(), AWS_EBS_COST["gp3"])
+        cost_per_gb = AWS_EBS_COST.get(volume_type)
+        if cost_per_gb is None:  # Keys are lowercase; only normalize on a miss
+            cost_per_gb = AWS_EBS_COST.get(volume_type.lower(), AWS_EBS_COST["gp3"])
         return round(size_gb * cost_per_gb, 2)
 
     @staticmethod
@@ -115,7 +120,9 @@ class CostCalculator:
     @staticmethod
     def gcp_disk(size_gb: float, disk_type: str = "pd-standard") -> float:
         """Estimate monthly cost of a GCP persistent disk."""
-        cost_per_gb = GCP_DISK_COST.get(disk_type.lower(), GCP_DISK_COST["pd-standard"])
+        cost_per_gb = GCP_DISK_COST.get(disk_type)
+        if cost_per_gb is None:  # Keys are lowercase; only normalize on a miss
+            cost_per_gb = GCP_DISK_COST.get(disk_type.lower(), GCP_DISK_COST["pd-standard"])
         return round(size_gb * cost_per_gb, 2)
 
     @staticmethod
@@ -141,13 +148,52 @@ class CostCalculator:
         Returns:
             Dict with monthly_savings, annual_savings, and per-provider breakdown.
         """
-        total_monthly = sum(r.estimated_monthly_cost for r in resources)
-        by_provider: Dict[str, float] = {}
-
+        # One pass keyed on the raw provider member; each distinct member is
+        # converted to its name once afterwards instead of once per resource
+        by_member: DefaultDict[Any, float] = defaultdict(float)
         for r in resources:
-            provider = r.provider.value if hasattr(r.provider, "value") else str(r.provider)
-            by_provider[provider] = by_provider.get(provider, 0.0) + r.estimated_monthly_cost
+            by_member[r.provider] += r.estimated_monthly_cost
+
+        total_monthly = sum(by_member.values())
+        by_provider: DefaultDict[str, float] = defaultdict(float)
+        for member, cost in by_member.items():
+            provider = member.value if hasattr(member, "value") else str(member)
+            by_provider[provider] += cost
+
+        return CostCalculator._summary(total_monthly, by_provider)
+
+    @staticmethod
+    def savings_summary(costs: Sequence[float], providers: Sequence[str]) -> Dict[str, float]:
+        """
+        Compute aggregate savings from parallel cost and provider columns (NumPy if available).
 
+        Same result as total_savings_summary, for callers that already hold
+        costs and provider names as columns rather than resource objects.
+
+        Args:
+            costs: Estimated monthly cost of each resource.
+            providers: Provider name of each resource, aligned with costs.
+        """
+        if len(costs) != len(providers):
+            raise ValueError("costs and providers must have the same length")
+        try:
+            import numpy as np
+        except ImportError:
+            by_provider: DefaultDict[str, float] = defaultdict(float)
+            for provider, cost in zip(providers, costs):
+                by_provider[provider] += cost
+            return CostCalculator._summary(sum(by_provider.values()), by_provider)
+
+        cost_array = np.asarray(costs, dtype=float)
+        names, codes = np.unique(np.asarray(providers, dtype=str), return_inverse=True)
+        totals = np.bincount(codes, weights=cost_array, minlength=len(names))
+        return CostCalculator._summary(
+            float(cost_array.sum()), dict(zip(names.tolist(), totals.tolist()))
+        )
+
+    @staticmethod
+    def _summary(total_monthly: float, by_provider: Dict[str, float]) -> Dict[str, float]:
+        """Round totals into the summary dict shared by both summary APIs."""
         return {
             "monthly_savings": round(total_monthly, 2),
             "annual_savings": round(total_monthly * 12, 2),
@@ -10,14 +10,19 @@ from __future__ import annotations
 import json
 import logging
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from rich.console import Console
 from rich.logging import RichHandler
 from rich.theme import Theme
 
+try:
+    import orjson
+except ImportError:  # Optional: pip install finops-ai[fast]
+    orjson = None
+
 # Custom theme for FinOps AI console output
 FINOPS_THEME = Theme(
     {
@@ -40,6 +45,16 @@ FINOPS_THEME = Theme(
 
 console = Console(theme=FINOPS_THEME)
 
+# Write buffer for the JSON audit log (64 KiB)
+_WRITE_BUFFER_BYTES = 1 << 16
+
+
+def _json_line(entry: dict) -> bytes:
+    """Serialize a log entry as one UTF-8 JSON line, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(entry) + "\n").encode("utf-8")
+
 
 class JSONFileHandler(logging.Handler):
     """Logging handler that writes structured JSON lines to a file."""
@@ -48,18 +63,38 @@ class JSONFileHandler(logging.Handler):
         super().__init__()
         self.filepath = Path(filepath)
         self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        # Kept open for the handler's lifetime; logging.shutdown() flushes and closes it
+        self._stream = open(self.filepath, "ab", buffering=_WRITE_BUFFER_BYTES)
+        self._ts_second = -1
+        self._ts_prefix = ""
+        # Reused for every record; emit() runs under the handler lock and the
+        # serializer keeps no reference, so one scratch dict is enough
+        self._entry: Dict[str, Any] = {}
+
+    def _timestamp(self, created: float) -> str:
+        """
+        ISO-8601 UTC time of a record, formatting the date part once per second.
+
+        Matches datetime.isoformat(): the fraction is left out when it is zero.
+        """
+        second = int(created)
+        if second != self._ts_second:
+            self._ts_second = second
+            self._ts_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        micros = int((created - second) * 1_000_000)
+        return f"{self._ts_prefix}.{micros:06d}" if micros else self._ts_prefix
 
     def emit(self, record: logging.LogRecord) -> None:
         try:
-            log_entry = {
-                "timestamp": datetime.utcnow().isoformat(),
-                "level": record.levelname,
-                "logger": record.name,
-                "message": record.getMessage(),
-                "module": record.module,
-                "function": record.funcName,
-                "line": record.lineno,
-            }
+            log_entry = self._entry
+            log_entry.clear()
+            log_entry["timestamp"] = self._timestamp(record.created)
+            log_entry["level"] = record.levelname
+            log_entry["logger"] = record.name
+            log_entry["message"] = record.getMessage()
+            log_entry["module"] = record.module
+            log_entry["function"] = record.funcName
+            log_entry["line"] = record.lineno
             # Include extra fields if present
             if hasattr(record, "resource_id"):
                 log_entry["resource_id"] = record.resource_id
@@ -68,16 +103,26 @@ class JSONFileHandler(logging.Handler):
             if hasattr(record, "action"):
                 log_entry["action"] = record.action
 
-            with open(self.filepath, "a") as f:
-                f.write(json.dumps(log_entry) + "\n")
+            self._stream.write(_json_line(log_entry))
         except Exception:
             self.handleError(record)
 
+    def flush(self) -> None:
+        with self.lock:
+            if not self._stream.closed:
+                self._stream.flush()
+
+    def close(self) -> None:
+        with self.lock:
+            self._stream.close()
+        super().close()
+
 
 def setup_logging(
     level: str = "INFO",
     log_file: Optional[str] = None,
     json_log: bool = False,
+    verbose_tracebacks: bool = False,
 ) -> logging.Logger:
     """
     Configure logging for FinOps AI.
@@ -86,6 +131,8 @@ def setup_logging(
         level: Log level string (DEBUG, INFO, WARNING, ERROR).
         log_file: Optional path for JSON audit log file.
         json_log: If True and log_file is set, write JSON-structured logs.
+        verbose_tracebacks: If True, render exceptions as Rich tracebacks with
+            local variables. Off by default since every local is repr'd.
 
     Returns:
         Configured root logger for finops-ai.
@@ -93,8 +140,10 @@ def setup_logging(
     root_logger = logging.getLogger("finops-ai")
     root_logger.setLevel(getattr(logging, level.upper(), logging.INFO))
 
-    # Clear existing handlers
-    root_logger.handlers.clear()
+    # Close existing handlers so buffered audit lines reach disk
+    for handler in root_logger.handlers[:]:
+        handler.close()
+        root_logger.removeHandler(handler)
 
     # Rich console handler — beautiful terminal output
     rich_handler = RichHandler(
@@ -102,8 +151,8 @@ def setup_logging(
         show_time=True,
         show_path=False,
         markup=True,
-        rich_tracebacks=True,
-        tracebacks_show_locals=True,
+        rich_tracebacks=verbose_tracebacks,
+        tracebacks_show_locals=verbose_tracebacks,
     )
     rich_handler.setLevel(getattr(logging, level.upper(), logging.INFO))
     root_logger.addHandler(rich_handler)
@@ -0,0 +1,96 @@
+"""
+Helpers for cloud long-running operations.
+
+Delete calls return as soon as the cloud accepts a request (an Azure LROPoller
+or a GCP ExtendedOperation), but the delete itself can take minutes. Bulk
+deletes start every operation first and then wait on them together with
+wait_for_deletes(), so the batch takes about as long as its slowest member
+instead of the sum of all of them. Managers hand delete_all() a callback that
+starts one delete, and it does the rest.
+"""
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Tuple
+
+from finops_ai.core.base_manager import DeleteResult
+
+logger = logging.getLogger("finops-ai.operations")
+
+# Upper bound on operations waited on concurrently
+_MAX_POLL_WORKERS = 16
+
+# Give up waiting on a single delete after this long
+_DELETE_TIMEOUT_SECONDS = 600
+
+
+def _wait_for_delete(started: Tuple[str, str, Any]) -> DeleteResult:
+    resource_id, name, operation = started
+    try:
+        operation.result(timeout=_DELETE_TIMEOUT_SECONDS)
+        if not operation.done():
+            raise TimeoutError(f"delete still running after {_DELETE_TIMEOUT_SECONDS}s")
+        logger.info(f"Deleted {name}")
+        return DeleteResult(resource_id=resource_id, resource_name=name,
+                            success=True, dry_run=False)
+    except Exception as e:
+        logger.error(f"Failed to delete {name}: {e}")
+        return DeleteResult(resource_id=resource_id, resource_name=name,
+                            success=False, dry_run=False, error_message=str(e))
+
+
+def wait_for_deletes(started: List[Tuple[str, str, Any]]) -> List[DeleteResult]:
+    """
+    Wait on already-started delete operations concurrently.
+
+    Args:
+        started: (resource_id, resource_name, operation) for each started delete.
+            The operation needs result(timeout=...) and done(), which both Azure
+            pollers and GCP operations provide.
+
+    Returns:
+        One DeleteResult per entry, in the same order.
+    """
+    if not started:
+        return []
+    with ThreadPoolExecutor(max_workers=min(_MAX_POLL_WORKERS, len(started))) as executor:
+        return list(executor.map(_wait_for_delete, started))
+
+
+def _last_path_segment(resource_id: str) -> str:
+    return resource_id.rpartition("/")[2]
+
+
+def delete_all(
+    resource_ids: List[str],
+    begin_delete: Callable[[str], Any],
+    resource_name: Callable[[str], str] = _last_path_segment,
+) -> List[DeleteResult]:
+    """
+    Start every delete, then wait on all of them together.
+
+    Args:
+        resource_ids: Full cloud resource IDs.
+        begin_delete: Starts deleting one resource and returns its operation.
+            Raising marks that resource as failed without stopping the others.
+        resource_name: Display name for a resource ID; defaults to its last
+            path segment.
+
+    Returns:
+        One DeleteResult per ID, in the same order.
+    """
+    failed: Dict[int, DeleteResult] = {}
+    started: List[Tuple[str, str, Any]] = []
+    for i, resource_id in enumerate(resource_ids):
+        name = resource_name(resource_id)
+        try:
+            started.append((resource_id, name, begin_delete(resource_id)))
+        except Exception as e:
+            logger.error(f"Failed to delete {name}: {e}")
+            failed[i] = DeleteResult(resource_id=resource_id, resource_name=name,
+                                     success=False, dry_run=False, error_message=str(e))
+
+    waited = iter(wait_for_deletes(started))
+    return [failed[i] if i in failed else next(waited) for i in range(len(resource_ids))]
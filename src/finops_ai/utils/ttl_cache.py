@@ -0,0 +1,86 @@
+"""
+Small persistent key/value cache with per-entry expiry.
+
+Used to carry slow-changing cloud inventory (e.g. the set of disk IDs in a
+subscription) across back-to-back CLI runs. Entries live in a single JSON
+file; writes go through a temp file and an atomic rename so a crashed run
+never leaves a truncated cache behind.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from finops_ai.config import DEFAULT_CONFIG_DIR
+
+logger = logging.getLogger("finops-ai.cache")
+
+DEFAULT_CACHE_DIR = DEFAULT_CONFIG_DIR / "cache"
+
+
+def _is_entry(value: Any) -> bool:
+    """True for a {"expires": <number>, "value": ...} record as written by set()."""
+    if not isinstance(value, dict):
+        return False
+    expires = value.get("expires")
+    return isinstance(expires, (int, float)) and not isinstance(expires, bool)
+
+
+class PersistentTTLCache:
+    """JSON-file backed cache whose entries expire after ttl_seconds."""
+
+    def __init__(self, filepath: Path, ttl_seconds: float = 300) -> None:
+        self.filepath = Path(filepath)
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+
+    def _read(self) -> Dict[str, Any]:
+        """Load the cache file; anything not shaped like an entry counts as absent."""
+        try:
+            with open(self.filepath) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return {k: v for k, v in data.items() if _is_entry(v)}
+
+    def _write(self, data: Dict[str, Any]) -> None:
+        try:
+            self.filepath.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.filepath.with_suffix(self.filepath.suffix + ".tmp")
+            with open(tmp, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp, self.filepath)
+        except OSError as e:
+            logger.debug(f"Could not write cache {self.filepath}: {e}")
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._read().get(key)
+        if entry is None or entry["expires"] < time.time():
+            return None
+        return entry.get("value")
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value under key for ttl_seconds."""
+        with self._lock:
+            data = self._read()
+            now = time.time()
+            data = {k: v for k, v in data.items() if v["expires"] >= now}
+            data[key] = {"expires": now + self.ttl_seconds, "value": value}
+            self._write(data)
+
+    def evict(self, key: str) -> None:
+        """Drop a single entry."""
+        with self._lock:
+            data = self._read()
+            if data.pop(key, None) is not None:
+                self._write(data)
@@ -0,0 +1,117 @@
+"""
+Shared fixtures for the FinOps AI test suite.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import pytest
+import yaml
+
+from finops_ai.core.base_manager import CloudProvider, OrphanedResource
+from finops_ai.core.graph_analyzer import ResourceGraph, ResourceNode
+from finops_ai.core.policy_engine import PolicyEngine
+
+# Minimal policy file shared by the YAML-loading tests
+_POLICY_YAML = """policies:
+  - name: test-policy
+    description: Delete old snapshots
+    resource_type: snapshot
+    condition: "age_days > 30"
+    action: delete
+    severity: high
+"""
+
+
+@pytest.fixture(scope="module")
+def base_resource() -> OrphanedResource:
+    """
+    A free, zero-age Azure snapshot built once per module.
+
+    Tests derive variants with dataclasses.replace and must not mutate it
+    or its tags/metadata in place.
+    """
+    return OrphanedResource(
+        provider=CloudProvider.AZURE,
+        resource_type="snapshot",
+        resource_id="/subscriptions/abc/resourceGroups/rg1/providers/Microsoft.Compute/snapshots/snap1",
+        name="test-snapshot",
+        region="eastus",
+        subscription_or_account="abc",
+        subscription_name="Test Sub",
+    )
+
+
+@pytest.fixture(scope="session")
+def corpus_graph() -> ResourceGraph:
+    """
+    Every graph shape the read-only graph tests query, built once per session.
+
+    vm-1 depends on disk-1 and nic-1, vm-2 on disk-1; snap-1 stands alone.
+    Tests that mutate a graph must deepcopy it or build their own.
+    """
+    graph = ResourceGraph()
+    for resource_id, resource_type in [("disk-1", "disk"), ("vm-1", "vm"), ("vm-2", "vm"),
+                                       ("nic-1", "nic"), ("snap-1", "snapshot")]:
+        graph.add_resource(ResourceNode(
+            resource_id=resource_id,
+            name=resource_id,
+            resource_type=resource_type,
+            provider="azure",
+            metadata={},
+        ))
+    for dependent_id, dependency_id in [("vm-1", "disk-1"), ("vm-2", "disk-1"), ("vm-1", "nic-1")]:
+        graph.add_dependency(dependent_id, dependency_id)
+    return graph
+
+
+@pytest.fixture(scope="session")
+def expected_policies() -> List[Dict[str, Any]]:
+    """_POLICY_YAML's policy entries, parsed once as the oracle for PolicyEngine.load."""
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(_POLICY_YAML, Loader=loader)["policies"]
+
+
+@pytest.fixture(scope="session")
+def policy_yaml_text() -> str:
+    """YAML source of a one-policy file."""
+    return _POLICY_YAML
+
+
+@pytest.fixture(scope="session")
+def yaml_policy_file(tmp_path_factory: pytest.TempPathFactory) -> Callable[[str], Path]:
+    """
+    Factory writing YAML text to a policy file, once per distinct content.
+
+    Files live under this worker's session temp dir, so xdist workers never
+    share them. Tests must not modify the returned files.
+    """
+    base = tmp_path_factory.mktemp("policies")
+    written: Dict[str, Path] = {}
+
+    def _make(content: str) -> Path:
+        path = written.get(content)
+        if path is None:
+            digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+            path = written[content] = base / f"{digest}.yaml"
+            path.write_text(content)
+        return path
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def policy_yaml_path(yaml_policy_file: Callable[[str], Path], policy_yaml_text: str) -> str:
+    """Path to policy_yaml_text on disk, written once per session."""
+    return str(yaml_policy_file(policy_yaml_text))
+
+
+@pytest.fixture(scope="module")
+def loaded_engine(policy_yaml_path: str) -> PolicyEngine:
+    """A PolicyEngine loaded from policy_yaml_path; tests must not add policies to it."""
+    engine = PolicyEngine()
+    engine.load(policy_yaml_path)
+    return engine
@@ -0,0 +1,697 @@
+"""
+Tests for the Azure resource managers.
+
+Uses unittest.mock to stand in for the Azure management clients so the
+scan logic can be exercised without real Azure credentials.
+"""
+
+from __future__ import annotations
+
+import gc
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, List
+from unittest.mock import MagicMock
+
+import pytest
+
+from finops_ai.providers.azure.client_registry import AzureClientRegistry
+from finops_ai.providers.azure.resource_id import parse_resource_id
+from finops_ai.providers.azure.retry import azure_retry, iter_paged
+from finops_ai.providers.azure.snapshot_manager import AzureSnapshotManager
+from finops_ai.providers.azure.storage_manager import AzureStorageManager
+from finops_ai.providers.azure.vm_manager import AzureVMManager
+from finops_ai.utils.ttl_cache import PersistentTTLCache
+
+
+# ── Helpers ─────────────────────────────────────────────────────────────
+
+
+def _pager(items: List[SimpleNamespace], page_size: int = 2) -> MagicMock:
+    """Stand-in for an azure.core ItemPaged serving items in fixed-size pages."""
+    pages = [iter(items[i:i + page_size]) for i in range(0, len(items), page_size)]
+    pager = MagicMock()
+    pager.by_page.return_value = iter(pages)
+    return pager
+
+
+def _snapshot(sub_id: str, name: str, source_disk: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=f"/subscriptions/{sub_id}/resourceGroups/rg1/providers/Microsoft.Compute/snapshots/{name}",
+        name=name,
+        location="eastus",
+        disk_size_gb=100,
+        time_created=None,
+        tags={"env": "dev"},
+        creation_data=SimpleNamespace(source_resource_id=source_disk),
+    )
+
+
+def _disk_id(sub_id: str, name: str) -> str:
+    return f"/subscriptions/{sub_id}/resourceGroups/rg1/providers/Microsoft.Compute/disks/{name}"
+
+
+def _vm(sub_id: str, name: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=f"/subscriptions/{sub_id}/resourceGroups/rg1/providers/Microsoft.Compute/virtualMachines/{name}",
+        name=name,
+        location="eastus",
+        time_created=None,
+        tags=None,
+        storage_profile=SimpleNamespace(os_disk=SimpleNamespace(disk_size_gb=128)),
+        hardware_profile=SimpleNamespace(vm_size="Standard_B2s"),
+    )
+
+
+def _instance_view(power_state: str) -> SimpleNamespace:
+    return SimpleNamespace(statuses=[
+        SimpleNamespace(code="ProvisioningState/succeeded"),
+        SimpleNamespace(code=f"PowerState/{power_state}"),
+    ])
+
+
+def _compute_client(
+    sub_id: str, snapshots: List[SimpleNamespace], existing_disks: List[str]
+) -> MagicMock:
+    client = MagicMock()
+    client.snapshots.list.return_value = _pager(snapshots)
+    client.disks.list.side_effect = lambda: _pager(
+        [SimpleNamespace(id=_disk_id(sub_id, name)) for name in existing_disks]
+    )
+
+    def _get_disk(resource_group: str, disk_name: str) -> SimpleNamespace:
+        if disk_name not in existing_disks:
+            raise Exception("ResourceNotFound")
+        return SimpleNamespace(name=disk_name)
+
+    client.disks.get.side_effect = _get_disk
+    return client
+
+
+# ── Fixtures ────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def snapshot_manager(tmp_path: Path) -> AzureSnapshotManager:
+    """Snapshot manager scanning two mocked subscriptions."""
+    manager = AzureSnapshotManager(credential=MagicMock())
+    manager._graph_client = None
+    manager._clients.disk_inventory_cache = PersistentTTLCache(tmp_path / "disks.json")
+    manager._iter_subscriptions = lambda: iter([  # type: ignore[method-assign]
+        {"id": "sub-a", "name": "Sub A"},
+        {"id": "sub-b", "name": "Sub B"},
+    ])
+    clients: Dict[str, MagicMock] = {
+        "sub-a": _compute_client(
+            "sub-a",
+            [
+                _snapshot("sub-a", "snap-live", _disk_id("sub-a", "disk-live")),
+                _snapshot("sub-a", "snap-orphan", _disk_id("sub-a", "disk-gone")),
+            ],
+            existing_disks=["disk-live"],
+        ),
+        "sub-b": _compute_client(
+            "sub-b",
+            [_snapshot("sub-b", "snap-orphan-b", _disk_id("sub-b", "disk-gone"))],
+            existing_disks=[],
+        ),
+    }
+    manager._clients._compute_clients.update(clients)
+    return manager
+
+
+@pytest.fixture
+def vm_manager() -> AzureVMManager:
+    """VM manager with one running and two stopped VMs."""
+    manager = AzureVMManager(credential=MagicMock(), zombie_days=0)
+    manager._iter_subscriptions = lambda: iter([  # type: ignore[method-assign]
+        {"id": "sub-a", "name": "Sub A"},
+    ])
+    states = {"vm-running": "running", "vm-stopped": "deallocated", "vm-stopped-2": "stopped"}
+    client = MagicMock()
+    client.virtual_machines.list_all.return_value = _pager([_vm("sub-a", n) for n in states])
+    client.virtual_machines.instance_view.side_effect = (
+        lambda rg, name: _instance_view(states[name])
+    )
+    manager._clients._compute_clients["sub-a"] = client
+    return manager
+
+
+@pytest.fixture
+def storage_manager() -> AzureStorageManager:
+    """Storage manager with one account holding system, stale and fresh containers."""
+    manager = AzureStorageManager(credential=MagicMock())
+    manager._iter_subscriptions = lambda: iter([  # type: ignore[method-assign]
+        {"id": "sub-a", "name": "Sub A"},
+    ])
+    now = datetime.now(timezone.utc)
+    account = SimpleNamespace(
+        id="/subscriptions/sub-a/resourceGroups/rg1/providers/Microsoft.Storage/storageAccounts/acct1",
+        name="acct1",
+        location="westus",
+        tags={"team": "data"},
+    )
+    client = MagicMock()
+    client.storage_accounts.list.return_value = _pager([account])
+    client.blob_containers.list.return_value = _pager([
+        SimpleNamespace(name="$logs", last_modified_time=now - timedelta(days=400)),
+        SimpleNamespace(name="stale", last_modified_time=now - timedelta(days=120)),
+        SimpleNamespace(name="fresh", last_modified_time=now - timedelta(days=5)),
+    ])
+    manager._clients._storage_clients["sub-a"] = client
+    monitor = MagicMock()
+    monitor.metrics.list_at_subscription_scope.return_value = SimpleNamespace(value=[])
+    manager._clients._monitor_clients["sub-a"] = monitor
+    return manager
+
+
+# ── Snapshot Manager Tests ──────────────────────────────────────────────
+
+
+class TestAzureSnapshotManagerScan:
+    """Tests for AzureSnapshotManager.scan across subscriptions."""
+
+    def test_collects_orphans_from_all_subscriptions(
+        self, snapshot_manager: AzureSnapshotManager
+    ) -> None:
+        result = snapshot_manager.scan()
+        names = sorted(r.name for r in result.resources)
+        assert names == ["snap-orphan", "snap-orphan-b"]
+        assert result.errors == []
+
+    def test_orphan_fields(self, snapshot_manager: AzureSnapshotManager) -> None:
+        result = snapshot_manager.scan()
+        orphan = next(r for r in result.resources if r.name == "snap-orphan")
+        assert orphan.subscription_or_account == "sub-a"
+        assert orphan.resource_group == "rg1"
+        assert orphan.source_resource_id == _disk_id("sub-a", "disk-gone")
+        assert orphan.estimated_monthly_cost == 5.0
+        assert orphan.tags == {"env": "dev"}
+
+    def test_subscription_error_is_reported(
+        self, snapshot_manager: AzureSnapshotManager
+    ) -> None:
+        snapshot_manager._clients._compute_clients["sub-b"].snapshots.list.side_effect = Exception("boom")
+        result = snapshot_manager.scan()
+        assert [r.name for r in result.resources] == ["snap-orphan"]
+        assert len(result.errors) == 1
+        assert "sub-b" in result.errors[0]
+
+    def test_checks_each_source_disk_once(
+        self, snapshot_manager: AzureSnapshotManager
+    ) -> None:
+        gone = _disk_id("sub-b", "disk-gone")
+        snapshot_manager._clients._compute_clients["sub-b"].snapshots.list.return_value = _pager(
+            [_snapshot("sub-b", f"snap-{i}", gone) for i in range(5)]
+        )
+        snapshot_manager._disk_exists = MagicMock(  # type: ignore[method-assign]
+            wraps=snapshot_manager._disk_exists
+        )
+
+        result = snapshot_manager.scan()
+
+        assert sum(r.subscription_or_account == "sub-b" for r in result.resources) == 5
+        checked = [c.args for c in snapshot_manager._disk_exists.call_args_list]
+        assert checked.count(("sub-b", gone)) == 1
+
+    def test_no_subscriptions(self, snapshot_manager: AzureSnapshotManager) -> None:
+        snapshot_manager._iter_subscriptions = lambda: iter([])  # type: ignore[method-assign]
+        result = snapshot_manager.scan()
+        assert result.total_count == 0
+
+
+class TestAzureSnapshotManagerParsing:
+    """Tests for resource-ID parsing in the snapshot manager."""
+
+    def test_non_disk_source_counts_as_missing(
+        self, snapshot_manager: AzureSnapshotManager
+    ) -> None:
+        blob_source = (
+            "/subscriptions/sub-a/resourceGroups/rg1/providers/"
+            "Microsoft.Storage/storageAccounts/acct1"
+        )
+        assert snapshot_manager._disk_exists("sub-a", blob_source) is False
+        snapshot_manager._clients._compute_clients["sub-a"].disks.get.assert_not_called()
+
+    def test_lowercase_disk_id_is_checked(
+        self, snapshot_manager: AzureSnapshotManager
+    ) -> None:
+        disk_id = "/subscriptions/sub-a/resourcegroups/rg1/providers/microsoft.compute/disks/disk-live"
+        assert snapshot_manager._disk_exists("sub-a", disk_id) is True
+
+    def test_delete_dry_run_parses_id(self, snapshot_manager: AzureSnapshotManager) -> None:
+        snap_id = _snapshot("sub-a", "snap-1", "").id
+        result = snapshot_manager.delete(snap_id, dry_run=True)
+        assert result.success is True
+        assert result.resource_name == "snap-1"
+
+    def test_delete_rejects_malformed_id(self, snapshot_manager: AzureSnapshotManager) -> None:
+        result = snapshot_manager.delete("not-a-resource-id", dry_run=True)
+        assert result.success is False
+        assert "Invalid resource ID" in result.error_message
+
+    def test_resource_id_parsing_ignores_case(self) -> None:
+        rid = parse_resource_id(
+            "/SUBSCRIPTIONS/sub-a/resourcegroups/rg1/providers/microsoft.compute/Disks/d1"
+        )
+        assert rid is not None
+        assert (rid.subscription_id, rid.resource_group, rid.name) == ("sub-a", "rg1", "d1")
+        assert rid.is_type("Microsoft.Compute", "disks")
+        assert parse_resource_id("/subscriptions/sub-a/resourceGroups/rg1") is None
+
+
+class TestAzureDiskInventory:
+    """Tests for the listed and persisted disk inventory."""
+
+    def test_disks_listed_once_per_subscription(
+        self, snapshot_manager: AzureSnapshotManager
+    ) -> None:
+        snapshot_manager.scan()
+        client = snapshot_manager._clients._compute_clients["sub-a"]
+        client.disks.list.assert_called_once()
+        client.disks.get.assert_not_called()
+
+    def test_inventory_persists_across_runs(
+        self, snapshot_manager: AzureSnapshotManager
+    ) -> None:
+        snapshot_manager.scan()
+        cache = snapshot_manager._clients.disk_inventory_cache
+        assert cache.get("disks:sub-a") == [_disk_id("sub-a", "disk-live").lower()]
+
+        # A fresh registry (next process) reads the cached inventory instead of listing
+        registry = AzureClientRegistry(MagicMock())
+        registry.disk_inventory_cache = cache
+        registry._compute_clients["sub-a"] = MagicMock()
+        disk_ids, from_cache = registry.get_disk_inventory("sub-a")
+        assert from_cache is True
+        assert _disk_id("sub-a", "disk-live").lower() in disk_ids
+        registry._compute_clients["sub-a"].disks.list.assert_not_called()
+
+    def test_stale_inventory_is_confirmed(
+        self, snapshot_manager: AzureSnapshotManager
+    ) -> None:
+        snapshot_manager._clients.disk_inventory_cache.set("disks:sub-a", [])
+        assert snapshot_manager._disk_exists("sub-a", _disk_id("sub-a", "disk-live")) is True
+        assert snapshot_manager._disk_exists("sub-a", _disk_id("sub-a", "disk-gone")) is False
+        assert snapshot_manager._clients._compute_clients["sub-a"].disks.get.call_count == 2
+
+    def test_evict_clears_persisted_inventory(
+        self, snapshot_manager: AzureSnapshotManager
+    ) -> None:
+        registry = snapshot_manager._clients
+        snapshot_manager.scan()
+        registry.evict_disk_inventory("sub-a")
+        assert registry.disk_inventory_cache.get("disks:sub-a") is None
+        assert registry.disk_inventory_cache.get("disks:sub-b") is not None
+
+    def test_each_scan_starts_with_fresh_lookups(
+        self, snapshot_manager: AzureSnapshotManager
+    ) -> None:
+        clients = snapshot_manager._clients._compute_clients
+        assert "snap-orphan" in {r.name for r in snapshot_manager.scan().resources}
+
+        # disk-gone reappears; once the persisted inventory expires the next scan sees it
+        sub_a = clients["sub-a"] = _compute_client(
+            "sub-a",
+            [_snapshot("sub-a", "snap-orphan", _disk_id("sub-a", "disk-gone"))],
+            existing_disks=["disk-gone"],
+        )
+        clients["sub-b"].snapshots.list.return_value = _pager([])
+        snapshot_manager._clients.evict_disk_inventory("sub-a")
+
+        assert snapshot_manager.scan().resources == []
+        sub_a.disks.list.assert_called_once()
+
+
+class TestPersistentTTLCache:
+    """Tests for the JSON-backed TTL cache."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        cache = PersistentTTLCache(tmp_path / "c.json")
+        cache.set("k", [1, 2])
+        assert PersistentTTLCache(tmp_path / "c.json").get("k") == [1, 2]
+
+    def test_expired_entry_is_missing(self, tmp_path: Path) -> None:
+        cache = PersistentTTLCache(tmp_path / "c.json", ttl_seconds=-1)
+        cache.set("k", "v")
+        assert cache.get("k") is None
+
+    def test_corrupt_file_is_ignored(self, tmp_path: Path) -> None:
+        path = tmp_path / "c.json"
+        path.write_text("{not json")
+        cache = PersistentTTLCache(path)
+        assert cache.get("k") is None
+        cache.set("k", "v")
+        assert cache.get("k") == "v"
+
+    @pytest.mark.parametrize("content", [
+        '[1, 2]',
+        '{"k": "stale"}',
+        '{"k": 42, "other": [1]}',
+        '{"k": {"expires": "soon", "value": 1}}',
+    ])
+    def test_misshapen_json_is_a_miss(self, tmp_path: Path, content: str) -> None:
+        path = tmp_path / "c.json"
+        path.write_text(content)
+        cache = PersistentTTLCache(path)
+        assert cache.get("k") is None
+        cache.set("k", "v")
+        assert cache.get("k") == "v"
+
+
+class TestAzureSnapshotManagerGraph:
+    """Tests for the Resource Graph orphan query path."""
+
+    def _graph_row(self, name: str) -> Dict[str, object]:
+        return {
+            "id": f"/subscriptions/sub-a/resourceGroups/rg1/providers/Microsoft.Compute/snapshots/{name}",
+            "name": name,
+            "location": "eastus",
+            "resourceGroup": "rg1",
+            "tags": None,
+            "diskSizeGB": 200,
+            "timeCreated": "2024-01-01T00:00:00.1234567+00:00",
+            "sourceResourceId": _disk_id("sub-a", "disk-gone"),
+        }
+
+    def test_pages_through_graph_results(
+        self, snapshot_manager: AzureSnapshotManager
+    ) -> None:
+        graph = MagicMock()
+        graph.resources.side_effect = [
+            SimpleNamespace(data=[self._graph_row("snap-1")], skip_token="next"),
+            SimpleNamespace(data=[self._graph_row("snap-2")], skip_token=None),
+        ]
+        snapshot_manager._graph_client = graph
+        snapshot_manager._iter_subscriptions = lambda: iter([  # type: ignore[method-assign]
+            {"id": "sub-a", "name": "Sub A"},
+        ])
+
+        result = snapshot_manager.scan()
+
+        assert [r.name for r in result.resources] == ["snap-1", "snap-2"]
+        assert graph.resources.call_args_list[1].args[0].options.skip_token == "next"
+        snap = result.resources[0]
+        assert snap.estimated_monthly_cost == 10.0
+        assert snap.created_time == "2024-01-01 00:00:00 UTC"
+        assert snap.tags == {}
+        snapshot_manager._clients._compute_clients["sub-a"].snapshots.list.assert_not_called()
+
+    def test_falls_back_when_graph_fails(
+        self, snapshot_manager: AzureSnapshotManager
+    ) -> None:
+        graph = MagicMock()
+        graph.resources.side_effect = Exception("query rejected")
+        snapshot_manager._graph_client = graph
+
+        result = snapshot_manager.scan()
+
+        assert sorted(r.name for r in result.resources) == ["snap-orphan", "snap-orphan-b"]
+        assert result.errors == []
+
+
+# ── VM Manager Tests ────────────────────────────────────────────────────
+
+
+class TestAzureVMManagerScan:
+    """Tests for AzureVMManager.scan power-state detection."""
+
+    def test_reports_only_stopped_vms(self, vm_manager: AzureVMManager) -> None:
+        result = vm_manager.scan()
+        assert sorted(r.name for r in result.resources) == ["vm-stopped", "vm-stopped-2"]
+
+    def test_zombie_metadata(self, vm_manager: AzureVMManager) -> None:
+        result = vm_manager.scan()
+        vm = next(r for r in result.resources if r.name == "vm-stopped")
+        assert vm.metadata["power_state"] == "deallocated"
+        assert vm.metadata["vm_size"] == "Standard_B2s"
+        assert vm.size_gb == 128
+
+    def test_uses_inline_instance_view(self, vm_manager: AzureVMManager) -> None:
+        client = vm_manager._clients._compute_clients["sub-a"]
+        vms = [_vm("sub-a", "vm-inline")]
+        vms[0].instance_view = _instance_view("deallocated")
+        client.virtual_machines.list_all.return_value = _pager(vms)
+
+        result = vm_manager.scan()
+
+        client.virtual_machines.list_all.assert_called_once_with(status_only="true")
+        client.virtual_machines.instance_view.assert_not_called()
+        assert [r.name for r in result.resources] == ["vm-inline"]
+
+    def test_skips_instance_view_for_young_vms(self, vm_manager: AzureVMManager) -> None:
+        client = vm_manager._clients._compute_clients["sub-a"]
+        now = datetime.now(timezone.utc)
+        young, old = _vm("sub-a", "vm-stopped"), _vm("sub-a", "vm-stopped-2")
+        young.time_created = now - timedelta(days=5)
+        old.time_created = now - timedelta(days=60)
+        client.virtual_machines.list_all.return_value = _pager([young, old])
+        vm_manager.zombie_days = 30
+
+        result = vm_manager.scan()
+
+        client.virtual_machines.instance_view.assert_called_once_with("rg1", "vm-stopped-2")
+        assert [r.name for r in result.resources] == ["vm-stopped-2"]
+
+
+# ── Storage Manager Tests ───────────────────────────────────────────────
+
+
+class TestAzureStorageManagerScan:
+    """Tests for AzureStorageManager.scan container filtering."""
+
+    def test_reports_only_stale_user_containers(
+        self, storage_manager: AzureStorageManager
+    ) -> None:
+        result = storage_manager.scan()
+        assert [r.name for r in result.resources] == ["acct1/stale"]
+
+    def test_container_inherits_account_fields(
+        self, storage_manager: AzureStorageManager
+    ) -> None:
+        container = storage_manager.scan().resources[0]
+        assert container.resource_group == "rg1"
+        assert container.region == "westus"
+        assert container.tags == {"team": "data"}
+        assert container.age_days == 120
+
+    def _container_counts(self, counts: Dict[str, float]) -> SimpleNamespace:
+        """Subscription-scope metrics response with one ContainerCount series per account."""
+        return SimpleNamespace(value=[SimpleNamespace(timeseries=[
+            SimpleNamespace(
+                metadatavalues=[SimpleNamespace(
+                    name=SimpleNamespace(value="Microsoft.ResourceId"),
+                    value=f"{account_id}/blobServices/default",
+                )],
+                data=[SimpleNamespace(average=3.0), SimpleNamespace(average=count)],
+            )
+            for account_id, count in counts.items()
+        ])])
+
+    def test_skips_accounts_without_containers(
+        self, storage_manager: AzureStorageManager
+    ) -> None:
+        account_id = "/subscriptions/sub-a/resourceGroups/rg1/providers/Microsoft.Storage/storageAccounts/acct1"
+        monitor = storage_manager._clients._monitor_clients["sub-a"]
+        monitor.metrics.list_at_subscription_scope.return_value = self._container_counts(
+            {account_id.lower(): 0.0}
+        )
+
+        result = storage_manager.scan()
+
+        assert result.resources == []
+        storage_manager._clients._storage_clients["sub-a"].blob_containers.list.assert_not_called()
+        assert monitor.metrics.list_at_subscription_scope.call_args.args == ("westus",)
+
+    def test_metrics_failure_scans_every_account(
+        self, storage_manager: AzureStorageManager
+    ) -> None:
+        monitor = storage_manager._clients._monitor_clients["sub-a"]
+        monitor.metrics.list_at_subscription_scope.side_effect = Exception("forbidden")
+        result = storage_manager.scan()
+        assert [r.name for r in result.resources] == ["acct1/stale"]
+
+
+# ── Bulk Delete Tests ───────────────────────────────────────────────────
+
+
+class TestAzureBulkDelete:
+    """Tests for delete_many fan-out on snapshots and VMs."""
+
+    def _poller(self, events: List[str], name: str, error: str = "") -> MagicMock:
+        poller = MagicMock()
+        poller.done.return_value = True
+
+        def _result(timeout: float) -> None:
+            events.append(f"wait:{name}")
+            if error:
+                raise Exception(error)
+
+        poller.result.side_effect = _result
+        return poller
+
+    def test_starts_all_snapshot_deletes_before_waiting(
+        self, snapshot_manager: AzureSnapshotManager
+    ) -> None:
+        events: List[str] = []
+        client = snapshot_manager._clients._compute_clients["sub-a"]
+
+        def _begin(rg: str, name: str) -> MagicMock:
+            events.append(f"begin:{name}")
+            return self._poller(events, name, error="conflict" if name == "snap-2" else "")
+
+        client.snapshots.begin_delete.side_effect = _begin
+        ids = [_snapshot("sub-a", n, "").id for n in ("snap-1", "snap-2")]
+
+        results = snapshot_manager.delete_many(ids + ["bad-id"], dry_run=False)
+
+        assert events[:2] == ["begin:snap-1", "begin:snap-2"]
+        assert [r.resource_name for r in results] == ["snap-1", "snap-2", "unknown"]
+        assert [r.success for r in results] == [True, False, False]
+        assert results[1].error_message == "conflict"
+
+    def test_vm_begin_failure_is_reported(self, vm_manager: AzureVMManager) -> None:
+        events: List[str] = []
+        client = vm_manager._clients._compute_clients["sub-a"]
+        client.virtual_machines.begin_delete.side_effect = [
+            Exception("forbidden"),
+            self._poller(events, "vm-2"),
+        ]
+        ids = [_vm("sub-a", n).id for n in ("vm-1", "vm-2")]
+
+        results = vm_manager.delete_many(ids, dry_run=False)
+
+        assert [(r.resource_name, r.success) for r in results] == [("vm-1", False), ("vm-2", True)]
+        assert events == ["wait:vm-2"]
+
+    def test_vm_ids_parsed_case_insensitively(self, vm_manager: AzureVMManager) -> None:
+        client = vm_manager._clients._compute_clients["sub-a"]
+        client.virtual_machines.begin_delete.return_value = self._poller([], "vm-1")
+        vm_id = _vm("sub-a", "vm-1").id.replace("resourceGroups", "resourcegroups")
+
+        results = vm_manager.delete_many([vm_id, "bad-id"], dry_run=False)
+
+        client.virtual_machines.begin_delete.assert_called_once_with("rg1", "vm-1")
+        assert [(r.resource_name, r.success) for r in results] == [
+            ("vm-1", True), ("unknown", False),
+        ]
+
+    def test_dry_run_starts_nothing(self, vm_manager: AzureVMManager) -> None:
+        results = vm_manager.delete_many([_vm("sub-a", "vm-1").id], dry_run=True)
+        assert results[0].dry_run is True
+        vm_manager._clients._compute_clients["sub-a"].virtual_machines.begin_delete.assert_not_called()
+
+
+# ── Subscription Enumeration Tests ──────────────────────────────────────
+
+
+class TestIterSubscriptions:
+    """Tests for the lazy subscription generator."""
+
+    def test_specific_subscription(self) -> None:
+        manager = AzureSnapshotManager(credential=MagicMock(), subscription_id="sub-x")
+        manager._clients._subscription_client = MagicMock()
+        manager._clients._subscription_client.subscriptions.get.return_value = SimpleNamespace(
+            subscription_id="sub-x", display_name="Sub X"
+        )
+        assert list(manager._iter_subscriptions()) == [{"id": "sub-x", "name": "Sub X"}]
+        manager._clients._subscription_client.subscriptions.list.assert_not_called()
+
+    def test_is_lazy(self) -> None:
+        manager = AzureSnapshotManager(credential=MagicMock())
+        manager._clients._subscription_client = MagicMock()
+        manager._clients._subscription_client.subscriptions.list.return_value = iter([
+            SimpleNamespace(subscription_id="sub-a", display_name="Sub A"),
+            SimpleNamespace(subscription_id="sub-b", display_name="Sub B"),
+        ])
+        subs = manager._iter_subscriptions()
+        assert next(subs) == {"id": "sub-a", "name": "Sub A"}
+        assert next(subs) == {"id": "sub-b", "name": "Sub B"}
+
+
+# ── Client Registry Tests ───────────────────────────────────────────────
+
+
+class TestAzureClientRegistry:
+    """Tests for client sharing across managers."""
+
+    def test_managers_share_registry_per_credential(self) -> None:
+        credential = MagicMock()
+        snapshots = AzureSnapshotManager(credential=credential)
+        vms = AzureVMManager(credential=credential)
+        other = AzureVMManager(credential=MagicMock())
+        assert snapshots._clients is vms._clients
+        assert other._clients is not vms._clients
+
+    def test_registry_released_with_last_manager(self) -> None:
+        credential = MagicMock()
+        manager = AzureVMManager(credential=credential)
+        assert credential in AzureClientRegistry._registries
+
+        del manager
+        gc.collect()
+        assert credential not in AzureClientRegistry._registries
+
+    def test_compute_client_built_once(self) -> None:
+        registry = AzureClientRegistry(MagicMock())
+        assert registry.get_compute_client("sub-a") is registry.get_compute_client("sub-a")
+
+    def test_subscriptions_listed_on_every_call(self) -> None:
+        registry = AzureClientRegistry(MagicMock())
+        registry._subscription_client = MagicMock()
+        registry._subscription_client.subscriptions.list.side_effect = lambda: iter([
+            SimpleNamespace(subscription_id="sub-a", display_name="Sub A"),
+        ])
+        first = list(registry.iter_subscriptions())
+        second = list(registry.iter_subscriptions())
+        assert first == second == [{"id": "sub-a", "name": "Sub A"}]
+        assert registry._subscription_client.subscriptions.list.call_count == 2
+
+
+# ── Retry Tests ─────────────────────────────────────────────────────────
+
+
+class _HttpError(Exception):
+    def __init__(self, status_code: int, retry_after: str = "") -> None:
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        headers = {"Retry-After": retry_after} if retry_after else {}
+        self.response = SimpleNamespace(headers=headers)
+
+
+class TestAzureRetry:
+    """Tests for the azure_retry throttling helper."""
+
+    def test_retries_throttled_call(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        sleeps: List[float] = []
+        monkeypatch.setattr("finops_ai.providers.azure.retry.time.sleep", sleeps.append)
+        func = MagicMock(side_effect=[_HttpError(429, retry_after="7"), _HttpError(503), "ok"])
+
+        assert azure_retry(func, "rg", max_tries=5) == "ok"
+        assert func.call_count == 3
+        assert sleeps == [7.0, 4.0]
+
+    def test_non_retryable_error_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("finops_ai.providers.azure.retry.time.sleep", lambda s: None)
+        func = MagicMock(side_effect=_HttpError(404))
+        with pytest.raises(_HttpError):
+            azure_retry(func)
+        assert func.call_count == 1
+
+    def test_gives_up_after_max_tries(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("finops_ai.providers.azure.retry.time.sleep", lambda s: None)
+        func = MagicMock(side_effect=_HttpError(429))
+        with pytest.raises(_HttpError):
+            azure_retry(func, max_tries=3)
+        assert func.call_count == 3
+
+    def test_iter_paged_retries_single_page(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("finops_ai.providers.azure.retry.time.sleep", lambda s: None)
+        pages = MagicMock()
+        pages.__next__.side_effect = [iter([1, 2]), _HttpError(429), iter([3]), StopIteration]
+        pager = MagicMock()
+        pager.by_page.return_value = pages
+
+        assert list(iter_paged(lambda: pager)) == [1, 2, 3]
+        pager.by_page.assert_called_once_with()
@@ -4,8 +4,16 @@ Unit tests for FinOps AI core components.
 
 from __future__ import annotations
 
+import asyncio
+import sys
+from bisect import bisect_right
+from dataclasses import replace
+from types import SimpleNamespace
+from typing import Callable, List
+
 import pytest
 from finops_ai.core.base_manager import (
+    BaseResourceManager,
     CloudProvider,
     DeleteResult,
     OrphanedResource,
@@ -15,53 +23,63 @@ from finops_ai.core.base_manager import (
 )
 from finops_ai.utils.cost_calculator import CostCalculator
 
+# Module-scoped fixtures are built once per worker, so keep the module together
+pytestmark = pytest.mark.xdist_group(name="core")
 
-# ── OrphanedResource Tests ─────────────────────────────────────────────────────
-
-
-class TestOrphanedResource:
-    """Test the OrphanedResource dataclass."""
 
-    def _make_resource(self, **kwargs):
-        defaults = dict(
-            provider=CloudProvider.AZURE,
-            resource_type="snapshot",
-            resource_id="/subscriptions/abc/resourceGroups/rg1/providers/Microsoft.Compute/snapshots/snap1",
-            name="test-snapshot",
-            region="eastus",
-            subscription_or_account="abc",
-            subscription_name="Test Sub",
-        )
-        defaults.update(kwargs)
-        return OrphanedResource(**defaults)
+# Column layout of the summary fixtures: providers[i] owns costs[i]
+_SUMMARY_PROVIDERS = ["azure", "azure", "aws"]
+_SUMMARY_COSTS = [10.0, 20.0, 15.0]
 
-    def test_default_severity_low(self):
-        r = self._make_resource(estimated_monthly_cost=5.0)
-        assert r.severity == Severity.LOW
 
-    def test_severity_medium(self):
-        r = self._make_resource(estimated_monthly_cost=25.0)
-        assert r.severity == Severity.MEDIUM
+@pytest.fixture(scope="module")
+def summary_resources(base_resource: OrphanedResource) -> List[OrphanedResource]:
+    """Real resources built from the summary columns, once per module."""
+    return [
+        replace(base_resource, provider=CloudProvider(provider), estimated_monthly_cost=cost)
+        for provider, cost in zip(_SUMMARY_PROVIDERS, _SUMMARY_COSTS)
+    ]
 
-    def test_severity_high(self):
-        r = self._make_resource(estimated_monthly_cost=60.0)
-        assert r.severity == Severity.HIGH
 
-    def test_severity_critical(self):
-        r = self._make_resource(estimated_monthly_cost=150.0)
-        assert r.severity == Severity.CRITICAL
+# ── OrphanedResource Tests ─────────────────────────────────────────────────────
 
-    def test_default_status(self):
-        r = self._make_resource()
-        assert r.status == ResourceStatus.ORPHANED
 
-    def test_tags_default_empty(self):
-        r = self._make_resource()
-        assert r.tags == {}
+class TestOrphanedResource:
+    """Test the OrphanedResource dataclass."""
 
-    def test_dependent_resources_default_empty(self):
-        r = self._make_resource()
-        assert r.dependent_resources == []
+    @pytest.mark.parametrize("cost,expected", [
+        (0.0, Severity.INFO),
+        (5.0, Severity.LOW),
+        (25.0, Severity.MEDIUM),
+        (60.0, Severity.HIGH),
+        (150.0, Severity.CRITICAL),
+    ])
+    def test_severity(self, base_resource: OrphanedResource, cost: float,
+                      expected: Severity) -> None:
+        assert replace(base_resource, estimated_monthly_cost=cost).severity == expected
+
+    def test_severity_band_edges(self, base_resource: OrphanedResource) -> None:
+        # Independent restatement of the bands: <10 LOW, <50 MEDIUM, <100 HIGH, else CRITICAL
+        edges = [10.0, 50.0, 100.0]
+        bands = [Severity.LOW, Severity.MEDIUM, Severity.HIGH, Severity.CRITICAL]
+        costs = [0.01, 9.99, 10.0, 49.99, 50.0, 99.99, 100.0, 1000.0]
+        expected = [bands[bisect_right(edges, cost)] for cost in costs]
+        actual = [replace(base_resource, estimated_monthly_cost=c).severity for c in costs]
+        assert actual == expected
+
+    @pytest.mark.parametrize("cost", [-1.0, float("nan")])
+    def test_non_positive_cost_is_info(self, base_resource: OrphanedResource,
+                                       cost: float) -> None:
+        assert replace(base_resource, estimated_monthly_cost=cost).severity == Severity.INFO
+
+    def test_default_status(self, base_resource: OrphanedResource) -> None:
+        assert base_resource.status == ResourceStatus.ORPHANED
+
+    def test_tags_default_empty(self, base_resource: OrphanedResource) -> None:
+        assert base_resource.tags == {}
+
+    def test_dependent_resources_default_empty(self, base_resource: OrphanedResource) -> None:
+        assert base_resource.dependent_resources == []
 
 
 # ── CostCalculator Tests ──────────────────────────────────────────────────────
@@ -70,67 +88,82 @@ class TestOrphanedResource:
 class TestCostCalculator:
     """Test the CostCalculator."""
 
-    def test_azure_snapshot_cost(self):
-        cost = CostCalculator.azure_snapshot(100)
-        assert cost == 5.0  # 100 * 0.05
-
-    def test_azure_disk_standard_hdd(self):
-        cost = CostCalculator.azure_disk(100, "standard_hdd")
-        assert cost == 4.0  # 100 * 0.04
-
-    def test_azure_disk_premium_ssd(self):
-        cost = CostCalculator.azure_disk(100, "premium_ssd")
-        assert cost == 13.2  # 100 * 0.132
-
-    def test_azure_public_ip(self):
-        assert CostCalculator.azure_public_ip() == 3.65
-
-    def test_azure_load_balancer_standard(self):
-        assert CostCalculator.azure_load_balancer(standard=True) == 18.25
-
-    def test_azure_load_balancer_basic(self):
-        assert CostCalculator.azure_load_balancer(standard=False) == 0.0
-
-    def test_aws_ebs_gp3(self):
-        cost = CostCalculator.aws_ebs_volume(100, "gp3")
-        assert cost == 8.0  # 100 * 0.08
-
-    def test_aws_snapshot(self):
-        cost = CostCalculator.aws_snapshot(100)
-        assert cost == 5.0  # 100 * 0.05
-
-    def test_aws_elastic_ip(self):
-        assert CostCalculator.aws_elastic_ip() == 3.65
-
-    def test_gcp_disk_pd_standard(self):
-        cost = CostCalculator.gcp_disk(100, "pd-standard")
-        assert cost == 4.0  # 100 * 0.04
-
-    def test_gcp_snapshot(self):
-        cost = CostCalculator.gcp_snapshot(100)
-        assert cost == 2.6  # 100 * 0.026
-
-    def test_gcp_static_ip(self):
-        assert CostCalculator.gcp_static_ip() == 7.30
-
-    def test_total_savings_summary(self):
-        resources = [
-            self._mock_resource("azure", 10.0),
-            self._mock_resource("azure", 20.0),
-            self._mock_resource("aws", 15.0),
+    def test_per_gb_rates(self):
+        # All size-based prices at 100 GB, checked in one comparison
+        actual = [
+            CostCalculator.azure_snapshot(100),
+            CostCalculator.azure_disk(100, "standard_hdd"),
+            CostCalculator.azure_disk(100, "premium_ssd"),
+            CostCalculator.aws_ebs_volume(100, "gp3"),
+            CostCalculator.aws_snapshot(100),
+            CostCalculator.gcp_disk(100, "pd-standard"),
+            CostCalculator.gcp_snapshot(100),
         ]
-        summary = CostCalculator.total_savings_summary(resources)
+        assert actual == [5.0, 4.0, 13.2, 8.0, 5.0, 4.0, 2.6]
+
+    @pytest.mark.parametrize("fn,expected", [
+        (CostCalculator.azure_public_ip, 3.65),
+        (lambda: CostCalculator.azure_load_balancer(standard=True), 18.25),
+        (lambda: CostCalculator.azure_load_balancer(standard=False), 0.0),
+        (CostCalculator.aws_elastic_ip, 3.65),
+        (CostCalculator.gcp_static_ip, 7.30),
+    ])
+    def test_fixed_monthly_costs(self, fn: Callable[[], float], expected: float) -> None:
+        assert fn() == expected
+
+    def test_disk_tier_lookup_is_case_insensitive(self):
+        assert CostCalculator.azure_disk(100, "Premium_SSD") == 13.2
+        assert CostCalculator.aws_ebs_volume(100, "GP2") == 10.0
+        assert CostCalculator.gcp_disk(100, "PD-SSD") == 17.0
+
+    def test_unknown_disk_tier_uses_default_rate(self):
+        assert CostCalculator.azure_disk(100, "mystery") == 4.0
+        assert CostCalculator.aws_ebs_volume(100, "mystery") == 8.0
+        assert CostCalculator.gcp_disk(100, "mystery") == 4.0
+
+    def test_total_savings_summary(self, summary_resources: List[OrphanedResource]) -> None:
+        summary = CostCalculator.total_savings_summary(summary_resources)
         assert summary["monthly_savings"] == 45.0
         assert summary["annual_savings"] == 540.0
         assert summary["by_provider"]["azure"] == 30.0
         assert summary["by_provider"]["aws"] == 15.0
 
-    def _mock_resource(self, provider: str, cost: float):
-        """Create a mock resource for testing."""
-        from types import SimpleNamespace
-        return SimpleNamespace(
-            provider=SimpleNamespace(value=provider),
-            estimated_monthly_cost=cost,
+    @pytest.mark.parametrize("numpy_available", [True, False])
+    def test_savings_summary_from_columns_matches_resource_api(
+        self, monkeypatch: pytest.MonkeyPatch, numpy_available: bool,
+        summary_resources: List[OrphanedResource],
+    ) -> None:
+        if not numpy_available:
+            monkeypatch.setitem(sys.modules, "numpy", None)
+        summary = CostCalculator.savings_summary(_SUMMARY_COSTS, _SUMMARY_PROVIDERS)
+        assert summary == CostCalculator.total_savings_summary(summary_resources)
+        assert CostCalculator.savings_summary([], []) == {
+            "monthly_savings": 0.0, "annual_savings": 0.0, "by_provider": {},
+        }
+
+    def test_savings_summary_rejects_misaligned_columns(self):
+        with pytest.raises(ValueError):
+            CostCalculator.savings_summary([1.0, 2.0], ["aws"])
+
+    def test_total_savings_summary_merges_enum_and_plain_providers(self):
+        resources = [
+            SimpleNamespace(provider=CloudProvider.AZURE, estimated_monthly_cost=10.0),
+            SimpleNamespace(provider="azure", estimated_monthly_cost=2.5),
+            SimpleNamespace(provider=CloudProvider.GCP, estimated_monthly_cost=1.25),
+        ]
+        summary = CostCalculator.total_savings_summary(resources)
+        assert summary["monthly_savings"] == 13.75
+        assert summary["by_provider"] == {"azure": 12.5, "gcp": 1.25}
+
+    def test_total_savings_summary_accepts_one_shot_iterator(
+        self, summary_resources: List[OrphanedResource]
+    ) -> None:
+        resources = (
+            SimpleNamespace(provider=CloudProvider(provider), estimated_monthly_cost=cost)
+            for provider, cost in zip(_SUMMARY_PROVIDERS, _SUMMARY_COSTS)
+        )
+        assert CostCalculator.total_savings_summary(resources) == (
+            CostCalculator.total_savings_summary(summary_resources)
         )
 
 
@@ -184,3 +217,47 @@ class TestDeleteResult:
         )
         assert result.success is False
         assert result.error_message == "Permission denied"
+
+
+# ── BaseResourceManager Tests ─────────────────────────────────────────────────
+
+
+class _StubManager(BaseResourceManager):
+    """Minimal concrete manager returning a fixed resource type."""
+
+    def __init__(self, resource_type: str) -> None:
+        self._resource_type = resource_type
+
+    @property
+    def provider(self) -> CloudProvider:
+        return CloudProvider.AZURE
+
+    @property
+    def resource_type(self) -> str:
+        return self._resource_type
+
+    def scan(self) -> ScanResult:
+        return self.get_scan_result([])
+
+    def delete(self, resource_id: str, dry_run: bool = True) -> DeleteResult:
+        return DeleteResult(resource_id=resource_id, resource_name="", success=True, dry_run=dry_run)
+
+    def estimate_cost(self, resource: OrphanedResource) -> float:
+        return 0.0
+
+
+class TestBaseResourceManager:
+    """Test the BaseResourceManager helpers."""
+
+    def test_scan_async_gathers_managers(self):
+        async def run():
+            managers = [_StubManager("snapshot"), _StubManager("vm")]
+            return await asyncio.gather(*(m.scan_async() for m in managers))
+
+        results = asyncio.run(run())
+        assert [r.resource_type for r in results] == ["snapshot", "vm"]
+
+    def test_delete_many_preserves_order(self):
+        results = _StubManager("snapshot").delete_many(["a", "b", "c"], dry_run=True)
+        assert [r.resource_id for r in results] == ["a", "b", "c"]
+        assert all(r.dry_run for r in results)
@@ -0,0 +1,422 @@
+"""
+Tests for the GCP resource managers.
+
+Uses unittest.mock to stand in for the google-cloud clients so the scan
+logic can be exercised without real GCP credentials.
+"""
+
+from __future__ import annotations
+
+import gc
+import time
+from types import MappingProxyType, SimpleNamespace
+from typing import Dict, Iterator, List
+from unittest.mock import MagicMock
+
+import pytest
+from google.auth.credentials import AnonymousCredentials
+
+from finops_ai.providers.gcp.client_registry import GCPClientRegistry
+from finops_ai.providers.gcp.compute_manager import GCPComputeManager
+from finops_ai.providers.gcp.labels import labels_of
+from finops_ai.providers.gcp.network_manager import GCPNetworkManager
+from finops_ai.providers.gcp.paging import prefetch
+from finops_ai.providers.gcp.storage_manager import GCPStorageManager
+
+
+# ── Helpers ─────────────────────────────────────────────────────────────
+
+
+def _disk_link(zone: str, name: str) -> str:
+    return f"https://www.googleapis.com/compute/v1/projects/proj/zones/{zone}/disks/{name}"
+
+
+def _disk(zone: str, name: str, users: List[str]) -> SimpleNamespace:
+    return SimpleNamespace(
+        name=name,
+        self_link=_disk_link(zone, name),
+        users=users,
+        size_gb=50,
+        type=f"projects/proj/zones/{zone}/diskTypes/pd-ssd",
+        labels={"team": "data"},
+    )
+
+
+def _instance(name: str, status: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        name=name,
+        status=status,
+        labels={},
+        machine_type="zones/us-central1-a/machineTypes/e2-small",
+    )
+
+
+# ── Fixtures ────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def compute_manager() -> GCPComputeManager:
+    """Compute manager filtered to two of the project's zones, with mocked GCP clients."""
+    manager = GCPComputeManager("proj", credentials=AnonymousCredentials(),
+                                zones=["us-central1-a", "europe-west1-b"])
+    disks = {
+        "us-central1-a": [_disk("us-central1-a", "disk-live", users=["vm-1"]),
+                          _disk("us-central1-a", "disk-free", users=[])],
+        "europe-west1-b": [_disk("europe-west1-b", "disk-free-eu", users=[])],
+    }
+    instances = {
+        "us-central1-a": [_instance("vm-1", "RUNNING")],
+        "europe-west1-b": [_instance("vm-eu", "TERMINATED")],
+    }
+    manager._disks_client = MagicMock()
+    manager._disks_client.aggregated_list.side_effect = lambda project: [
+        (f"zones/{zone}", SimpleNamespace(disks=zone_disks)) for zone, zone_disks in disks.items()
+    ] + [
+        ("zones/asia-east1-a", SimpleNamespace(disks=[_disk("asia-east1-a", "disk-asia", [])])),
+        ("regions/us-central1", SimpleNamespace(disks=[_disk("us-central1", "disk-regional", [])])),
+    ]
+    manager._instances_client = MagicMock()
+    manager._instances_client.aggregated_list.side_effect = lambda project: [
+        (f"zones/{zone}", SimpleNamespace(instances=vms)) for zone, vms in instances.items()
+    ] + [("zones/asia-east1-a", SimpleNamespace(instances=[_instance("vm-asia", "TERMINATED")]))]
+    manager._snapshots_client = MagicMock()
+    manager._snapshots_client.list.return_value = []
+    return manager
+
+
+# ── Client Registry Tests ───────────────────────────────────────────────
+
+
+class TestGCPClientRegistry:
+    """Tests for sharing compute_v1 clients across managers."""
+
+    def test_managers_share_clients_per_credentials(self) -> None:
+        credentials = AnonymousCredentials()
+        first = GCPComputeManager("proj-a", credentials=credentials)
+        second = GCPComputeManager("proj-b", credentials=credentials)
+        network = GCPNetworkManager("proj-a", credentials=credentials)
+
+        assert first._disks_client is second._disks_client
+        assert first._instances_client is second._instances_client
+        assert network._addresses_client is (
+            GCPClientRegistry.for_credentials(credentials).get_compute_client("AddressesClient")
+        )
+
+    def test_registry_released_with_last_manager(self) -> None:
+        credentials = AnonymousCredentials()
+        manager = GCPNetworkManager("proj-a", credentials=credentials)
+        assert credentials in GCPClientRegistry._registries
+
+        del manager
+        gc.collect()
+        assert credentials not in GCPClientRegistry._registries
+
+    def test_distinct_credentials_get_distinct_clients(self) -> None:
+        a = GCPClientRegistry.for_credentials(AnonymousCredentials())
+        b = GCPClientRegistry.for_credentials(AnonymousCredentials())
+        assert a.get_compute_client("DisksClient") is not b.get_compute_client("DisksClient")
+
+
+# ── Compute Manager Tests ───────────────────────────────────────────────
+
+
+class TestGCPComputeManagerScan:
+    """Tests for GCPComputeManager.scan across zones."""
+
+    def test_collects_disks_and_vms_from_all_zones(
+        self, compute_manager: GCPComputeManager
+    ) -> None:
+        result = compute_manager.scan()
+        found = sorted((r.resource_type, r.name, r.region) for r in result.resources)
+        assert found == [
+            ("disk", "disk-free", "us-central1-a"),
+            ("disk", "disk-free-eu", "europe-west1-b"),
+            ("vm", "vm-eu", "europe-west1-b"),
+        ]
+        assert result.errors == []
+
+    def test_listing_error_is_reported(self, compute_manager: GCPComputeManager) -> None:
+        compute_manager._instances_client.aggregated_list.side_effect = Exception("quota")
+        result = compute_manager.scan()
+        assert sorted(r.name for r in result.resources) == ["disk-free", "disk-free-eu"]
+        assert result.errors == ["Error scanning GCP VMs: quota"]
+
+    def test_no_per_zone_calls(self, compute_manager: GCPComputeManager) -> None:
+        compute_manager.scan()
+        compute_manager._disks_client.list.assert_not_called()
+        compute_manager._instances_client.list.assert_not_called()
+
+    def test_regional_source_disk_counts_as_existing(
+        self, compute_manager: GCPComputeManager
+    ) -> None:
+        compute_manager._snapshots_client.list.return_value = [SimpleNamespace(
+            name="snap-regional",
+            source_disk="projects/proj/regions/us-central1/disks/disk-regional",
+            disk_size_gb=10,
+            labels={},
+        )]
+        result = compute_manager.scan()
+        assert not any(r.resource_type == "snapshot" for r in result.resources)
+
+    def test_disk_fields(self, compute_manager: GCPComputeManager) -> None:
+        disk = next(r for r in compute_manager.scan().resources if r.name == "disk-free")
+        assert disk.resource_id == "projects/proj/zones/us-central1-a/disks/disk-free"
+        assert disk.metadata == {"disk_type": "pd-ssd"}
+        assert disk.tags == {"team": "data"}
+        assert disk.estimated_monthly_cost == 8.5
+
+    def test_orphaned_snapshots_use_one_disk_listing(
+        self, compute_manager: GCPComputeManager
+    ) -> None:
+        compute_manager._snapshots_client.list.return_value = [
+            SimpleNamespace(name="snap-live", source_disk=_disk_link("us-central1-a", "disk-live"),
+                            disk_size_gb=100, labels={}),
+            SimpleNamespace(name="snap-gone", source_disk=_disk_link("us-central1-a", "disk-gone"),
+                            disk_size_gb=100, labels={}),
+            SimpleNamespace(name="snap-image", source_disk="", disk_size_gb=10, labels={}),
+        ]
+
+        result = compute_manager.scan()
+
+        snapshots = [r for r in result.resources if r.resource_type == "snapshot"]
+        assert [s.name for s in snapshots] == ["snap-gone"]
+        assert snapshots[0].estimated_monthly_cost == 2.6
+        compute_manager._disks_client.get.assert_not_called()
+        compute_manager._disks_client.aggregated_list.assert_called_once_with(project="proj")
+
+
+class TestGCPComputeManagerDelete:
+    """Tests for GCPComputeManager delete fan-out."""
+
+    def test_starts_all_deletes_then_waits(self, compute_manager: GCPComputeManager) -> None:
+        events: List[str] = []
+
+        def _op(name: str) -> MagicMock:
+            op = MagicMock()
+            op.result.side_effect = lambda timeout: events.append(f"wait:{name}")
+            return op
+
+        def _begin(name: str) -> MagicMock:
+            events.append(f"begin:{name}")
+            return _op(name)
+
+        compute_manager._snapshots_client.delete.side_effect = lambda project, snapshot: _begin(snapshot)
+        compute_manager._disks_client.delete.side_effect = lambda project, zone, disk: _begin(disk)
+
+        results = compute_manager.delete_many([
+            "projects/proj/global/snapshots/snap-1",
+            "projects/proj/zones/us-central1-a/disks/disk-1",
+            "projects/proj/global/images/img-1",
+        ], dry_run=False)
+
+        assert events[:2] == ["begin:snap-1", "begin:disk-1"]
+        assert [(r.resource_name, r.success) for r in results] == [
+            ("snap-1", True), ("disk-1", True), ("img-1", False),
+        ]
+        assert results[2].error_message == "Unknown resource type"
+
+    def test_single_delete_uses_same_path(self, compute_manager: GCPComputeManager) -> None:
+        compute_manager._disks_client.delete.return_value.result.side_effect = Exception("in use")
+        result = compute_manager.delete("projects/proj/zones/us-central1-a/disks/disk-1", dry_run=False)
+        assert result.success is False
+        assert result.error_message == "in use"
+        compute_manager._disks_client.delete.assert_called_once_with(
+            project="proj", zone="us-central1-a", disk="disk-1"
+        )
+
+
+    def test_disk_id_without_zone_fails_cleanly(self, compute_manager: GCPComputeManager) -> None:
+        result = compute_manager.delete("projects/proj/disks/disk-1", dry_run=False)
+        assert result.success is False
+        assert result.error_message == "No zone in resource ID: projects/proj/disks/disk-1"
+        compute_manager._disks_client.delete.assert_not_called()
+
+
+# ── Network Manager Tests ───────────────────────────────────────────────
+
+
+class TestGCPNetworkManagerScan:
+    """Tests for GCPNetworkManager.scan static IP detection."""
+
+    def _address(self, name: str, status: str) -> SimpleNamespace:
+        return SimpleNamespace(name=name, status=status, labels={}, address="10.0.0.1")
+
+    def test_regional_ips_from_aggregated_list(self) -> None:
+        manager = GCPNetworkManager("proj", credentials=AnonymousCredentials())
+        manager._addresses_client = MagicMock()
+        manager._addresses_client.aggregated_list.return_value = [
+            ("regions/us-central1", SimpleNamespace(addresses=[
+                self._address("ip-free", "RESERVED"), self._address("ip-used", "IN_USE"),
+            ])),
+            ("regions/europe-west1", SimpleNamespace(addresses=[])),
+            ("global", SimpleNamespace(addresses=[self._address("ip-global", "RESERVED")])),
+        ]
+        manager._global_addresses_client = MagicMock()
+        manager._global_addresses_client.list.return_value = [
+            self._address("ip-global", "RESERVED"),
+        ]
+
+        result = manager.scan()
+
+        assert sorted(r.resource_id for r in result.resources) == [
+            "projects/proj/global/addresses/ip-global",
+            "projects/proj/regions/us-central1/addresses/ip-free",
+        ]
+        manager._addresses_client.list.assert_not_called()
+
+    def test_region_filter(self) -> None:
+        manager = GCPNetworkManager("proj", credentials=AnonymousCredentials(),
+                                    regions=["europe-west1"])
+        manager._addresses_client = MagicMock()
+        manager._addresses_client.aggregated_list.return_value = [
+            ("regions/us-central1", SimpleNamespace(addresses=[self._address("ip-us", "RESERVED")])),
+            ("regions/europe-west1", SimpleNamespace(addresses=[self._address("ip-eu", "RESERVED")])),
+        ]
+        manager._global_addresses_client = MagicMock()
+        manager._global_addresses_client.list.return_value = []
+        assert [r.name for r in manager.scan().resources] == ["ip-eu"]
+
+
+    def test_regional_failure_keeps_global_ips(self) -> None:
+        manager = GCPNetworkManager("proj", credentials=AnonymousCredentials())
+        manager._addresses_client = MagicMock()
+        manager._addresses_client.aggregated_list.side_effect = Exception("quota")
+        manager._global_addresses_client = MagicMock()
+        manager._global_addresses_client.list.return_value = [
+            self._address("ip-global", "RESERVED"),
+        ]
+
+        result = manager.scan()
+
+        assert [r.name for r in result.resources] == ["ip-global"]
+        assert result.errors == ["Error scanning regional IPs: quota"]
+
+
+class TestGCPNetworkManagerDelete:
+    """Tests for GCPNetworkManager.delete address ID handling."""
+
+    @pytest.fixture
+    def network_manager(self) -> GCPNetworkManager:
+        manager = GCPNetworkManager("proj", credentials=AnonymousCredentials())
+        manager._addresses_client = MagicMock()
+        manager._global_addresses_client = MagicMock()
+        return manager
+
+    def test_regional_address_uses_its_region(self, network_manager: GCPNetworkManager) -> None:
+        result = network_manager.delete("projects/proj/regions/us-east1/addresses/ip-1",
+                                        dry_run=False)
+        assert result.success is True
+        network_manager._addresses_client.delete.assert_called_once_with(
+            project="proj", region="us-east1", address="ip-1"
+        )
+
+    def test_address_id_without_region_fails_cleanly(
+        self, network_manager: GCPNetworkManager
+    ) -> None:
+        result = network_manager.delete("projects/proj/addresses/ip-1", dry_run=False)
+        assert result.success is False
+        assert result.resource_name == "ip-1"
+        assert result.error_message == "No region in resource ID: projects/proj/addresses/ip-1"
+        network_manager._addresses_client.delete.assert_not_called()
+
+
+# ── Storage Manager Tests ───────────────────────────────────────────────
+
+
+class TestGCPStorageManagerScan:
+    """Tests for GCPStorageManager.scan empty-bucket probes."""
+
+    def _bucket(self, name: str, blobs: List[str], labels: Dict[str, str]) -> MagicMock:
+        bucket = MagicMock()
+        bucket.name = name
+        bucket.labels = labels
+        bucket.location = "US"
+        bucket.time_created = None
+        bucket.list_blobs.return_value = iter(blobs)
+        return bucket
+
+    @pytest.fixture
+    def storage_manager(self) -> GCPStorageManager:
+        manager = GCPStorageManager("proj", credentials=AnonymousCredentials(), worker_count=4)
+        broken = self._bucket("broken", [], {})
+        broken.list_blobs.side_effect = Exception("denied")
+        manager._client = MagicMock()
+        manager._client.list_buckets.return_value = [
+            self._bucket("empty", [], {"env": "dev"}),
+            self._bucket("full", ["obj"], {"env": "dev"}),
+            self._bucket("empty-prod", [], {"env": "prod"}),
+            broken,
+        ]
+        return manager
+
+    def test_reports_empty_buckets_and_errors(self, storage_manager: GCPStorageManager) -> None:
+        result = storage_manager.scan()
+        assert [r.name for r in result.resources] == ["empty", "empty-prod"]
+        assert result.errors == ["Error checking bucket broken: denied"]
+
+    def test_lists_buckets_with_field_mask(self, storage_manager: GCPStorageManager) -> None:
+        storage_manager.scan()
+        fields = storage_manager._client.list_buckets.call_args.kwargs["fields"]
+        assert fields.startswith("items(name,")
+        assert fields.endswith(",nextPageToken")
+
+    def test_label_filter_skips_probe(self, storage_manager: GCPStorageManager) -> None:
+        storage_manager.resource_labels = {"env": "dev"}
+        result = storage_manager.scan()
+        assert [r.name for r in result.resources] == ["empty"]
+        prod = storage_manager._client.list_buckets.return_value[2]
+        prod.list_blobs.assert_not_called()
+
+
+# ── Label Helper Tests ──────────────────────────────────────────────────
+
+
+class TestLabelsOf:
+    """Tests for labels_of."""
+
+    def test_missing_or_empty_labels(self) -> None:
+        assert labels_of(SimpleNamespace()) == {}
+        assert labels_of(SimpleNamespace(labels=None)) == {}
+
+    def test_plain_dict_is_not_copied(self) -> None:
+        labels = {"env": "dev"}
+        assert labels_of(SimpleNamespace(labels=labels)) is labels
+
+    def test_mapping_is_copied_to_dict(self) -> None:
+        result = labels_of(SimpleNamespace(labels=MappingProxyType({"env": "dev"})))
+        assert type(result) is dict
+        assert result == {"env": "dev"}
+
+
+# ── Prefetch Tests ──────────────────────────────────────────────────────
+
+
+class TestPrefetch:
+    """Tests for the background page prefetcher."""
+
+    def test_yields_items_in_order(self) -> None:
+        assert list(prefetch(iter(range(1000)), buffer_size=7)) == list(range(1000))
+
+    def test_pager_error_reaches_consumer(self) -> None:
+        def _pager() -> Iterator[int]:
+            yield 1
+            raise RuntimeError("page 2 failed")
+
+        items = prefetch(_pager())
+        assert next(items) == 1
+        with pytest.raises(RuntimeError, match="page 2 failed"):
+            next(items)
+
+    def test_early_close_releases_producer(self) -> None:
+        consumed: List[int] = []
+
+        def _pager() -> Iterator[int]:
+            for i in range(100):
+                consumed.append(i)
+                yield i
+
+        items = prefetch(_pager(), buffer_size=1)
+        assert next(items) == 0
+        items.close()
+        time.sleep(0.3)
+        assert len(consumed) < 100
@@ -4,74 +4,94 @@ Unit tests for the Graph Analyzer.
 
 from __future__ import annotations
 
+import copy
+import sys
+from typing import Callable, Iterable, Tuple
+
 import pytest
+from finops_ai.core.base_manager import CloudProvider
 from finops_ai.core.graph_analyzer import ResourceGraph, ResourceNode
 
+# Shared graph fixtures are built once per worker, so keep the module together
+pytestmark = pytest.mark.xdist_group(name="graph")
 
-class TestResourceGraph:
-    """Test the ResourceGraph dependency analyzer."""
+_AZURE = sys.intern("azure")
 
-    def _make_node(self, resource_id: str, resource_type: str = "disk", name: str = "test") -> ResourceNode:
-        return ResourceNode(
-            resource_id=resource_id,
-            name=name,
-            resource_type=resource_type,
-            provider="azure",
-            metadata={},
-        )
+GraphBuilder = Callable[[Iterable[Tuple[str, str]], Iterable[Tuple[str, str]]], ResourceGraph]
 
-    def test_add_resource(self):
+
+@pytest.fixture
+def make_graph() -> GraphBuilder:
+    """Builder for fresh graphs from (id, type) nodes and (dependent, dependency) edges."""
+    def _build(nodes: Iterable[Tuple[str, str]],
+               edges: Iterable[Tuple[str, str]]) -> ResourceGraph:
         graph = ResourceGraph()
-        graph.add_resource(self._make_node("disk-1"))
+        for resource_id, resource_type in nodes:
+            graph.add_resource(ResourceNode(
+                resource_id=resource_id,
+                name=resource_id,
+                resource_type=resource_type,
+                provider=_AZURE,
+                metadata={},
+            ))
+        for dependent_id, dependency_id in edges:
+            graph.add_dependency(dependent_id, dependency_id)
+        return graph
+
+    return _build
+
+
+class TestResourceGraph:
+    """Test the ResourceGraph dependency analyzer."""
+
+    def test_add_resource(self, make_graph: GraphBuilder) -> None:
+        graph = make_graph([("disk-1", "disk")], [])
         assert graph.node_count == 1
 
-    def test_add_dependency(self):
-        graph = ResourceGraph()
-        graph.add_resource(self._make_node("disk-1"))
-        graph.add_resource(self._make_node("vm-1", "vm"))
-        graph.add_dependency("vm-1", "disk-1")
+    def test_add_dependency(self, make_graph: GraphBuilder) -> None:
+        graph = make_graph([("disk-1", "disk"), ("vm-1", "vm")], [("vm-1", "disk-1")])
         assert graph.edge_count == 1
 
-    def test_safe_to_delete_no_dependents(self):
-        graph = ResourceGraph()
-        graph.add_resource(self._make_node("snap-1", "snapshot"))
-        assert graph.is_safe_to_delete("snap-1") is True
+    def test_corpus_shape(self, corpus_graph: ResourceGraph) -> None:
+        assert corpus_graph.node_count == 5
+        assert corpus_graph.edge_count == 3
 
-    def test_unsafe_to_delete_with_dependents(self):
-        graph = ResourceGraph()
-        graph.add_resource(self._make_node("disk-1"))
-        graph.add_resource(self._make_node("vm-1", "vm"))
-        graph.add_dependency("vm-1", "disk-1")  # vm depends on disk
-        assert graph.is_safe_to_delete("disk-1") is False
+    def test_safe_to_delete_no_dependents(self, corpus_graph: ResourceGraph) -> None:
+        assert corpus_graph.is_safe_to_delete("snap-1") is True
 
-    def test_safe_to_delete_unknown_resource(self):
-        graph = ResourceGraph()
-        assert graph.is_safe_to_delete("nonexistent") is True
+    def test_unsafe_to_delete_with_dependents(self, corpus_graph: ResourceGraph) -> None:
+        # vms depend on the disk
+        assert corpus_graph.is_safe_to_delete("disk-1") is False
 
-    def test_get_dependents(self):
-        graph = ResourceGraph()
-        graph.add_resource(self._make_node("disk-1"))
-        graph.add_resource(self._make_node("vm-1", "vm"))
-        graph.add_resource(self._make_node("vm-2", "vm"))
-        graph.add_dependency("vm-1", "disk-1")
-        graph.add_dependency("vm-2", "disk-1")
-        dependents = graph.get_dependents("disk-1")
+    def test_safe_to_delete_unknown_resource(self, corpus_graph: ResourceGraph) -> None:
+        assert corpus_graph.is_safe_to_delete("nonexistent") is True
+
+    def test_get_dependents(self, corpus_graph: ResourceGraph) -> None:
+        dependents = corpus_graph.get_dependents("disk-1")
         assert len(dependents) == 2
 
-    def test_get_deletion_impact(self):
-        graph = ResourceGraph()
-        graph.add_resource(self._make_node("nic-1", "nic"))
-        graph.add_resource(self._make_node("vm-1", "vm"))
-        graph.add_resource(self._make_node("disk-1"))
-        graph.add_dependency("vm-1", "nic-1")
-        graph.add_dependency("vm-1", "disk-1")
-        impact = graph.get_deletion_impact("nic-1")
+    def test_get_deletion_impact(self, corpus_graph: ResourceGraph) -> None:
+        impact = corpus_graph.get_deletion_impact("nic-1")
         assert "safe" in impact
         assert impact["safe"] is False
         assert "vm-1" in impact["direct_dependents"]
 
-    def test_clear(self):
-        graph = ResourceGraph()
-        graph.add_resource(self._make_node("disk-1"))
+    def test_node_strings_are_interned(self) -> None:
+        # Built at runtime so they start out as distinct objects
+        provider = "".join(["az", "ure"])
+        resource_type = "".join(["dis", "k"])
+        node = ResourceNode(resource_id="d", name="d", resource_type=resource_type,
+                            provider=provider, metadata={})
+        assert node.provider is _AZURE
+        assert node.resource_type is sys.intern("disk")
+
+    def test_enum_provider_is_kept(self) -> None:
+        node = ResourceNode(resource_id="d", name="d", resource_type="disk",
+                            provider=CloudProvider.AZURE, metadata={})
+        assert node.provider is CloudProvider.AZURE
+
+    def test_clear(self, corpus_graph: ResourceGraph) -> None:
+        graph = copy.deepcopy(corpus_graph)
         graph.clear()
         assert graph.node_count == 0
+        assert corpus_graph.node_count == 5
@@ -0,0 +1,124 @@
+"""
+Tests for the JSON audit log handler.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Iterator, List
+
+import pytest
+
+from finops_ai.utils import logger as logger_module
+from finops_ai.utils.logger import JSONFileHandler
+
+
+# ── Fixtures ────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def audit_logger(tmp_path: Path) -> Iterator[logging.Logger]:
+    """A logger writing to a JSONFileHandler under tmp_path."""
+    logger = logging.getLogger("finops-ai.test-audit")
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    handler = JSONFileHandler(str(tmp_path / "logs" / "audit.jsonl"))
+    logger.addHandler(handler)
+    yield logger
+    logger.removeHandler(handler)
+    handler.close()
+
+
+def _read(path: Path) -> List[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+# ── JSONFileHandler Tests ───────────────────────────────────────────────
+
+
+class TestJSONFileHandler:
+    """Tests for JSONFileHandler."""
+
+    def test_writes_one_json_line_per_record(self, tmp_path: Path,
+                                              audit_logger: logging.Logger) -> None:
+        audit_logger.info("deleted %s", "disk-1",
+                          extra={"resource_id": "/disks/disk-1", "action": "delete"})
+        audit_logger.warning("second")
+        audit_logger.handlers[0].flush()
+
+        entries = _read(tmp_path / "logs" / "audit.jsonl")
+        assert [e["message"] for e in entries] == ["deleted disk-1", "second"]
+        assert entries[0]["resource_id"] == "/disks/disk-1"
+        assert entries[0]["action"] == "delete"
+        assert "provider" not in entries[0]
+        assert "resource_id" not in entries[1]
+        assert entries[1]["level"] == "WARNING"
+
+    def test_timestamp_is_record_time_in_utc(self, audit_logger: logging.Logger) -> None:
+        handler = audit_logger.handlers[0]
+        assert handler._timestamp(0.25) == "1970-01-01T00:00:00.250000"
+        assert handler._timestamp(86400.5) == "1970-01-02T00:00:00.500000"
+        # Like datetime.isoformat(), whole seconds carry no fraction
+        assert handler._timestamp(60.0) == "1970-01-01T00:01:00"
+
+    def test_close_flushes_buffer(self, tmp_path: Path, audit_logger: logging.Logger) -> None:
+        audit_logger.info("buffered")
+        audit_logger.handlers[0].close()
+        assert _read(tmp_path / "logs" / "audit.jsonl")[0]["message"] == "buffered"
+
+    def test_stdlib_fallback_writes_same_lines(self, tmp_path: Path,
+                                               monkeypatch: pytest.MonkeyPatch) -> None:
+        entry = {"message": "naïve", "line": 3}
+        fast = logger_module._json_line(entry)
+        monkeypatch.setattr(logger_module, "orjson", None)
+        slow = logger_module._json_line(entry)
+        assert fast.endswith(b"\n") and slow.endswith(b"\n")
+        assert json.loads(fast) == json.loads(slow) == entry
+
+    def test_records_from_many_threads_stay_intact(self, tmp_path: Path,
+                                                   audit_logger: logging.Logger) -> None:
+        def _log(n: int) -> None:
+            for i in range(50):
+                audit_logger.info(f"t{n}-{i}", extra={"provider": f"p{n}"})
+
+        threads = [threading.Thread(target=_log, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        audit_logger.handlers[0].flush()
+
+        entries = _read(tmp_path / "logs" / "audit.jsonl")
+        assert len(entries) == 200
+        assert all(e["message"].startswith(e["provider"].replace("p", "t") + "-") for e in entries)
+
+
+# ── setup_logging Tests ─────────────────────────────────────────────────
+
+
+class TestSetupLogging:
+    """Tests for setup_logging."""
+
+    def test_tracebacks_with_locals_are_opt_in(self) -> None:
+        root = logger_module.setup_logging()
+        assert root.handlers[0].tracebacks_show_locals is False
+        assert root.handlers[0].rich_tracebacks is False
+
+        root = logger_module.setup_logging(level="DEBUG", verbose_tracebacks=True)
+        assert root.handlers[0].tracebacks_show_locals is True
+        assert root.handlers[0].rich_tracebacks is True
+        root.handlers.clear()
+
+    def test_reconfiguring_flushes_previous_json_log(self, tmp_path: Path) -> None:
+        log_file = tmp_path / "audit.jsonl"
+        root = logger_module.setup_logging(log_file=str(log_file), json_log=True)
+        root.info("before reconfigure")
+        old_handler = root.handlers[-1]
+
+        root = logger_module.setup_logging()
+        assert old_handler not in root.handlers
+        assert _read(log_file)[0]["message"] == "before reconfigure"
+        root.handlers.clear()
@@ -4,14 +4,62 @@ Unit tests for the Policy Engine.
 
 from __future__ import annotations
 
-import os
-import tempfile
+import io
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Callable, Dict, List
 
 import pytest
 
-from finops_ai.core.base_manager import CloudProvider, OrphanedResource, ResourceStatus, Severity
+from finops_ai.core.base_manager import CloudProvider, OrphanedResource
 from finops_ai.core.policy_engine import PolicyEngine, ConditionEvaluator, Policy
 
+# Module-scoped fixtures are built once per worker, so keep the module together
+pytestmark = pytest.mark.xdist_group(name="policy")
+
+
+# ── Fixtures ──────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture(scope="module")
+def snapshot(base_resource: OrphanedResource) -> OrphanedResource:
+    """A 45-day-old, $50/mo, 100 GB snapshot tagged env=dev."""
+    return replace(base_resource, age_days=45, estimated_monthly_cost=50.0,
+                   size_gb=100.0, tags={"env": "dev"})
+
+
+@pytest.fixture(scope="module")
+def old_snapshot_policy() -> Policy:
+    """Deletes snapshots older than 30 days; tests override fields with replace."""
+    return Policy(
+        name="old-snapshots",
+        description="Delete old snapshots",
+        resource_type="snapshot",
+        condition="age_days > 30",
+        action="delete",
+    )
+
+
+@pytest.fixture(scope="module")
+def scenario_engine(old_snapshot_policy: Policy) -> PolicyEngine:
+    """
+    An engine holding every scenario policy, built and warmed once per module.
+
+    Conditions are compiled up front so tests only pay for evaluation.
+    Tests must not add policies to this engine.
+    """
+    engine = PolicyEngine()
+    engine.policies.extend([
+        replace(old_snapshot_policy, name="old30"),
+        replace(old_snapshot_policy, name="old90", condition="age_days > 90"),
+        replace(old_snapshot_policy, name="disks", resource_type="disk"),
+        replace(old_snapshot_policy, name="aws-any", resource_type="aws_*"),
+        replace(old_snapshot_policy, name="wildcard", resource_type="*", action="alert"),
+    ])
+    for policy in engine.policies:
+        ConditionEvaluator.compile(policy.condition)
+    return engine
+
 
 # ── ConditionEvaluator Tests ──────────────────────────────────────────────────
 
@@ -19,61 +67,38 @@ from finops_ai.core.policy_engine import PolicyEngine, ConditionEvaluator, Polic
 class TestConditionEvaluator:
     """Test the ConditionEvaluator."""
 
-    def _make_resource(self, **kwargs):
-        defaults = dict(
-            provider=CloudProvider.AZURE,
-            resource_type="snapshot",
-            resource_id="id1",
-            name="test-snap",
-            region="eastus",
-            subscription_or_account="sub1",
-            subscription_name="Test",
-            age_days=45,
-            estimated_monthly_cost=50.0,
-            size_gb=100.0,
-            tags={"env": "dev"},
-        )
-        defaults.update(kwargs)
-        return OrphanedResource(**defaults)
-
-    def test_equality(self):
-        r = self._make_resource()
-        assert ConditionEvaluator.evaluate("resource_type == snapshot", r) is True
-
-    def test_inequality(self):
-        r = self._make_resource()
-        assert ConditionEvaluator.evaluate("resource_type != disk", r) is True
-
-    def test_greater_than(self):
-        r = self._make_resource(age_days=45)
-        assert ConditionEvaluator.evaluate("age_days > 30", r) is True
-        assert ConditionEvaluator.evaluate("age_days > 60", r) is False
-
-    def test_less_than(self):
-        r = self._make_resource(estimated_monthly_cost=5.0)
-        assert ConditionEvaluator.evaluate("estimated_monthly_cost < 10", r) is True
-
-    def test_greater_equal(self):
-        r = self._make_resource(size_gb=100.0)
-        assert ConditionEvaluator.evaluate("size_gb >= 100", r) is True
-
-    def test_boolean_true(self):
-        r = self._make_resource()
+    @pytest.mark.parametrize("condition,overrides,expected", [
+        ("resource_type == snapshot", {}, True),
+        ("resource_type != disk", {}, True),
+        ("age_days > 30", {"age_days": 45}, True),
+        ("age_days > 60", {"age_days": 45}, False),
+        ("estimated_monthly_cost < 10", {"estimated_monthly_cost": 5.0}, True),
+        ("size_gb >= 100", {"size_gb": 100.0}, True),
+        ("size_gb <= 99", {"size_gb": 100.0}, False),
         # orphaned status check
-        assert ConditionEvaluator.evaluate("status == orphaned", r) is True
-
-    def test_and_condition(self):
-        r = self._make_resource(age_days=45, estimated_monthly_cost=50.0)
-        assert ConditionEvaluator.evaluate("age_days > 30 AND estimated_monthly_cost > 10", r) is True
-        assert ConditionEvaluator.evaluate("age_days > 60 AND estimated_monthly_cost > 10", r) is False
-
-    def test_dotted_path_tags(self):
-        r = self._make_resource(tags={"env": "dev"})
-        assert ConditionEvaluator.evaluate("tags.env == dev", r) is True
-
-    def test_dotted_path_missing(self):
-        r = self._make_resource(tags={})
-        assert ConditionEvaluator.evaluate("tags.env == dev", r) is False
+        ("status == orphaned", {}, True),
+        ("orphaned == true", {}, True),
+        ("age_days > 30 AND estimated_monthly_cost > 10",
+         {"age_days": 45, "estimated_monthly_cost": 50.0}, True),
+        ("age_days > 60 AND estimated_monthly_cost > 10",
+         {"age_days": 45, "estimated_monthly_cost": 50.0}, False),
+        ("tags.env == dev", {"tags": {"env": "dev"}}, True),
+        ("tags.env == dev", {"tags": {}}, False),
+        ("tags.owner == null", {"tags": {"env": "dev"}}, True),
+    ])
+    def test_operators(self, base_resource: OrphanedResource, condition: str,
+                       overrides: Dict[str, Any], expected: bool) -> None:
+        resource = replace(base_resource, **overrides) if overrides else base_resource
+        assert ConditionEvaluator.evaluate(condition, resource) is expected
+
+    def test_compile_is_cached_per_condition(self, snapshot: OrphanedResource) -> None:
+        predicate = ConditionEvaluator.compile("age_days > 30 AND size_gb >= 100")
+        assert ConditionEvaluator.compile("age_days > 30 AND size_gb >= 100") is predicate
+        assert predicate(snapshot) is True
+        assert predicate(replace(snapshot, size_gb=10.0)) is False
+
+    def test_clause_without_operator_never_matches(self, snapshot: OrphanedResource) -> None:
+        assert ConditionEvaluator.evaluate("age_days > 30 AND orphaned", snapshot) is False
 
 
 # ── PolicyEngine Tests ────────────────────────────────────────────────────────
@@ -82,113 +107,81 @@ class TestConditionEvaluator:
 class TestPolicyEngine:
     """Test the PolicyEngine."""
 
-    def _make_resource(self, **kwargs):
-        defaults = dict(
-            provider=CloudProvider.AZURE,
-            resource_type="snapshot",
-            resource_id="id1",
-            name="test-snap",
-            region="eastus",
-            subscription_or_account="sub1",
-            subscription_name="Test",
-            age_days=45,
-            estimated_monthly_cost=50.0,
-        )
-        defaults.update(kwargs)
-        return OrphanedResource(**defaults)
-
-    def test_load_policy(self):
-        policy = Policy(
-            name="test-policy",
-            description="Test",
-            resource_type="snapshot",
-            condition="age_days > 30",
-            action="delete",
-        )
-        engine = PolicyEngine()
-        engine.policies.append(policy)
+    @pytest.fixture
+    def engine(self) -> PolicyEngine:
+        return PolicyEngine()
+
+    def test_load_policy(self, engine: PolicyEngine, old_snapshot_policy: Policy) -> None:
+        engine.policies.append(old_snapshot_policy)
         assert len(engine.policies) == 1
 
-    def test_evaluate_match(self):
-        policy = Policy(
-            name="old-snapshots",
-            description="Delete old snapshots",
-            resource_type="snapshot",
-            condition="age_days > 30",
-            action="delete",
-        )
-        engine = PolicyEngine()
-        engine.policies.append(policy)
-        r = self._make_resource(age_days=45)
-        result = engine.evaluate([r])
-
-        assert result.total_policies == 1
-        assert len(result.matches) == 1
-        assert result.matches[0].action == "delete"
-
-    def test_evaluate_no_match(self):
-        policy = Policy(
-            name="old-snapshots",
-            description="Delete old snapshots",
-            resource_type="snapshot",
-            condition="age_days > 90",
-            action="delete",
-        )
-        engine = PolicyEngine()
-        engine.policies.append(policy)
-        r = self._make_resource(age_days=30)
-        result = engine.evaluate([r])
-
-        assert len(result.matches) == 0
-
-    def test_resource_type_mismatch(self):
-        policy = Policy(
-            name="disk-policy",
-            description="Delete disks",
-            resource_type="disk",
-            condition="age_days > 30",
-            action="delete",
-        )
-        engine = PolicyEngine()
-        engine.policies.append(policy)
-        r = self._make_resource(resource_type="snapshot")
-        result = engine.evaluate([r])
-
-        assert len(result.matches) == 0
-
-    def test_wildcard_resource_type(self):
-        policy = Policy(
-            name="all-resources",
-            description="Match all",
-            resource_type="*",
-            condition="age_days > 30",
-            action="alert",
-        )
-        engine = PolicyEngine()
-        engine.policies.append(policy)
-        r = self._make_resource(age_days=45)
-        result = engine.evaluate([r])
-
-        assert len(result.matches) == 1
-
-    def test_load_from_yaml_file(self):
+    def test_evaluate_batch(self, scenario_engine: PolicyEngine,
+                            snapshot: OrphanedResource) -> None:
+        resources = [
+            replace(snapshot, resource_id="snap-45"),
+            replace(snapshot, resource_id="snap-30", age_days=30),
+            replace(snapshot, resource_id="disk-45", resource_type="disk"),
+            replace(snapshot, resource_id="aws-snap-120", provider=CloudProvider.AWS,
+                    age_days=120),
+        ]
+        result = scenario_engine.evaluate(resources)
+
+        assert result.total_policies == 5
+        assert result.total_resources == 4
+        assert {(m.policy.name, m.resource.resource_id) for m in result.matches} == {
+            ("old30", "snap-45"), ("old30", "aws-snap-120"),
+            ("old90", "aws-snap-120"),
+            ("disks", "disk-45"),
+            ("aws-any", "aws-snap-120"),
+            ("wildcard", "snap-45"), ("wildcard", "disk-45"), ("wildcard", "aws-snap-120"),
+        }
+        assert result.actions_by_type == {"delete": 5, "alert": 3}
+
+    def test_empty_condition_never_matches(self, engine: PolicyEngine,
+                                           old_snapshot_policy: Policy,
+                                           snapshot: OrphanedResource) -> None:
+        engine.policies.append(replace(old_snapshot_policy, condition=""))
+        assert engine.evaluate([snapshot]).matches == []
+
+    def test_load_from_yaml_file(self, loaded_engine: PolicyEngine,
+                                 expected_policies: List[Dict[str, Any]]) -> None:
         """Test loading policies from a YAML file."""
-        yaml_content = """policies:
-  - name: test-policy
-    description: Delete old snapshots
-    resource_type: snapshot
+        assert len(loaded_engine.policies) == len(expected_policies)
+        for policy, expected in zip(loaded_engine.policies, expected_policies):
+            for key, value in expected.items():
+                assert getattr(policy, key) == value
+
+    def test_yaml_policy_file_reuses_identical_content(
+        self, yaml_policy_file: Callable[[str], Path], policy_yaml_path: str,
+        policy_yaml_text: str,
+    ) -> None:
+        assert yaml_policy_file(policy_yaml_text) == Path(policy_yaml_path)
+        assert yaml_policy_file(policy_yaml_text + "\n") != Path(policy_yaml_path)
+
+    def test_load_skips_disabled_policies(self, engine: PolicyEngine,
+                                          yaml_policy_file: Callable[[str], Path]) -> None:
+        path = yaml_policy_file("""policies:
+  - name: active
     condition: "age_days > 30"
-    action: delete
-    severity: high
-"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            f.flush()
-
-            try:
-                engine = PolicyEngine()
-                count = engine.load(f.name)
-                assert count >= 1
-                assert engine.policies[0].name == "test-policy"
-            finally:
-                os.unlink(f.name)
+  - name: paused
+    condition: "age_days > 30"
+    enabled: false
+""")
+        assert engine.load(str(path)) == 1
+        assert [p.name for p in engine.policies] == ["active"]
+        assert engine.policies[0].action == "alert"
+
+    def test_load_from_stream(self, engine: PolicyEngine, loaded_engine: PolicyEngine,
+                              policy_yaml_text: str) -> None:
+        assert engine.load(io.StringIO(policy_yaml_text)) == 1
+        assert engine.policies == loaded_engine.policies
+
+    def test_load_invalid_stream_loads_nothing(self, engine: PolicyEngine) -> None:
+        assert engine.load(io.StringIO("policies: [unclosed")) == 0
+        assert engine.policies == []
+
+    def test_loaded_policy_matches(self, loaded_engine: PolicyEngine,
+                                   snapshot: OrphanedResource) -> None:
+        result = loaded_engine.evaluate([snapshot, replace(snapshot, age_days=10)])
+
+        assert [m.resource.age_days for m in result.matches] == [45]
@@ -0,0 +1,269 @@
+"""
+Tests for the report generators.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+from pathlib import Path
+from typing import List
+from unittest.mock import MagicMock
+
+import pytest
+
+from finops_ai.core.base_manager import (
+    CloudProvider,
+    OrphanedResource,
+    ResourceStatus,
+    ScanResult,
+)
+from finops_ai.reporters import json_reporter
+from finops_ai.reporters.csv_reporter import CSVReporter
+from finops_ai.reporters.formatting import EnumTextCache, compact_utc_timestamp, enum_text
+from finops_ai.reporters.html_reporter import HTMLReporter
+from finops_ai.reporters.json_reporter import JSONReporter
+from finops_ai.reporters.slack_reporter import SlackReporter
+
+
+# ── Fixtures ────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def scan_results() -> List[ScanResult]:
+    """Two scan results with one resource each."""
+    snapshot = OrphanedResource(
+        provider=CloudProvider.AZURE,
+        resource_type="snapshot",
+        resource_id="/subscriptions/sub-a/resourceGroups/rg1/providers/Microsoft.Compute/snapshots/s1",
+        name="s1",
+        region="eastus",
+        subscription_or_account="sub-a",
+        subscription_name="Sub A",
+        resource_group="rg1",
+        size_gb=100,
+        estimated_monthly_cost=5.0,
+        tags={"env": "dev", "team": "data"},
+    )
+    ip = OrphanedResource(
+        provider=CloudProvider.GCP,
+        resource_type="static_ip",
+        resource_id="projects/proj/regions/us-central1/addresses/ip-1",
+        name="ip-1",
+        region="us-central1",
+        subscription_or_account="proj",
+        subscription_name="GCP Project proj",
+        status=ResourceStatus.UNATTACHED,
+        estimated_monthly_cost=7.3,
+    )
+    return [
+        ScanResult(provider=CloudProvider.AZURE, resource_type="snapshot", resources=[snapshot]),
+        ScanResult(provider=CloudProvider.GCP, resource_type="network", resources=[ip]),
+    ]
+
+
+# ── Formatting Tests ────────────────────────────────────────────────────
+
+
+class TestEnumText:
+    """Tests for the shared enum-to-text helpers."""
+
+    def test_enum_and_plain_values(self) -> None:
+        assert enum_text(CloudProvider.GCP) == "gcp"
+        assert enum_text("custom") == "custom"
+        assert enum_text(None) == "None"
+
+    def test_cache_computes_each_member_once(self) -> None:
+        cache = EnumTextCache()
+        assert cache[ResourceStatus.ORPHANED] == "orphaned"
+        assert cache[ResourceStatus.ORPHANED] == "orphaned"
+        assert len(cache) == 1
+
+    def test_compact_timestamp_shape(self) -> None:
+        stamp = compact_utc_timestamp()
+        assert len(stamp) == 15 and stamp[8] == "_"
+        assert (stamp[:8] + stamp[9:]).isdigit()
+
+
+# ── CSV Reporter Tests ──────────────────────────────────────────────────
+
+
+class TestCSVReporter:
+    """Tests for CSVReporter.generate."""
+
+    def test_writes_header_and_rows(self, tmp_path: Path, scan_results: List[ScanResult]) -> None:
+        path = CSVReporter(output_dir=str(tmp_path)).generate(scan_results, filename="r.csv")
+
+        with open(path, newline="") as f:
+            rows = list(csv.reader(f))
+
+        assert rows[0] == CSVReporter.HEADERS
+        assert len(rows) == 3
+        assert rows[1][:4] == ["azure", "snapshot", scan_results[0].resources[0].resource_id, "s1"]
+        assert rows[1][7] == "orphaned"
+        assert rows[1][-2:] == ["low", "env=dev; team=data"]
+        assert rows[2][0] == "gcp"
+        assert rows[2][-1] == ""
+
+    def test_empty_results_write_header_only(self, tmp_path: Path) -> None:
+        path = CSVReporter(output_dir=str(tmp_path)).generate([], filename="empty.csv")
+        with open(path, newline="") as f:
+            assert list(csv.reader(f)) == [CSVReporter.HEADERS]
+
+    def test_writes_utf8(self, tmp_path: Path, scan_results: List[ScanResult]) -> None:
+        scan_results[0].resources[0].tags = {"owner": "José"}
+        path = CSVReporter(output_dir=str(tmp_path)).generate(scan_results, filename="u.csv")
+        assert "owner=José".encode("utf-8") in Path(path).read_bytes()
+
+    def test_plain_string_fields_are_written_as_is(self, tmp_path: Path,
+                                                   scan_results: List[ScanResult]) -> None:
+        scan_results[1].resources[0].status = "custom"
+        path = CSVReporter(output_dir=str(tmp_path)).generate(scan_results, filename="s.csv")
+        with open(path, newline="") as f:
+            rows = list(csv.reader(f))
+        assert rows[1][7] == "orphaned"
+        assert rows[2][7] == "custom"
+
+
+# ── HTML Reporter Tests ─────────────────────────────────────────────────
+
+
+class TestHTMLReporter:
+    """Tests for HTMLReporter.generate."""
+
+    def test_rows_sorted_by_cost_with_provider_cards(self, tmp_path: Path,
+                                                     scan_results: List[ScanResult]) -> None:
+        path = HTMLReporter(output_dir=str(tmp_path)).generate(scan_results, filename="r.html")
+        html = Path(path).read_text(encoding="utf-8")
+
+        assert html.count("<tr>") == 3  # header + two resources
+        assert html.index(">ip-1<") < html.index(">s1<")
+        assert '<span class="provider-badge gcp">GCP</span>' in html
+        assert '<div class="stat-label">AZURE</div>' in html
+        assert "$12.30" in html
+
+    def test_empty_results(self, tmp_path: Path) -> None:
+        path = HTMLReporter(output_dir=str(tmp_path)).generate([], filename="e.html")
+        html = Path(path).read_text(encoding="utf-8")
+        assert "<tbody>" in html
+        assert html.count("<tr>") == 1
+
+    def test_resource_text_is_escaped(self, tmp_path: Path,
+                                      scan_results: List[ScanResult]) -> None:
+        resource = scan_results[0].resources[0]
+        resource.name = "<script>alert(1)</script>"
+        resource.resource_id = 'id"with&quote'
+        path = HTMLReporter(output_dir=str(tmp_path)).generate(
+            scan_results, filename="x.html", title="A & B")
+        html = Path(path).read_text(encoding="utf-8")
+
+        assert "<script>" not in html
+        assert "&lt;script&gt;alert(1)&lt;/script&gt;" in html
+        assert 'title="id&quot;with&amp;quote"' in html
+        assert "<title>A &amp; B</title>" in html
+
+
+# ── JSON Reporter Tests ─────────────────────────────────────────────────
+
+
+class TestJSONReporter:
+    """Tests for JSONReporter.generate."""
+
+    def test_summary_and_resources(self, tmp_path: Path, scan_results: List[ScanResult]) -> None:
+        path = JSONReporter(output_dir=str(tmp_path)).generate(scan_results, filename="r.json")
+        report = json.loads(Path(path).read_bytes())
+
+        assert report["summary"] == {
+            "total_resources": 2,
+            "total_monthly_cost": 12.3,
+            "total_annual_cost": 147.6,
+            "by_provider": {"azure": 5.0, "gcp": 7.3},
+        }
+        assert [r["name"] for r in report["resources"]] == ["s1", "ip-1"]
+        assert report["resources"][0]["status"] == "orphaned"
+        assert report["resources"][1]["tags"] == {}
+        assert list(report["resources"][0]) == [
+            "provider", "resource_type", "resource_id", "name", "region", "account",
+            "account_name", "resource_group", "status", "size_gb", "estimated_monthly_cost",
+            "age_days", "created_time", "last_used_time", "tags", "severity",
+        ]
+
+    def test_stdlib_fallback_matches(self, tmp_path: Path, scan_results: List[ScanResult],
+                                     monkeypatch: pytest.MonkeyPatch) -> None:
+        reporter = JSONReporter(output_dir=str(tmp_path))
+        default = json.loads(Path(reporter.generate(scan_results, filename="a.json")).read_bytes())
+
+        monkeypatch.setattr(json_reporter, "orjson", None)
+        fallback = json.loads(Path(reporter.generate(scan_results, filename="b.json")).read_bytes())
+
+        del default["metadata"]["generated_at"], fallback["metadata"]["generated_at"]
+        assert default == fallback
+
+    @pytest.mark.parametrize("count", [0, 2])
+    def test_streamed_output_matches_whole_document(self, tmp_path: Path,
+                                                     scan_results: List[ScanResult],
+                                                     monkeypatch: pytest.MonkeyPatch,
+                                                     count: int) -> None:
+        monkeypatch.setattr(json_reporter, "orjson", None)
+        path = JSONReporter(output_dir=str(tmp_path)).generate(scan_results[:count], filename="s.json")
+        written = Path(path).read_text(encoding="utf-8")
+        assert written == json.dumps(json.loads(written), indent=2)
+
+
+# ── Slack Reporter Tests ────────────────────────────────────────────────
+
+
+class TestSlackReporter:
+    """Tests for SlackReporter.send."""
+
+    @pytest.fixture
+    def reporter(self) -> SlackReporter:
+        reporter = SlackReporter("https://hooks.slack.test/abc")
+        reporter._session = MagicMock()
+        return reporter
+
+    def test_sends_summary_over_shared_session(self, reporter: SlackReporter,
+                                               scan_results: List[ScanResult]) -> None:
+        assert reporter.send(scan_results) is True
+        assert reporter.send(scan_results, channel="#finops") is True
+
+        assert reporter._session.post.call_count == 2
+        url = reporter._session.post.call_args.args[0]
+        payload = reporter._session.post.call_args.kwargs["json"]
+        assert url == "https://hooks.slack.test/abc"
+        assert payload["channel"] == "#finops"
+        top = payload["blocks"][-1]["text"]["text"]
+        assert top.index("`ip-1`") < top.index("`s1`")
+
+    def test_totals_and_top_five_in_one_pass(self, reporter: SlackReporter) -> None:
+        resources = [
+            OrphanedResource(
+                provider=CloudProvider.AWS if i % 2 else CloudProvider.GCP,
+                resource_type="disk",
+                resource_id=f"d{i}",
+                name=f"d{i}",
+                region="r",
+                subscription_or_account="acct",
+                subscription_name="Acct",
+                estimated_monthly_cost=cost,
+            )
+            for i, cost in enumerate([1.0, 9.0, 3.0, 9.0, 2.0, 7.0, 0.5, 3.0])
+        ]
+        results = [ScanResult(provider=CloudProvider.AWS, resource_type="disk",
+                              resources=resources)]
+        assert reporter.send(results) is True
+
+        blocks = reporter._session.post.call_args.kwargs["json"]["blocks"]
+        fields = [f["text"] for f in blocks[1]["fields"]]
+        assert fields[0] == "*Resources Found:*\n8"
+        assert fields[1] == "*Monthly Savings:*\n$34.50"
+        assert "*AWS*: 4 resources | $28.00/mo" in blocks[4]["text"]["text"]
+        top = blocks[-1]["text"]["text"]
+        assert [line.split("`")[1] for line in top.splitlines()[1:]] == [
+            "d1", "d3", "d5", "d2", "d7",
+        ]
+
+    def test_post_failure_returns_false(self, reporter: SlackReporter,
+                                        scan_results: List[ScanResult]) -> None:
+        reporter._session.post.side_effect = Exception("timeout")
+        assert reporter.send(scan_results) is False